@@ -1,7 +1,39 @@
+import importlib
+import sys
+import types
+
 from .base_var import set_config
-from .equity import equity
-from .bond import bond
-from .top import top
-from .indicator import indicator
 
-__all__ = ['set_config', 'equity', 'bond', 'indicator', 'top']
\ No newline at end of file
+#the client classes are imported on first access (PEP 562) so "import finflux" does not load pandas/yfinance/matplotlib
+lazy_attributes = {
+    'equity':          '.equity',
+    'bond':            '.bond',
+    'top':             '.top',
+    'indicator':       '.indicator',
+    'equity_async':    '.aio',
+    'bond_async':      '.aio',
+    'indicator_async': '.aio',
+    'top_async':       '.aio',
+    'render':          '.render',
+}
+
+def __getattr__(name):
+    if name in lazy_attributes:
+        value = getattr(importlib.import_module(lazy_attributes[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(list(globals()) + list(lazy_attributes))
+
+#importing a submodule (e.g. "import finflux.aio") binds it on the package under the same name as its class, so bind the class instead
+class LazyPackage(types.ModuleType):
+    def __setattr__(self, name, value):
+        if name in lazy_attributes and isinstance(value, types.ModuleType) and value.__name__ == f'{__name__}.{name}':
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+sys.modules[__name__].__class__ = LazyPackage
+
+__all__ = ['set_config', 'equity', 'bond', 'indicator', 'top', 'equity_async', 'bond_async', 'indicator_async', 'top_async', 'render']
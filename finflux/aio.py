@@ -0,0 +1,135 @@
+from finflux.base_var import Config
+from finflux.equity import equity, InvalidParameterError
+from finflux.bond import bond
+from finflux.indicator import indicator
+from finflux.top import top
+
+import asyncio
+import inspect
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+#------------------------------------------------------------------------------------------
+class Runner:
+    #the sync methods run on a shared worker pool; per-host concurrency is bounded inside Transport
+    executor = None
+    workers = None
+
+    @classmethod
+    def get_executor(cls):
+        if cls.executor is None or cls.workers != Config.async_workers:
+            if cls.executor is not None:
+                cls.executor.shutdown(wait=False)
+            cls.executor = ThreadPoolExecutor(max_workers=Config.async_workers, thread_name_prefix='finflux')
+            cls.workers = Config.async_workers
+        return cls.executor
+
+    @classmethod
+    async def run(cls, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(cls.get_executor(), functools.partial(func, *args, **kwargs))
+
+#------------------------------------------------------------------------------------------
+class async_iterator:
+    #steps a sync generator (e.g. iter_filings) on the worker pool, so the network calls made by each next() stay off the event loop
+    done = object()
+
+    def __init__(self, generator):
+        self.generator = generator
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        #StopIteration cannot cross a future, next() returns the sentinel instead
+        value = await Runner.run(next, self.generator, async_iterator.done)
+        if value is async_iterator.done:
+            raise StopAsyncIteration
+        return value
+
+    async def aclose(self):
+        await Runner.run(self.generator.close)
+
+class async_wrapper:
+    #every public method of the wrapped sync object becomes a coroutine returning the exact same output, except that
+    #a returned generator (iter_filings, stream=True json output) becomes an async_iterator over the same items.
+    #the call itself runs on the worker pool too, since methods such as iter_filings validate and resolve the CIK
+    #before handing back their generator. this is a thread pool around the sync client, HTTP still goes through requests
+    def __init__(self, sync):
+        self.sync = sync
+
+    def __getattr__(self, name):
+        attr = getattr(self.sync, name)
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def method(*args, **kwargs):
+            result = await Runner.run(attr, *args, **kwargs)
+            if inspect.isgenerator(result):
+                return async_iterator(result)
+            return result
+        return method
+
+#------------------------------------------------------------------------------------------
+class equity_async(async_wrapper):
+    def __init__(self, ticker, validate: str = 'lazy'):
+        #the security type check is a network call that a constructor cannot await, so a 'lazy' object validates on
+        #its first awaited method. use 'await equity_async.create(ticker)' to validate before the object is returned
+        valid_params = {'valid_validate': ['lazy', 'none']}
+
+        params = {'validate': validate}
+
+        for param_key, param_value, valid_param in zip(params.keys(), params.values(), valid_params.values()):
+            if param_value not in valid_param:
+                raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
+                                            f"Please choose a valid parameter: {', '.join(valid_param)}, "
+                                            f"or use 'await equity_async.create(ticker)' for eager validation")
+
+        super().__init__(equity(ticker, validate=validate))
+
+    @classmethod
+    async def create(cls, ticker, validate: str = 'eager'):
+        #builds and validates the wrapped equity on the worker pool, raising InvalidSecurityError here like equity(ticker) would
+        obj = cls.__new__(cls)
+        async_wrapper.__init__(obj, await Runner.run(equity, ticker, validate=validate))
+        return obj
+
+    @classmethod
+    async def universe(cls, tickers: list, validate: str = 'none', workers: int = 8):
+        equities = await Runner.run(equity.universe, tickers, validate=validate, workers=workers)
+
+        wrapped = []
+        for e in equities:
+            obj = cls.__new__(cls)
+            async_wrapper.__init__(obj, e)
+            wrapped.append(obj)
+        return wrapped
+
+    @classmethod
+    async def ciks(cls, tickers: list):
+        return await Runner.run(equity.ciks, tickers)
+
+    @classmethod
+    async def batch_timeseries(cls, tickers: list, **kwargs):
+        return await Runner.run(equity.batch_timeseries, tickers, **kwargs)
+
+    @classmethod
+    async def statements(cls, tickers: list, **kwargs):
+        return await Runner.run(equity.statements, tickers, **kwargs)
+
+    @classmethod
+    async def ratios(cls, tickers: list, **kwargs):
+        return await Runner.run(equity.ratios, tickers, **kwargs)
+
+class bond_async(async_wrapper):
+    def __init__(self):
+        super().__init__(bond())
+
+class indicator_async(async_wrapper):
+    def __init__(self):
+        super().__init__(indicator())
+
+class top_async(async_wrapper):
+    def __init__(self):
+        super().__init__(top())
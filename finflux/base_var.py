@@ -1,3 +1,38 @@
+import os
+import time
+import json
+import hashlib
+import threading
+import importlib
+from urllib.parse import urlparse
+from finflux.store import MemoryStore, SQLiteStore, FileStore
+import requests # type: ignore
+from requests.adapters import HTTPAdapter # type: ignore
+from requests.structures import CaseInsensitiveDict # type: ignore
+from urllib3.util.retry import Retry # type: ignore
+
+class LazyModule:
+    #stands in for a heavy dependency (yfinance, investpy, matplotlib) and imports it on first attribute access,
+    #so "import finflux" stays cheap and only the code paths that need a library pay for loading it
+    def __init__(self, name):
+        self.lazy_name = name
+        self.lazy_module = None
+
+    def __getattr__(self, attr):
+        if self.lazy_module is None:
+            self.lazy_module = importlib.import_module(self.lazy_name)
+        return getattr(self.lazy_module, attr)
+
+#seconds a cached response stays valid, per data source
+default_response_ttl = {
+    'sec_tickers': 86400, #SEC ticker to CIK map (company_tickers.json)
+    'sec':         3600,  #SEC submissions and filing indexes
+    'fred':        21600,
+    'bls':         21600,
+    'bea':         21600,
+    'td':          1,     #Twelve Data real-time prices and quotes
+}
+
 class Config:
     td_apikey     = None
     fred_apikey   = None
@@ -10,10 +45,210 @@ class Config:
     bea_baseurl   = 'https://apps.bea.gov/api/data'
     bls_baseurl   = 'https://api.bls.gov/publicAPI/v2/timeseries/data/'
 
-def set_config(td=None, fred=None, email=None, bea=None, bls=None):
+    #HTTP TRANSPORT
+    pool_size     = 10    #keep-alive connections kept open per host
+    timeout       = 30    #seconds before a connect/read is abandoned
+    retries       = 3     #retry attempts on connection errors and 429/5xx responses
+    backoff       = 0.5   #exponential backoff factor between retries (0.5s, 1s, 2s, ...)
+
+    #LOCAL CACHE
+    cache_dir     = None  #directory for the on-disk OHLCV history cache, None disables caching
+    memo_ttl      = 300   #seconds an equity object reuses its fetched yfinance payloads
+
+    #ASYNC
+    async_workers = 32    #worker threads shared by the *_async classes
+
+    #RESPONSE CACHE
+    response_cache      = None     #opt-in: 'memory' (per process), 'sqlite' or 'files' (shared by every process on the host), None (default) disables it
+    response_cache_path = None     #sqlite file or directory for the shared backends, defaults to a user-private directory under cache_dir or ~/.cache/finflux
+    response_cache_size = 256      #megabytes kept before the least recently used responses are evicted
+    response_ttl        = dict(default_response_ttl)
+
+def set_config(td=None, fred=None, email=None, bea=None, bls=None, pool_size=10, timeout=30, retries=3, backoff=0.5, cache_dir=None, memo_ttl=300, async_workers=32,
+               response_cache=None, response_cache_path=None, response_cache_size=256, response_ttl=None):
     Config.td_apikey     = td
     Config.fred_apikey   = fred
     Config.email_address = email
     Config.bea_apikey    = bea
     Config.bls_apikey    = bls
+    Config.pool_size     = pool_size
+    Config.timeout       = timeout
+    Config.retries       = retries
+    Config.backoff       = backoff
+    Config.cache_dir     = cache_dir
+    Config.memo_ttl      = memo_ttl
+    Config.async_workers = async_workers
+    Config.response_cache      = response_cache
+    Config.response_cache_path = response_cache_path
+    Config.response_cache_size = response_cache_size
+    Config.response_ttl        = {**default_response_ttl, **(response_ttl or {})} #e.g. response_ttl={'fred': 3600}
+
+    Transport.reset()
+
+#------------------------------------------------------------------------------------------
+class Transport:
+    #one library-wide requests.Session so every call to the same host reuses a pooled
+    #keep-alive connection instead of paying a fresh TCP + TLS handshake
+    session = None
+
+    #at most Config.pool_size requests in flight per host, so concurrent callers (threads, *_async classes)
+    #never open more connections than the pool keeps alive
+    host_slots = {}
+    host_lock = threading.Lock()
+
+    #GET requests and the read-only BLS POSTs are answered from Config.response_cache while their source's ttl lasts
+    store = None
+    store_lock = threading.Lock()
+
+    #requests per second allowed per host (matched by suffix), the SEC asks automated clients to stay at or below 10
+    rate_limits = {'sec.gov': 10}
+    rate_next = {}
+    rate_lock = threading.Lock()
+
+    @classmethod
+    def get_session(cls):
+        if cls.session is None:
+            retry = Retry(total=Config.retries,
+                          backoff_factor=Config.backoff,
+                          status_forcelist=[429, 500, 502, 503, 504],
+                          allowed_methods=['GET', 'POST'], #BLS data requests are read-only POSTs
+                          raise_on_status=False)
+            adapter = HTTPAdapter(pool_connections=Config.pool_size, pool_maxsize=Config.pool_size, max_retries=retry)
+
+            session = requests.Session()
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            cls.session = session
+        return cls.session
+
+    @classmethod
+    def host_slot(cls, url):
+        host = urlparse(url).netloc
+        with cls.host_lock:
+            if host not in cls.host_slots:
+                cls.host_slots[host] = threading.BoundedSemaphore(Config.pool_size)
+            return cls.host_slots[host]
+
+    @classmethod
+    def reset(cls):
+        if cls.session is not None:
+            cls.session.close()
+        cls.session = None
+        cls.host_slots = {}
+        cls.store = None
+
+    @classmethod
+    def throttle(cls, url):
+        host = urlparse(url).netloc
+        for suffix, limit in cls.rate_limits.items():
+            if host.endswith(suffix):
+                #each caller reserves the next free slot and sleeps until it, so the limit holds across threads
+                with cls.rate_lock:
+                    now = time.monotonic()
+                    slot = max(now, cls.rate_next.get(suffix, now))
+                    cls.rate_next[suffix] = slot + 1/limit
+                time.sleep(slot - now)
+                return
+
+    @classmethod
+    def private_dir(cls):
+        #the shared backends default to a directory only the current user can read or write, never the system temp dir
+        directory = Config.cache_dir or os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'finflux')
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        return directory
+
+    @classmethod
+    def get_store(cls):
+        with cls.store_lock:
+            if cls.store is None and Config.response_cache is not None:
+                max_bytes = Config.response_cache_size * 1024 * 1024
+                if Config.response_cache == 'memory':
+                    cls.store = MemoryStore(max_bytes)
+                elif Config.response_cache == 'sqlite':
+                    cls.store = SQLiteStore(Config.response_cache_path or os.path.join(cls.private_dir(), 'responses.sqlite'), max_bytes)
+                elif Config.response_cache == 'files':
+                    cls.store = FileStore(Config.response_cache_path or os.path.join(cls.private_dir(), 'responses'), max_bytes)
+            return cls.store
+
+    @classmethod
+    def source(cls, url):
+        host, path = urlparse(url).netloc, urlparse(url).path
+        if host.endswith('sec.gov'):
+            return 'sec_tickers' if path.endswith('company_tickers.json') else 'sec'
+        elif url.startswith(Config.fred_baseurl):
+            return 'fred'
+        elif url.startswith(Config.bls_baseurl):
+            return 'bls'
+        elif url.startswith(Config.bea_baseurl):
+            return 'bea'
+        elif url.startswith(Config.td_baseurl):
+            return 'td'
+        return None
+
+    @classmethod
+    def cacheable(cls, source, response):
+        #the BLS and Twelve Data APIs report failures (rate limits, bad keys) inside a 200 response
+        if response.status_code != 200:
+            return False
+        if source == 'bls':
+            return b'REQUEST_SUCCEEDED' in response.content
+        if source == 'td':
+            return b'"status":"error"' not in response.content
+        return True
+
+    @classmethod
+    def freeze(cls, response):
+        #a one line json header followed by the raw body, only data is stored so a planted entry cannot run code.
+        #only what the callers read is kept, the url and prepared request (which carry api keys) are left out
+        header = {'status': response.status_code, 'headers': dict(response.headers), 'encoding': response.encoding}
+        return json.dumps(header).encode() + b'\n' + response.content
+
+    @classmethod
+    def thaw(cls, value, url):
+        #None for an entry that is not in the expected format, which the caller treats as a miss
+        header, _, content = value.partition(b'\n')
+        try:
+            header = json.loads(header)
+            response = requests.Response()
+            response.status_code = int(header['status'])
+            response.headers = CaseInsensitiveDict(header['headers'])
+            response.encoding = header['encoding']
+        except (ValueError, TypeError, KeyError):
+            return None
+        response._content = content
+        response.url = url
+        return response
+
+    @classmethod
+    def request(cls, method, url, **kwargs):
+        kwargs.setdefault('timeout', Config.timeout)
+
+        source = cls.source(url)
+        ttl = Config.response_ttl.get(source) if source is not None else None
+        store = cls.get_store() if ttl else None
+
+        if store is not None:
+            #credentials in the url or body never reach the backend in clear text, only the key's hash does
+            params = sorted((kwargs.get('params') or {}).items())
+            key = hashlib.sha256(repr((method, url, params, kwargs.get('data'), kwargs.get('json'))).encode()).hexdigest()
+
+            cached = store.get(key)
+            response = cls.thaw(cached, url) if cached is not None else None
+            if response is not None:
+                return response
+
+        cls.throttle(url)
+        with cls.host_slot(url):
+            response = getattr(cls.get_session(), method)(url, **kwargs)
+
+        if store is not None and cls.cacheable(source, response):
+            store.set(key, cls.freeze(response), ttl)
+        return response
+
+    @classmethod
+    def get(cls, url, **kwargs):
+        return cls.request('get', url, **kwargs)
 
+    @classmethod
+    def post(cls, url, **kwargs):
+        return cls.request('post', url, **kwargs)
@@ -1,14 +1,18 @@
-from finflux.base_var import Config
+from finflux.base_var import Config, Transport, LazyModule
+from finflux.serialize import records
+from finflux.clients import FRED
+from finflux.render import candlesticks, volume_bars, subplots, finish
+from finflux.technical import warmup_start, moving_averages
 
-import yfinance as yf # type: ignore
 import numpy as np # type: ignore
-import requests # type: ignore
 import pandas as pd # type: ignore
-import matplotlib.pyplot as plt # type: ignore
 from datetime import timedelta, datetime, date
 from dateutil.relativedelta import relativedelta
 from pandas.tseries.offsets import BDay
-import investpy as ip # type: ignore
+from concurrent.futures import ThreadPoolExecutor
+
+yf = LazyModule('yfinance')
+ip = LazyModule('investpy')
 
 #------------------------------------------------------------------------------------------
 class InvalidParameterError(Exception):
@@ -34,7 +38,7 @@ class ChartReadabilityError(Exception):
 #------------------------------------------------------------------------------------------
 class bond:
 #------------------------------------------------------------------------------------------
-    def sovereign_timeseries(self, display: str = 'table', period: str = '5y', start: str = None, end: str = None, interval: str = '1d', data: str = 'all', maturity: str = '10y', country: str = 'US', show: str = True, save: str = False): 
+    def sovereign_timeseries(self, display: str = 'table', period: str = '5y', start: str = None, end: str = None, interval: str = '1d', data: str = 'all', maturity: str = '10y', country: str = 'US', show: str = True, save: str = False, stream: bool = False): 
         valid_params = {'valid_display': ['table', 'json', 'line'],
                         'valid_period': ['6mo', '1y', '2y', '5y', '10y', 'ytd', 'max'],
                         'valid_interval': ['1d', '1wk', '1mo'],
@@ -206,35 +210,17 @@ class bond:
             output = yield_df
             return output
         elif display == 'json':
-            yield_df.index = yield_df.index.strftime('%Y-%m-%d')
-            
-            yield_json_list = []
             if data == 'all':
-                for index, row in yield_df.iterrows():
-                    a = {
-                        'Date': index,
-                        f'{country} {maturity.upper()} Open': float(row[f'{country} {maturity.upper()} Open']),
-                        f'{country} {maturity.upper()} High': float(row[f'{country} {maturity.upper()} High']),
-                        f'{country} {maturity.upper()} Low': float(row[f'{country} {maturity.upper()} Low']),
-                        f'{country} {maturity.upper()} Close': float(row[f'{country} {maturity.upper()} Close']),
-                    }
-                    yield_json_list.append(a)
-            elif data != 'all':
-                for index, row in yield_df.iterrows():
-                    a = {
-                        'Date': index,
-                        f'{country} {maturity.upper()} {data.title()}': row[f'{country} {maturity.upper()} {data.title()}']
-                    }
-                    yield_json_list.append(a)
-            
-            output = yield_json_list
+                output = records(yield_df, columns=[f'{country} {maturity.upper()} Open', f'{country} {maturity.upper()} High', f'{country} {maturity.upper()} Low', f'{country} {maturity.upper()} Close'], stream=stream)
+            else:
+                output = records(yield_df, stream=stream)
             return output
         elif display == 'line':
             if data == 'all':
                 raise ChartReadabilityError('For optimal plot readability, only one type of OHLC yield data can be selected at a time. Currently, multiple options are selected. Please choose a single data parameter.')
             
             elif data != 'all':
-                fig, ax = plt.subplots(figsize=(10, 4.5), dpi=300)
+                fig, ax = subplots(figsize=(10, 4.5), dpi=300)
 
                 ax.plot(yield_df.index, yield_df)
                 
@@ -266,17 +252,10 @@ class bond:
                     label.set_fontname('Arial')
 
                 ax.set_axisbelow(True) #making the grid and everything below the actual data line
-                #SAVE--------------------------------------------------------------------------
-                if save:
-                    plt.savefig(f'{country}{maturity.upper()}_Simple{interval_dict[interval]}{data.capitalize()}_{yield_df.index[0].strftime('%b%Y')}_{yield_df.index[-1].strftime('%b%Y')}.png', dpi=300, bbox_inches='tight')
-
-                #SHOW--------------------------------------------------------------------------
-                if show:
-                    plt.show()
-                elif show == False:
-                    plt.close(fig)
+                #SAVE/SHOW-----------------------------------------------------------------
+                finish(fig, f'{country}{maturity.upper()}_Simple{interval_dict[interval]}{data.capitalize()}_{yield_df.index[0].strftime('%b%Y')}_{yield_df.index[-1].strftime('%b%Y')}.png', show, save)
 #------------------------------------------------------------------------------------------
-    def bond_candle(self, period: str = '6mo', start: str = None, end: str = None, interval: str = '1d', sma: list = None, bollinger: list = None, o_label: bool = True, h_label: bool = True, l_label: bool = True, c_label: bool = True, legend: bool = False, title: bool = True, maturity: str = '10y', country: str = 'US', show: str = True, save: str = False):
+    def bond_candle(self, period: str = '6mo', start: str = None, end: str = None, interval: str = '1d', sma: list = None, bollinger: list = None, o_label: bool = True, h_label: bool = True, l_label: bool = True, c_label: bool = True, legend: bool = False, title: bool = True, maturity: str = '10y', country: str = 'US', show: str = True, save: str = False, candle_cap: bool = True):
         valid_params = {'valid_period' : ['6mo', '1y', '2y', '5y', '10y', 'ytd', 'max'],
                         'valid_interval' : ['1d', '1wk', '1mo'],
                         'valid_o_label' : [True, False],
@@ -287,6 +266,7 @@ class bond:
                         'valid_title': [True, False],
                         'valid_show' : [True, False],
                         'valid_save' : [True, False],
+                        'valid_candle_cap' : [True, False],
                         'valid_maturity': ['6mo', '1y', '2y', '3y', '5y', '7y', '10y', '20y', '30y'],
                         'valid_country' : ['AU', 'AT', 'BH', 'BD', 'BE', 'BR', 'BG', 'CA', 'CL', 'CN', 'CO', 'CI', 'HR', 'CY', 'CZ', 'DK', 'EG', 'FI', 'FR', 'DE', 'GR', 'HK', 'HU', 'IS', 'IN', 'ID', 'IE', 'IL', 'IT', 'JP', 'KZ', 'KE', 'LV', 'LT', 'MY', 'MT', 'MU', 'MX', 'MA', 'NA', 'NL', 'NZ', 'NG', 'NO', 'PK', 'PE', 'PH', 'PL', 'PT', 'QA', 'RO', 'RU', 'RS', 'SG', 'SK', 'SI', 'ZA', 'KR', 'ES', 'LK', 'SE', 'CH', 'TW', 'TH', 'TR', 'UG', 'UA', 'GB', 'US', 'VN', 'ZM']}
         
@@ -300,6 +280,7 @@ class bond:
                   'title': title,
                   'show': show,
                   'save': save,
+                  'candle_cap': candle_cap,
                   'maturity': maturity,
                   'country': country}
         
@@ -323,7 +304,7 @@ class bond:
         #----------------------------------------------------------------------------------
 
         #SETTING LIMITS ON NUMBER OF DATA DF ROWS POSSIBLE---------------------------------(this is to prevent overly cramped candlestick formatting)
-        if len(data) > 265:
+        if candle_cap and len(data) > 265:
             raise ChartReadabilityError(f"Number of OHLC candles are capped at 265 to ensure plot readability. The current selection contains {len(data)} data points. Please reduce the time period or choose a larger interval.")
             #1d interval and 1y period is ~262 datapoints
             #1wk interval and 5y period is ~250 datapoints
@@ -351,26 +332,23 @@ class bond:
 
         #SETTING UP DATA DATAFRAME WITH OPTIONAL SMA AND BOLLINGER BAND COLUMN(S)----------
         if sma is not None:
-            max_c_data = self.sovereign_timeseries(period='max', data='all', interval=interval, maturity=maturity, country=country)
+            close = data[f'{country} {maturity.upper()} Close']
+            #only the max(sma) - 1 bars before the plotted window are downloaded to warm up the rolling windows
+            if period != 'max' or start != None:
+                warmup_bars = max(sma) - 1
+                warmup_close = self.sovereign_timeseries(start=warmup_start(data.index[0], warmup_bars, interval).strftime('%Y-%m-%d'),
+                                                         end=(data.index[0] - timedelta(days=1)).strftime('%Y-%m-%d'),
+                                                         interval=interval,
+                                                         data='close',
+                                                         maturity=maturity,
+                                                         country=country)
+                warmup_close = warmup_close[warmup_close.index < data.index[0]].tail(warmup_bars)
+                close = pd.concat([warmup_close, close])
             #creating sma columns in data dataframe based on bollinger condition
-            if bollinger == None:
-                for i in sma:
-                    max_c_data[f'SMA {i}'] = max_c_data[f'{country} {maturity.upper()} Close'].rolling(window=i).mean()
-                    data[f'SMA {i}'] = max_c_data[f'SMA {i}'].tail(len(data))
-            elif isinstance(bollinger, list):
-                for i, b in zip(sma, bollinger):
-                    if b != None:
-                        max_c_data[f'SMA {i}'] = max_c_data[f'{country} {maturity.upper()} Close'].rolling(window=i).mean()
-                        data[f'SMA {i}'] = max_c_data[f'SMA {i}'].tail(len(data))
-                        max_c_data[f'SD {i}'] = max_c_data[f'{country} {maturity.upper()} Close'].rolling(window=i).std()
-                        data[f'bollinger_upper {i}'] = data[f'SMA {i}'] + (b * max_c_data[f'SD {i}'].tail(len(data)))
-                        data[f'bollinger_lower {i}'] = data[f'SMA {i}'] - (b * max_c_data[f'SD {i}'].tail(len(data)))
-                    elif b == None:
-                        max_c_data[f'SMA {i}'] = max_c_data[f'{country} {maturity.upper()} Close'].rolling(window=i).mean()
-                        data[f'SMA {i}'] = max_c_data[f'SMA {i}'].tail(len(data))
+            moving_averages(data, close, sma, bollinger)
 
         #CREATING THE MAIN FIG AX PAIR ----------------------------------------------------
-        fig, ax_p = plt.subplots(figsize=(10, 4.5), dpi=300)
+        fig, ax_p = subplots(figsize=(10, 4.5), dpi=300)
 
         #PLOTTING THE MAIN OHLC CANDLESTICKS-----------------------------------------------
         if len(data) > 200:
@@ -384,17 +362,7 @@ class bond:
         else:
             candle_width = 0.7
         
-        for index, row in data.iterrows():
-            color = 'green' if row[f'{country} {maturity.upper()} Close'] >= row[f'{country} {maturity.upper()} Open'] else 'red'
-            #wick
-            ax_p.vlines(row['DateNum'], row[f'{country} {maturity.upper()} Low'], row[f'{country} {maturity.upper()} High'], color=color, linewidth=0.25)
-            #box
-            ax_p.add_patch(plt.Rectangle(
-                (row['DateNum'] - (candle_width/2), min(row[f'{country} {maturity.upper()} Open'], row[f'{country} {maturity.upper()} Close'])), # bottom left corner of the rectangle
-                candle_width, # horizontal width of the rectangle
-                abs(row[f'{country} {maturity.upper()} Close'] - row[f'{country} {maturity.upper()} Open']), #vertical height of the rectangle
-                color=color #fill color of the rectangle
-            ))
+        candlesticks(ax_p, data['DateNum'], data[f'{country} {maturity.upper()} Open'], data[f'{country} {maturity.upper()} High'], data[f'{country} {maturity.upper()} Low'], data[f'{country} {maturity.upper()} Close'], candle_width)
 
         #PLOTTING OPTIONAL SMA AND BOLLINGER BAND LINES------------------------------------
         if isinstance(sma, list):
@@ -601,17 +569,18 @@ class bond:
             last_date = data.index[-1].strftime('%b %Y')
             ax_p.set_title(f'{iso_country_dict[country]} {maturity.upper()} Bond Yield — {interval_map[interval]} OHLC ({first_date} - {last_date})', fontsize=6.5, loc='left', pad=4, fontname='Arial', weight='bold')
 
-        #SAVE------------------------------------------------------------------------------
-        if save:
-            plt.savefig(f'{country}{maturity.upper()}_{interval_map[interval]}CandleChart_{data.index[0].strftime('%b%Y')}_{data.index[-1].strftime('%b%Y')}.png', dpi=300, bbox_inches='tight')
-
-        #SHOW------------------------------------------------------------------------------
-        if show:
-            plt.show()
-        elif show == False:
-            plt.close(fig)
+        #SAVE/SHOW-------------------------------------------------------------------------
+        finish(fig, f'{country}{maturity.upper()}_{interval_map[interval]}CandleChart_{data.index[0].strftime('%b%Y')}_{data.index[-1].strftime('%b%Y')}.png', show, save)
+#------------------------------------------------------------------------------------------
+    def curve_leg(self, country, maturity):
+        #6 months ago, 3 months ago and last close yields of one maturity, NaN if the country does not issue it
+        try:
+            a = self.sovereign_timeseries(display='table', period='6mo', interval='1d', data='close', maturity=maturity, country=country)
+            return float(a.iloc[0]), float(a.iloc[int(len(a)/2)]), float(a.iloc[-1])
+        except InvalidCountryMaturity:
+            return np.nan, np.nan, np.nan
 #------------------------------------------------------------------------------------------
-    def curve(self, display: str = 'line', country: str = 'US', eod_line: bool = True, three_month_line: bool = True, six_month_line: bool = True, show: str = True, save: str = False):
+    def curve(self, display: str = 'line', country: str = 'US', eod_line: bool = True, three_month_line: bool = True, six_month_line: bool = True, show: str = True, save: str = False, workers: int = 9):
         valid_params = {'valid_display': ['json', 'table', 'line'],
                         'valid_country' : ['AU', 'AT', 'BH', 'BD', 'BE', 'BR', 'BG', 'CA', 'CL', 'CN', 'CO', 'CI', 'HR', 'CY', 'CZ', 'DK', 'EG', 'FI', 'FR', 'DE', 'GR', 'HK', 'HU', 'IS', 'IN', 'ID', 'IE', 'IL', 'IT', 'JP', 'KZ', 'KE', 'LV', 'LT', 'MY', 'MT', 'MU', 'MX', 'MA', 'NA', 'NL', 'NZ', 'NG', 'NO', 'PK', 'PE', 'PH', 'PL', 'PT', 'QA', 'RO', 'RU', 'RS', 'SG', 'SK', 'SI', 'ZA', 'KR', 'ES', 'LK', 'SE', 'CH', 'TW', 'TH', 'TR', 'UG', 'UA', 'GB', 'US', 'VN', 'ZM'],
                         'valid_eod_line': [True, False],
@@ -635,22 +604,14 @@ class bond:
         
         #RAW DATA/OBSERVATION--------------------------------------------------------------
         maturity_list= ["6mo", "1y", "2y", "3y", "5y", "7y", "10y", "20y", "30y"]
-        
-        six_m_yields = []
-        three_m_yields = []
-        eod_yields = []
 
-        for maturity in maturity_list:
-            try:
-                a = self.sovereign_timeseries(display='table', period='6mo', interval='1d', data='close', maturity=maturity, country=country)
-                six_m_yields.append(float(a.iloc[0]))
-                three_m_yields.append(float(a.iloc[int(len(a)/2)]))
-                eod_yields.append(float(a.iloc[-1]))
-            except InvalidCountryMaturity:
-                a = np.nan
-                six_m_yields.append(a)
-                three_m_yields.append(a)
-                eod_yields.append(a)
+        #every maturity leg is a separate investpy request, so the legs are fetched concurrently
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            legs = list(executor.map(lambda maturity: self.curve_leg(country, maturity), maturity_list))
+
+        six_m_yields = [leg[0] for leg in legs]
+        three_m_yields = [leg[1] for leg in legs]
+        eod_yields = [leg[2] for leg in legs]
         #----------------------------------------------------------------------------------
 
         #JSON FORMAT DATA
@@ -762,7 +723,7 @@ class bond:
             curve_df = pd.DataFrame.from_dict(curve_dict)
             curve_df.columns = curve_df.columns.str.upper()
 
-            fig, ax = plt.subplots(figsize=(10, 4.5), dpi=300)
+            fig, ax = subplots(figsize=(10, 4.5), dpi=300)
 
             mask = np.isfinite(curve_df['EOD'])
 
@@ -808,9 +769,50 @@ class bond:
                 label.set_fontname('Arial')
 
             ax.set_axisbelow(True) #making the grid and everything below the actual data line
-            #------------------------------------------------------------------------------
 
-            plt.show()
+            #SAVE/SHOW---------------------------------------------------------------------
+            finish(fig, f'{country}_YieldCurve.png', show, save)
+#------------------------------------------------------------------------------------------
+    def curves(self, countries: list, display: str = 'table', workers: int = 16):
+        valid_params = {'valid_display': ['json', 'table'],
+                        'valid_country' : ['AU', 'AT', 'BH', 'BD', 'BE', 'BR', 'BG', 'CA', 'CL', 'CN', 'CO', 'CI', 'HR', 'CY', 'CZ', 'DK', 'EG', 'FI', 'FR', 'DE', 'GR', 'HK', 'HU', 'IS', 'IN', 'ID', 'IE', 'IL', 'IT', 'JP', 'KZ', 'KE', 'LV', 'LT', 'MY', 'MT', 'MU', 'MX', 'MA', 'NA', 'NL', 'NZ', 'NG', 'NO', 'PK', 'PE', 'PH', 'PL', 'PT', 'QA', 'RO', 'RU', 'RS', 'SG', 'SK', 'SI', 'ZA', 'KR', 'ES', 'LK', 'SE', 'CH', 'TW', 'TH', 'TR', 'UG', 'UA', 'GB', 'US', 'VN', 'ZM']}
+
+        if display not in valid_params['valid_display']:
+            raise InvalidParameterError(f"Invalid display parameter '{display}'. "
+                                        f"Please choose a valid parameter: {', '.join(valid_params['valid_display'])}")
+        for country in countries:
+            if country not in valid_params['valid_country']:
+                raise InvalidParameterError(f"Invalid country parameter '{country}'. "
+                                            f"Please choose a valid parameter: {', '.join(valid_params['valid_country'])}")
+
+        #RAW DATA/OBSERVATION--------------------------------------------------------------
+        maturity_list= ["6mo", "1y", "2y", "3y", "5y", "7y", "10y", "20y", "30y"]
+
+        #all (country, maturity) legs share one pool instead of running one curve after another
+        pairs = [(country, maturity) for country in dict.fromkeys(countries) for maturity in maturity_list]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            legs = list(executor.map(lambda pair: self.curve_leg(*pair), pairs))
+        #----------------------------------------------------------------------------------
+
+        curves_df = pd.DataFrame(legs, index=pd.MultiIndex.from_tuples(pairs, names=['Country', 'Maturity']), columns=['6MO', '3MO', 'EOD'])
+
+        #PARAMETER - DISPLAY ===============================================================
+        if display == 'table':
+            output = curves_df
+            return output
+        elif display == 'json':
+            #same per-country shape as curve(display='json')
+            curves_dict = {}
+            for country in dict.fromkeys(countries):
+                country_df = curves_df.loc[country]
+                curves_dict[country] = {
+                    '6mo': country_df['6MO'].to_dict(),
+                    '3mo': country_df['3MO'].to_dict(),
+                    'eod': country_df['EOD'].to_dict(),
+                }
+            output = curves_dict
+            return output
 #------------------------------------------------------------------------------------------
     def eod(self, display: str = 'json', maturity: str = '10y', country: str = 'US'): 
         valid_params = {'valid_display': ['json', 'pretty'],
@@ -958,8 +960,9 @@ MATURITY - {eod_data['maturity']}
         
         #RAW DATA/OBSERVATIONS--------------------------------------------------------------
         yield_timeseries = self.sovereign_timeseries(display = 'table', period = '10y', interval = '1d', data = 'all', maturity=maturity, country=country)
-        
-        yield_eod = self.eod(display='json', maturity=maturity, country=country)['yield']
+
+        #the latest close is already the last row of the 10 year frame, no separate eod() request needed
+        yield_eod = float(yield_timeseries[f'{country} {maturity.upper()} Close'].iloc[-1])
 
         current_year = pd.Timestamp.now().year 
         #-----------------------------------------------------------------------------------
@@ -974,12 +977,9 @@ MATURITY - {eod_data['maturity']}
 
         initial_dates = [pd.Timestamp(d) for d in initial_dates]
 
-        f_dates = []
-
-        for d in initial_dates:
-            while d not in yield_timeseries.index.tolist():
-                d = d + relativedelta(days=1)
-            f_dates.append(d)
+        #first trading day on or after each date, resolved with a binary search on the sorted index
+        date_pos = yield_timeseries.index.searchsorted(initial_dates, side='left').clip(0, len(yield_timeseries.index) - 1)
+        f_dates = yield_timeseries.index[date_pos].tolist()
 
         final_dates = {
             '5y' : f_dates[0],
@@ -1064,21 +1064,8 @@ MOVING AVERAGES-------------------------
         if Config.fred_apikey is None:
             raise MissingConfigObject('Missing fred_apikey. Please set your FRED api key using the set_config() function.')
         
-        #RAW DATA/OBSERVATION--------------------------------------------------------------
-        id = FRED_IDs[maturity]
-
-        FRED_url = f'{Config.fred_baseurl}series/observations?series_id={id}&api_key={Config.fred_apikey}&file_type=json'
-        FRED_yield = requests.get(FRED_url).json()
-        yield_df = pd.DataFrame(FRED_yield['observations'])
-        yield_df = yield_df.drop(columns=['realtime_start', 'realtime_end'])
-        yield_df['date'] = pd.to_datetime(yield_df['date'])
-        yield_df['value'] = pd.to_numeric(yield_df['value'], errors='coerce')
-        yield_df = yield_df.set_index('date')
-        yield_df.index.name = 'Date'
-        yield_df = yield_df.rename(columns={'value': f'US HQM {maturity.upper()}'})
-
         current_year = pd.Timestamp.now().year
-        #----------------------------------------------------------------------------------
+
         #DATES
         initial_dates = [
             date.today().replace(day=1) - relativedelta(months=6),
@@ -1097,6 +1084,19 @@ MOVING AVERAGES-------------------------
             '5y' : initial_dates[3],
             '10y' : initial_dates[4],
         }
+
+        #RAW DATA/OBSERVATION--------------------------------------------------------------
+        id = FRED_IDs[maturity]
+
+        if period == 'max':
+            observation_start = None
+        elif period == 'ytd':
+            observation_start = f'{current_year}-01-01'
+        else:
+            observation_start = final_dates[period].strftime('%Y-%m-%d')
+
+        yield_df = FRED.parse(FRED.observations(id, observation_start=observation_start), f'US HQM {maturity.upper()}').to_frame()
+        #----------------------------------------------------------------------------------
         
         #PARAMETER - PERIOD ================================================================  
         if period == 'max':
@@ -1113,19 +1113,10 @@ MOVING AVERAGES-------------------------
             output = yield_df
             return output
         elif display == 'json':
-            yield_df.index = yield_df.index.strftime('%Y-%m-%d')
-
-            data_json_list = []
-            for index, row in yield_df.iterrows():
-                a = {
-                    'Date': index,
-                    f'{yield_df.columns[0]}': float(row[f'{yield_df.columns[0]}'])
-                }
-                data_json_list.append(a)
-            output = data_json_list
+            output = records(yield_df)
             return output
         else:
-            fig, ax = plt.subplots(figsize=(10, 4.5), dpi=300)
+            fig, ax = subplots(figsize=(10, 4.5), dpi=300)
 
             if display == 'bar': ax.bar(yield_df.index, yield_df[yield_df.columns[0]], width=10)
             elif display == 'line':
@@ -1162,13 +1153,6 @@ MOVING AVERAGES-------------------------
                 label.set_fontname('Arial')
 
             ax.set_axisbelow(True) #making the grid and everything below the actual data line
-            #SAVE--------------------------------------------------------------------------
-            if save:
-                plt.savefig(f'USHQM{maturity.upper()}_{yield_df.index[0].strftime('%b%Y')}_{yield_df.index[-1].strftime('%b%Y')}.png', dpi=300, bbox_inches='tight')
-
-            #SHOW--------------------------------------------------------------------------
-            if show:
-                plt.show()
-            elif show == False:
-                plt.close(fig)
+            #SAVE/SHOW---------------------------------------------------------------------
+            finish(fig, f'USHQM{maturity.upper()}_{yield_df.index[0].strftime('%b%Y')}_{yield_df.index[-1].strftime('%b%Y')}.png', show, save)
 #------------------------------------------------------------------------------------------
\ No newline at end of file
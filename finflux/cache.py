@@ -0,0 +1,118 @@
+from finflux.base_var import Config, LazyModule
+
+import os
+import threading
+import importlib.util
+import numpy as np # type: ignore
+import pandas as pd # type: ignore
+from datetime import date
+from dateutil.relativedelta import relativedelta
+
+yf = LazyModule('yfinance')
+
+#checked without importing pyarrow, which is only loaded by pandas once a parquet file is read or written
+history_format = 'parquet' if importlib.util.find_spec('pyarrow') is not None else 'pickle'
+
+#------------------------------------------------------------------------------------------
+class History:
+    #on-disk OHLCV store, one file per ticker+interval, holding the full unrounded history
+    #after the first full download only the bars after the last cached date are requested
+    fields = ['Close', 'High', 'Low', 'Open', 'Volume']
+
+    @classmethod
+    def path(cls, ticker, interval):
+        os.makedirs(Config.cache_dir, exist_ok=True)
+        name = ticker.replace('/', '_')
+        return os.path.join(Config.cache_dir, f'{name}_{interval}.{history_format}')
+
+    @classmethod
+    def read(cls, path):
+        if not os.path.exists(path):
+            return None
+        if history_format == 'parquet':
+            return pd.read_parquet(path)
+        return pd.read_pickle(path)
+
+    @classmethod
+    def write(cls, path, frame):
+        #write-then-rename so a concurrent reader never sees a partially written file, the temporary name
+        #carries the thread id as well so two threads saving the same ticker do not write into one file
+        tmp_path = f'{path}.tmp{os.getpid()}.{threading.get_ident()}'
+        if history_format == 'parquet':
+            frame.to_parquet(tmp_path)
+        else:
+            frame.to_pickle(tmp_path)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def fetch(cls, ticker, interval, start=None):
+        if start is None:
+            yf_download = yf.download(ticker, period='max', interval=interval, ignore_tz=True, progress=False, auto_adjust=True, multi_level_index=False)
+        else:
+            yf_download = yf.download(ticker, start=start, interval=interval, ignore_tz=True, progress=False, auto_adjust=True, multi_level_index=False)
+
+        yf_download = yf_download.reindex(columns=cls.fields).dropna(how='all')
+        yf_download.index.name = 'Date'
+        yf_download.columns.name = None
+        return yf_download
+
+    @classmethod
+    def refresh(cls, ticker, interval):
+        path = cls.path(ticker, interval)
+        cached = cls.read(path)
+
+        if cached is None or cached.shape[0] < 2:
+            history = cls.fetch(ticker, interval)
+        else:
+            #re-requesting from the second to last bar: the last bar may have been partial (intraday/current week) when cached,
+            #while the one before it is final and can be compared against the fresh download
+            anchor = cached.index[-2]
+            fresh = cls.fetch(ticker, interval, start=anchor.strftime('%Y-%m-%d'))
+
+            if fresh.empty:
+                history = cached
+            elif anchor in fresh.index and not np.isclose(fresh.loc[anchor, 'Close'], cached.loc[anchor, 'Close'], rtol=1e-4):
+                #auto-adjusted prices are rebased after every dividend/split, so the whole history is reloaded
+                history = cls.fetch(ticker, interval)
+            else:
+                history = pd.concat([cached[cached.index < fresh.index[0]], fresh])
+                history = history[~history.index.duplicated(keep='last')]
+
+        if not history.empty:
+            cls.write(path, history)
+        return history
+
+    @classmethod
+    def download(cls, ticker, period=None, start=None, end=None, interval='1d', rounding=False):
+        if Config.cache_dir is None:
+            return yf.download(ticker, period=period, start=start, end=end, interval=interval, ignore_tz=True, rounding=rounding, group_by='column', progress=False, auto_adjust=True)
+
+        history = cls.refresh(ticker, interval)
+
+        #SLICING LOCALLY--------------------------------------------------------------------
+        #Note: start and end parameters will override any period parameter presence, end is exclusive like yf.download
+        if start is not None or end is not None:
+            if start is not None:
+                history = history[history.index >= pd.Timestamp(start)]
+            if end is not None:
+                history = history[history.index < pd.Timestamp(end)]
+        elif period is not None and period != 'max':
+            if period == 'ytd':
+                period_start = date(date.today().year, 1, 1)
+            elif period.endswith('mo'):
+                period_start = date.today() - relativedelta(months=int(period[:-2]))
+            elif period.endswith('wk'):
+                period_start = date.today() - relativedelta(weeks=int(period[:-2]))
+            elif period.endswith('y'):
+                period_start = date.today() - relativedelta(years=int(period[:-1]))
+            elif period.endswith('d'):
+                period_start = date.today() - relativedelta(days=int(period[:-1]))
+            history = history[history.index >= pd.Timestamp(period_start)]
+
+        if rounding:
+            history = history.round(2)
+
+        #same (Price, Ticker) column layout as yf.download
+        history = history.copy()
+        history.columns = pd.MultiIndex.from_product([cls.fields, [ticker]], names=['Price', 'Ticker'])
+        return history
@@ -0,0 +1,221 @@
+from finflux.base_var import Config, Transport
+
+import json
+import time
+import threading
+import numpy as np # type: ignore
+import pandas as pd # type: ignore
+from datetime import date, datetime
+from dateutil.relativedelta import relativedelta
+from concurrent.futures import ThreadPoolExecutor
+
+#------------------------------------------------------------------------------------------
+class FRED:
+    #series/observations client, the date window (and optionally frequency aggregation) is applied server side
+    #so only the requested span is downloaded and parsed instead of the full series history
+
+    @classmethod
+    def window_start(cls, period: str, lookback: relativedelta = relativedelta()):
+        #first observation date needed for a period, lookback widens the window for callers that
+        #slice a fixed number of trailing points or compute shifted (yoy/pop) figures before slicing
+        if period == 'max':
+            return None
+        elif period == 'ytd':
+            start = date(date.today().year, 1, 1)
+        elif period.endswith('mo'):
+            start = date.today() - relativedelta(months=int(period[:-2]))
+        elif period.endswith('y'):
+            start = date.today() - relativedelta(years=int(period[:-1]))
+        return (start - lookback).strftime('%Y-%m-%d')
+
+    @classmethod
+    def observations(cls, series_id: str, observation_start: str = None, observation_end: str = None, frequency: str = None, aggregation_method: str = None):
+        params = {'series_id': series_id,
+                  'api_key': Config.fred_apikey,
+                  'file_type': 'json',
+                  'observation_start': observation_start,
+                  'observation_end': observation_end,
+                  'frequency': frequency,                   #'d', 'w', 'bw', 'm', 'q', 'sa', 'a', ...
+                  'aggregation_method': aggregation_method} #'avg', 'sum' or 'eop', only applies with a lower frequency
+
+        params = {key: value for key, value in params.items() if value is not None}
+        return Transport.get(f'{Config.fred_baseurl}series/observations', params=params).json()['observations']
+
+    @classmethod
+    def parse(cls, observations: list, name: str = None):
+        #whole-array conversion into a float64 Series on a DatetimeIndex, FRED's '.' placeholder for missing values becomes NaN
+        dates = [observation['date'] for observation in observations]
+        values = [observation['value'] for observation in observations]
+
+        #to_numeric parses the whole object array in one C loop and coerces '.' (or any other non-numeric value) to NaN,
+        #about 3x faster than numpy's per-string float conversion
+        index = pd.DatetimeIndex(np.array(dates, dtype='datetime64[ns]'), name='Date')
+        values = pd.to_numeric(np.array(values, dtype=object), errors='coerce').astype('float64', copy=False)
+        return pd.Series(values, index=index, name=name)
+
+#------------------------------------------------------------------------------------------
+class BLS:
+    #timeseries/data client, the v2 API takes at most 50 series ids and 20 years per request, so ids are packed
+    #into as few requests as possible and the 20 year windows of a long history are requested concurrently
+    series_limit = 50
+    year_limit = 20
+
+    @classmethod
+    def windows(cls, start_year: int, end_year: int):
+        windows = []
+        while end_year >= start_year:
+            windows.append((max(start_year, end_year - cls.year_limit + 1), end_year))
+            end_year -= cls.year_limit
+        return windows
+
+    @classmethod
+    def request(cls, series_ids: list, start_year: int, end_year: int):
+        headers = {'Content-type': 'application/json'}
+        data = json.dumps({'seriesid': series_ids, 'startyear': str(start_year), 'endyear': str(end_year), 'registrationkey': Config.bls_apikey})
+        return Transport.post(Config.bls_baseurl, data=data, headers=headers).json()['Results']['series']
+
+    @classmethod
+    def observations(cls, series_ids: list, start_year: int, end_year: int = None, workers: int = 8):
+        #{series id: [data points oldest first]}, the raw BLS data points of every window merged per series
+        if end_year is None:
+            end_year = datetime.now().year
+
+        series_ids = list(dict.fromkeys(series_ids))
+        chunks = [series_ids[i:i + cls.series_limit] for i in range(0, len(series_ids), cls.series_limit)]
+        tasks = [(chunk, *window) for chunk in chunks for window in cls.windows(start_year, end_year)]
+
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(tasks)))) as executor:
+            responses = list(executor.map(lambda task: cls.request(*task), tasks))
+
+        data = {series_id: [] for series_id in series_ids}
+        for response in responses:
+            for series in response:
+                data[series['seriesID']].extend(series['data'])
+
+        for series_id, data_list in data.items():
+            #each window arrives newest first, so the merged points are put back in calendar order
+            data[series_id] = sorted(data_list, key=lambda i: (i['year'], i['period']))
+        return data
+
+    @classmethod
+    def parse(cls, data_list: list, name: str = None):
+        #monthly data points (period 'M01'...'M12') into a float64 Series on a DatetimeIndex
+        data_list = [i for i in data_list if i['period'] != 'M13']
+        dates = [f"{i['year']}-{i['period'][1:]}-01" for i in data_list]
+        values = pd.to_numeric(pd.Series([i['value'] for i in data_list], dtype=object), errors='coerce').to_numpy(dtype='float64')
+        return pd.Series(values, index=pd.DatetimeIndex(np.array(dates, dtype='datetime64[ns]'), name='Date'), name=name)
+
+#------------------------------------------------------------------------------------------
+class BEA:
+    #NIPA tables are downloaded whole (Year=X), so each (table, frequency) is parsed once into a frame indexed by
+    #(SeriesCode, Date) and every series of that table is then a lookup, e.g. gdp 'n_pc' and 'r_pc' share T70100.
+    #parsed tables follow the response cache: kept for Config.response_ttl['bea'] and not kept when it is disabled
+    tables = {}
+    table_locks = {}
+    lock = threading.Lock()
+
+    @classmethod
+    def parse(cls, data_list: list):
+        frame = pd.DataFrame(data_list, columns=['SeriesCode', 'TimePeriod', 'DataValue'])
+        periods = frame['TimePeriod']
+
+        #'2024' annual, '2024Q3' quarterly (dated on the quarter's last month), '2024M07' monthly
+        months = pd.Series('01', index=frame.index)
+        quarterly = periods.str[4] == 'Q'
+        monthly = periods.str[4] == 'M'
+        months[quarterly] = periods[quarterly].str[5].astype(int).mul(3).astype(str).str.zfill(2)
+        months[monthly] = periods[monthly].str[5:7]
+
+        dates = pd.to_datetime(periods.str[0:4] + '-' + months + '-01', format='%Y-%m-%d')
+        values = pd.to_numeric(frame['DataValue'].str.replace(',', ''), errors='coerce').to_numpy(dtype='float64')
+
+        table = pd.Series(values, index=pd.MultiIndex.from_arrays([frame['SeriesCode'], dates], names=['SeriesCode', 'Date']))
+        table = table[~table.index.duplicated(keep='last')]
+        return table.sort_index()
+
+    @classmethod
+    def table(cls, table_name: str, frequency: str):
+        key = (table_name, frequency)
+        with cls.lock:
+            if key not in cls.table_locks:
+                cls.table_locks[key] = threading.Lock()
+            table_lock = cls.table_locks[key]
+
+        #one download per table even when several threads ask for it at the same time
+        with table_lock:
+            cached = cls.tables.get(key)
+            if cached is not None and Config.response_cache is not None and time.monotonic() - cached[0] < Config.response_ttl['bea']:
+                return cached[1]
+
+            url = f'{Config.bea_baseurl}/?&UserID={Config.bea_apikey}' + '&method=GetData' + '&datasetname=NIPA' + f'&TableName={table_name}' + f'&Frequency={frequency}' + '&Year=X'
+            data_list = Transport.get(url).json()['BEAAPI']['Results']['Data']
+
+            parsed = cls.parse(data_list)
+            cls.tables[key] = (time.monotonic(), parsed)
+            return parsed
+
+    @classmethod
+    def series(cls, table_name: str, frequency: str, series_code: str, name: str = None):
+        table = cls.table(table_name, frequency)
+        return table.xs(series_code, level='SeriesCode').rename(name)
+
+#------------------------------------------------------------------------------------------
+class SEC:
+    #company_tickers.json indexed once into ticker -> CIK and CIK -> tickers dicts, so resolving a CIK is a dict lookup.
+    #the index is rebuilt after Config.response_ttl['sec_tickers'], the raw file itself goes through the response cache
+    ticker_cik = None
+    cik_tickers = None
+    loaded = None
+    lock = threading.Lock()
+
+    @classmethod
+    def headers(cls):
+        return {'User-Agent': f'{Config.email_address}'}
+
+    @classmethod
+    def index(cls):
+        with cls.lock:
+            if cls.loaded is None or time.monotonic() - cls.loaded >= Config.response_ttl['sec_tickers']:
+                companies = Transport.get(f'{Config.sec_baseurl}files/company_tickers.json', headers=cls.headers()).json()
+
+                ticker_cik = {}
+                cik_tickers = {}
+                for company in companies.values():
+                    cik = str(company['cik_str']).zfill(10)
+                    ticker_cik.setdefault(company['ticker'], cik) #the first listing of a ticker wins
+                    cik_tickers.setdefault(cik, []).append(company['ticker'])
+
+                cls.ticker_cik, cls.cik_tickers, cls.loaded = ticker_cik, cik_tickers, time.monotonic()
+            return cls.ticker_cik, cls.cik_tickers
+
+    @classmethod
+    def cik(cls, ticker: str):
+        #10 digit zero-padded CIK, None when the SEC does not list the ticker
+        return cls.index()[0].get(ticker)
+
+    @classmethod
+    def ciks(cls, tickers: list):
+        ticker_cik = cls.index()[0]
+        return {ticker: ticker_cik.get(ticker) for ticker in tickers}
+
+    @classmethod
+    def tickers(cls, cik):
+        return list(cls.index()[1].get(str(cik).zfill(10), []))
+
+    @classmethod
+    def submissions(cls, cik: str, start: str = None, end: str = None, history: str = 'all'):
+        #yields column-oriented blocks of filings, newest first: the 'recent' block of the submissions file and then,
+        #only as the caller keeps iterating, each older page listed in filings.files.
+        #pages whose filing dates fall entirely outside [start, end) are skipped without a request
+        submissions = Transport.get(f'https://data.sec.gov/submissions/CIK{cik}.json', headers=cls.headers()).json()
+        yield submissions['filings']['recent']
+
+        if history == 'recent':
+            return
+
+        for page in submissions['filings'].get('files', []):
+            if start is not None and page['filingTo'] < start:
+                continue
+            if end is not None and page['filingFrom'] >= end:
+                continue
+            yield Transport.get(f'https://data.sec.gov/submissions/{page['name']}', headers=cls.headers()).json()
@@ -1,14 +1,22 @@
-from finflux.base_var import Config
+from finflux.base_var import Config, Transport, LazyModule
+from finflux.cache import History
+from finflux.serialize import records
+from finflux.clients import SEC
+from finflux.render import candlesticks, volume_bars, subplots, finish
+from finflux.technical import warmup_start, moving_averages
+from finflux.fundamentals import Panel, ratios
 
-import yfinance as yf # type: ignore
 import numpy as np # type: ignore
-import requests # type: ignore
 import pandas as pd # type: ignore
 from datetime import timedelta, datetime, date
+from concurrent.futures import ThreadPoolExecutor
+import time
+import threading
 from dateutil.relativedelta import relativedelta
-import matplotlib.pyplot as plt
 from pandas.tseries.offsets import BDay
-from matplotlib.ticker import FuncFormatter
+
+yf = LazyModule('yfinance')
+mticker = LazyModule('matplotlib.ticker')
 
 #------------------------------------------------------------------------------------------
 class InvalidParameterError(Exception):
@@ -31,16 +39,297 @@ class ChartReadabilityError(Exception):
 class equity:
     security_type = 'EQUITY'
 
-    def __init__(self,ticker):
+    def __init__(self, ticker, validate: str = 'eager'):
+        valid_params = {'valid_validate': ['eager', 'lazy', 'none']}
+
+        params = {'validate': validate}
+
+        for param_key, param_value, valid_param in zip(params.keys(), params.values(), valid_params.values()):
+            if param_value not in valid_param:
+                raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
+                                            f"Please choose a valid parameter: {', '.join(valid_param)}")
+
         self.ticker = ticker
         self.mticker = ticker.split('.')[0]
 
-        instrumentType = yf.Ticker(self.ticker).get_history_metadata()['instrumentType']
+        #one yf.Ticker handle and its payloads, shared by every method of this object
+        self.firm = None
+        self.memo_store = {}
+        self.memo_time = None
+        self.memo_lock = threading.RLock()
+
+        #PARAMETER - VALIDATE =============================================================
+        #'eager' checks the security type now, 'lazy' defers the check to the first data request,
+        #'none' trusts the caller (e.g. a symbol list that has already been validated)
+        self.validated = validate == 'none'
+
+        if validate == 'eager':
+            self.validate()
+#------------------------------------------------------------------------------------------
+    def validate(self):
+        if self.validated:
+            return
+
+        instrumentType = self.memo('metadata')['instrumentType']
         if instrumentType != equity.security_type:
             raise InvalidSecurityError(f"Invalid security type. "
                                     f"Please select a valid '{equity.security_type}' symbol")
+        self.validated = True
+#------------------------------------------------------------------------------------------
+    memo_sources = {
+        'info': lambda firm: firm.get_info(),
+        'metadata': lambda firm: firm.get_history_metadata(),
+        'fast_info': lambda firm: firm.get_fast_info(),
+        'calendar': lambda firm: firm.get_calendar(),
+        'income_stmt': lambda firm: firm.income_stmt,
+        'quarterly_income_stmt': lambda firm: firm.quarterly_income_stmt,
+        'balance_sheet': lambda firm: firm.balance_sheet,
+        'quarterly_balance_sheet': lambda firm: firm.quarterly_balance_sheet,
+        'cash_flow': lambda firm: firm.cash_flow,
+        'quarterly_cash_flow': lambda firm: firm.quarterly_cash_flow,
+        'earnings_estimate': lambda firm: firm.get_earnings_estimate(),
+        'revenue_estimate': lambda firm: firm.get_revenue_estimate(),
+        'growth_estimates': lambda firm: firm.get_growth_estimates(),
+        'analyst_price_targets': lambda firm: firm.get_analyst_price_targets(),
+        'dividends': lambda firm: firm.get_dividends(),
+        'splits': lambda firm: firm.get_splits(),
+        'earnings_dates': lambda firm: firm.get_earnings_dates(),
+    }
+
+    def memo(self, key):
+        #payloads are fetched at most once per Config.memo_ttl seconds; yfinance also caches inside the Ticker
+        #handle, so an expired memo drops the handle too and the next fetch starts from a fresh one.
+        #the lock keeps an invalidate() from another thread (e.g. an equity_async call) from clearing the
+        #store between the check and the read, and stops two threads from fetching the same payload
+        with self.memo_lock:
+            if self.memo_time is not None and time.monotonic() - self.memo_time > Config.memo_ttl:
+                self.invalidate()
+
+            if key in self.memo_store:
+                return self.memo_store[key]
+
+            if self.firm is None:
+                self.firm = yf.Ticker(self.ticker)
+                self.memo_time = time.monotonic()
+            value = equity.memo_sources[key](self.firm)
+            self.memo_store[key] = value
+            return value
+
+    def invalidate(self, key: str = None):
+        with self.memo_lock:
+            if key is None:
+                self.memo_store = {}
+            else:
+                self.memo_store.pop(key, None)
+            self.firm = None
+            self.memo_time = None
+#------------------------------------------------------------------------------------------
+    @classmethod
+    def universe(cls, tickers: list, validate: str = 'none', workers: int = 8):
+        valid_params = {'valid_validate': ['eager', 'lazy', 'none']}
+
+        params = {'validate': validate}
+
+        for param_key, param_value, valid_param in zip(params.keys(), params.values(), valid_params.values()):
+            if param_value not in valid_param:
+                raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
+                                            f"Please choose a valid parameter: {', '.join(valid_param)}")
+
+        #constructing every object without any network calls
+        equities = [cls(ticker, validate='lazy' if validate == 'eager' else validate) for ticker in tickers]
+
+        #PARAMETER - VALIDATE =============================================================
+        #eager validation is still one metadata request per symbol (yfinance has no batched security type lookup), they only
+        #run concurrently and every invalid symbol is reported at once. large universes are better served by 'lazy' or 'none'
+        if validate == 'eager':
+            def check(e):
+                try:
+                    e.validate()
+                    return None
+                except InvalidSecurityError:
+                    return e.ticker
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                invalid = [ticker for ticker in executor.map(check, equities) if ticker is not None]
+
+            if invalid:
+                raise InvalidSecurityError(f"Invalid security type for symbol(s): {', '.join(invalid)}. "
+                                           f"Please select valid '{equity.security_type}' symbols")
+
+        return equities
 #------------------------------------------------------------------------------------------
-    def timeseries(self, display: str = 'table', period: str = '5y', start: str = None, end: str = None, interval: str = '1d', data: str = 'all', calculation: str = 'price', round: bool = True, show: str = True, save: str = False):
+    @classmethod
+    def ciks(cls, tickers: list):
+        if Config.email_address is None:
+            raise MissingConfigObject('Missing email_address. Please set your email address using the set_config() function.')
+
+        #{ticker: 10 digit CIK or None}, resolved against one cached SEC ticker-cik index
+        return SEC.ciks(tickers)
+#------------------------------------------------------------------------------------------
+    @classmethod
+    def batch_timeseries(cls, tickers: list, display: str = 'table', period: str = '5y', start: str = None, end: str = None, interval: str = '1d', data: str = 'all', calculation: str = 'price', round: bool = True, layout: str = 'wide'):
+        valid_params = {'valid_display' : ['table', 'json'],
+                        'valid_period' : ['1mo', '6mo', '1y', '2y', '5y', '10y', 'ytd', 'max'],
+                        'valid_interval' : ['1d', '1wk', '1mo', '3mo'],
+                        'valid_data' : ['open', 'high', 'low', 'close', 'volume', 'all'],
+                        'valid_calculation' : ['price', 'simple return', 'log return'],
+                        'valid_round' : [True, False],
+                        'valid_layout' : ['wide', 'long']}
+        
+        params = {'display': display,
+                  'period': period,
+                  'interval': interval,
+                  'data': data,
+                  'calculation': calculation,
+                  'round': round,
+                  'layout': layout}
+        
+        for param_key, param_value, valid_param in zip(params.keys(), params.values(), valid_params.values()):
+            if param_value not in valid_param:
+                raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
+                                            f"Please choose a valid parameter: {', '.join(valid_param)}")
+
+        tickers = list(dict.fromkeys(tickers)) #dropping duplicate symbols while keeping order
+
+        #RAW DATA/OBSERVATIONS-------------------------------------------------------------
+        #one grouped download for every symbol instead of one request per ticker
+        #Note: start and end parameters will override any period parameter presence
+        if start == None and end == None:
+            yf_download = yf.download(tickers, period=period, interval=interval, ignore_tz=True, rounding=round, group_by='column', progress=False, auto_adjust=True, threads=True)
+        elif start != None and end != None:
+            yf_download = yf.download(tickers, start=start, end=end, interval=interval, ignore_tz=True, rounding=round, group_by='column', progress=False, auto_adjust=True, threads=True)
+        #----------------------------------------------------------------------------------
+
+        #STANDARDIZING TABLE---------------------------------------------------------------
+        fields = ['Close', 'High', 'Low', 'Open', 'Volume']
+        if data != 'all':
+            fields = [data.capitalize()]
+
+        yf_download = yf_download.reindex(columns=pd.MultiIndex.from_product([fields, tickers]))
+        yf_download = yf_download.dropna(how='all')
+        yf_download.index.name = 'Date'
+
+        #PARAMETER - CALCULATION ==========================================================
+        if calculation == 'price':
+            yf_download = yf_download
+        elif calculation == 'simple return':
+            yf_download = (yf_download / yf_download.shift(1))-1
+            yf_download = yf_download.drop(yf_download.index[0])
+            if round == True:
+                yf_download = yf_download.round(2)
+        elif calculation == 'log return':
+            yf_download = np.log(yf_download / yf_download.shift(1))
+            yf_download = yf_download.drop(yf_download.index[0])
+            if round == True:
+                yf_download = yf_download.round(2)
+
+        #PARAMETER - LAYOUT ===============================================================
+        if layout == 'wide':
+            #same '{ticker} {field}' column convention as timeseries(), grouped by ticker
+            yf_download = yf_download.swaplevel(axis=1)[tickers]
+            yf_download.columns = [f'{ticker} {field}' for ticker, field in yf_download.columns]
+            yf_download.columns.name = None
+        elif layout == 'long':
+            #one row per (Date, Ticker) with the OHLCV fields as columns
+            yf_download = yf_download.stack(level=1, future_stack=True).dropna(how='all')
+            yf_download.index.names = ['Date', 'Ticker']
+            yf_download.columns.name = None
+
+        #PARAMETER - DISPLAY ==============================================================
+        if display == 'table':
+            output = yf_download
+            return output
+        
+        elif display == 'json':
+            if layout == 'long':
+                #the Ticker level becomes a column so each record reads {'Date', 'Ticker', fields...}
+                yf_download = yf_download.reset_index(level='Ticker')
+            output = records(yf_download)
+            return output
+#------------------------------------------------------------------------------------------
+    @classmethod
+    def statements(cls, tickers: list, statement: str = 'all', currency: str = None, unit: str = 'raw', decimal: bool = False, interval: str = 'annual', validate: str = 'none', workers: int = 8):
+        valid_params = {'valid_statement' : ['income', 'balance', 'cash', 'all'],
+                        'valid_unit' : ['thousand', 'million', 'raw'],
+                        'valid_decimal' : [True, False],
+                        'valid_interval' : ['annual', 'quarter']}
+        
+        params = {'statement': statement,
+                  'units': unit,
+                  'decimal': decimal,
+                  'interval': interval}
+        
+        for param_key, param_value, valid_param in zip(params.keys(), params.values(), valid_params.values()):
+            if param_value not in valid_param:
+                raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
+                                            f"Please choose a valid parameter: {', '.join(valid_param)}")
+
+        tickers = list(dict.fromkeys(tickers)) #dropping duplicate symbols while keeping order
+        equities = cls.universe(tickers, validate=validate, workers=workers)
+
+        #RAW DATA/OBSERVATIONS-------------------------------------------------------------
+        #each company's statements are independent yfinance requests, fetched concurrently by at most `workers` threads
+        def fetch(e):
+            return e.statement(display='numeric', statement=statement, currency=currency, unit=unit, decimal=decimal, interval=interval)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(equities)))) as executor:
+            frames = dict(zip(tickers, executor.map(fetch, equities)))
+
+        #ticker x line item x period (0 = most recent), annual statements cover four fiscal years and quarterly ones five quarters
+        return Panel.from_frames(frames, periods=4 if interval == 'annual' else 5, unit=unit)
+#------------------------------------------------------------------------------------------
+    @classmethod
+    def ratios(cls, tickers: list, validate: str = 'none', workers: int = 8):
+        tickers = list(dict.fromkeys(tickers)) #dropping duplicate symbols while keeping order
+        equities = cls.universe(tickers, validate=validate, workers=workers)
+
+        #RAW DATA/OBSERVATIONS-------------------------------------------------------------
+        #annual statements in millions as in stats(), plus the share counts, EPS and fiscal year end dates of the raw income statement
+        def fetch(e):
+            stmt_df = e.statement(display='numeric', unit='million')
+            yf_raw_IS = e.memo('income_stmt').iloc[:, 0:4]
+            raw_rows = yf_raw_IS.reindex(['Basic Average Shares', 'Basic EPS']).to_numpy(dtype='float64')[:, 0:stmt_df.shape[1]]
+            return stmt_df, raw_rows, yf_raw_IS.columns[0:stmt_df.shape[1]]
+
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(equities)))) as executor:
+            fetched = list(executor.map(fetch, equities))
+
+        panel = Panel.from_frames({ticker: stmt_df for ticker, (stmt_df, _, _) in zip(tickers, fetched)}, periods=4, unit='million')
+
+        T, P = len(tickers), 4
+        shares = np.full((T, P), np.nan)
+        eps = np.full((T, P), np.nan)
+        fy_end_dates = np.full((T, P), np.datetime64('NaT', 'ns'))
+        for t, (_, raw_rows, fy_columns) in enumerate(fetched):
+            shares[t, :raw_rows.shape[1]], eps[t, :raw_rows.shape[1]] = raw_rows
+            fy_end_dates[t, :len(fy_columns)] = pd.DatetimeIndex(fy_columns).to_numpy(dtype='datetime64[ns]')
+
+        #one grouped five year download for every symbol, as in batch_timeseries()
+        closes = cls.batch_timeseries(tickers, period='5y', data='close', round=False).reindex(columns=[f'{ticker} Close' for ticker in tickers])
+        #-----------------------------------------------------------------------------------
+
+        #FY END PRICES----------------------------------------------------------------------
+        #as-of lookup as in stats(): each symbol's last close on or before the FY end date, at most 5 days back.
+        #last_valid[d, t] is the row of symbol t's latest close up to date row d, so every lookup is one gather
+        dates = closes.index.to_numpy(dtype='datetime64[ns]')
+        close_values = closes.to_numpy(dtype='float64')
+
+        prices = np.full((T, P), np.nan)
+        if len(dates):
+            columns = np.arange(T)[:, None]
+            last_valid = np.maximum.accumulate(np.where(np.isfinite(close_values), np.arange(len(dates))[:, None], -1), axis=0)
+
+            date_pos = np.searchsorted(dates, fy_end_dates, side='right') - 1
+            price_pos = last_valid[date_pos.clip(0), columns]
+            found = (date_pos >= 0) & (price_pos >= 0) & ~np.isnat(fy_end_dates)
+            found &= (fy_end_dates - dates[price_pos.clip(0)]) <= np.timedelta64(5, 'D')
+            prices = np.where(found, close_values[price_pos.clip(0), columns], np.nan)
+        #-----------------------------------------------------------------------------------
+
+        #ticker x ratio x fiscal year (0 = most recent)
+        return ratios(panel, price=prices, shares=shares, eps=eps)
+#------------------------------------------------------------------------------------------
+    def timeseries(self, display: str = 'table', period: str = '5y', start: str = None, end: str = None, interval: str = '1d', data: str = 'all', calculation: str = 'price', round: bool = True, show: str = True, save: str = False, stream: bool = False):
         valid_params = {'valid_display' : ['table', 'json', 'line'],
                         'valid_period' : ['1mo', '6mo', '1y', '2y', '5y', '10y', 'ytd', 'max'],
                         'valid_interval' : ['1d', '1wk', '1mo', '3mo'],
@@ -63,12 +352,14 @@ class equity:
             if param_value not in valid_param:
                 raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
+        self.validate()
+
         #RAW DATA/OBSERVATIONS-------------------------------------------------------------
         #Note: start and end parameters will override any period parameter presence
         if start == None and end == None:
-            yf_download = yf.download(self.ticker, period=period, interval=interval, ignore_tz=True, rounding=round, group_by='column', progress=False, auto_adjust=True)
+            yf_download = History.download(self.ticker, period=period, interval=interval, rounding=round)
         elif start != None and end != None:
-            yf_download = yf.download(self.ticker, start=start, end=end, interval=interval, ignore_tz=True, rounding=round, group_by='column', progress=False, auto_adjust=True)
+            yf_download = History.download(self.ticker, start=start, end=end, interval=interval, rounding=round)
         #----------------------------------------------------------------------------------
 
         #STANDARDIZING TABLE---------------------------------------------------------------
@@ -102,29 +393,10 @@ class equity:
             return output
         
         elif display == 'json':
-            yf_download.index = yf_download.index.strftime('%Y-%m-%d')
-            
-            yf_download_list = []
             if data == 'all':
-                for index, row in yf_download.iterrows():
-                    a = {
-                        'Date': index,
-                        f'{self.ticker} Open': float(row[f'{self.ticker} Open']),
-                        f'{self.ticker} High': float(row[f'{self.ticker} High']),
-                        f'{self.ticker} Low': float(row[f'{self.ticker} Low']),
-                        f'{self.ticker} Close': float(row[f'{self.ticker} Close']),
-                        f'{self.ticker} Volume': float(row[f'{self.ticker} Volume'])
-                    }
-                    yf_download_list.append(a)
-            elif data != 'all':
-                for index, row in yf_download.iterrows():
-                    a = {
-                        'Date': index,
-                        f'{self.ticker} {data.title()}': row[f'{self.ticker} {data.title()}']
-                    }
-                    yf_download_list.append(a)
-            
-            output = yf_download_list
+                output = records(yf_download, columns=[f'{self.ticker} Open', f'{self.ticker} High', f'{self.ticker} Low', f'{self.ticker} Close', f'{self.ticker} Volume'], stream=stream)
+            else:
+                output = records(yf_download, stream=stream)
             return output
         
         elif display == 'line':
@@ -132,7 +404,7 @@ class equity:
                 raise ChartReadabilityError('For optimal plot readability, only one type of OHLC price or volume data can be selected at a time. Currently, multiple options are selected. Please choose a single data parameter.')
             
             elif data != 'all':
-                fig, ax = plt.subplots(figsize=(10, 4.5), dpi=300)
+                fig, ax = subplots(figsize=(10, 4.5), dpi=300)
 
                 ax.plot(yf_download.index, yf_download)
                 
@@ -171,17 +443,10 @@ class equity:
                     label.set_fontname('Arial')
 
                 ax.set_axisbelow(True) #making the grid and everything below the actual data line
-                #SAVE----------------------------------------------------------------------
-                if save:
-                    plt.savefig(f'{self.ticker}_Simple{interval_map[interval]}{data.capitalize()}{calculation.title()}_{yf_download.index[0].strftime('%b%Y')}_{yf_download.index[-1].strftime('%b%Y')}.png', dpi=300, bbox_inches='tight')
-
-                #SHOW----------------------------------------------------------------------
-                if show:
-                    plt.show()
-                elif show == False:
-                    plt.close(fig)
+                #SAVE/SHOW-----------------------------------------------------------------
+                finish(fig, f'{self.ticker}_Simple{interval_map[interval]}{data.capitalize()}{calculation.title()}_{yf_download.index[0].strftime('%b%Y')}_{yf_download.index[-1].strftime('%b%Y')}.png', show, save)
 #------------------------------------------------------------------------------------------
-    def equity_candle(self, period: str = '6mo', start: str = None, end: str = None, interval: str = '1d', sma: list = None, volume: bool = True, bollinger: list = None, o_label: bool = True, h_label: bool = True, l_label: bool = True, c_label: bool = True, legend: bool = False, title: bool = True, show: str = True, save: str = False):
+    def equity_candle(self, period: str = '6mo', start: str = None, end: str = None, interval: str = '1d', sma: list = None, volume: bool = True, bollinger: list = None, o_label: bool = True, h_label: bool = True, l_label: bool = True, c_label: bool = True, legend: bool = False, title: bool = True, show: str = True, save: str = False, candle_cap: bool = True):
         valid_params = {'valid_period' : ['1mo', '6mo', '1y', '2y', '5y', '10y', 'ytd', 'max'],
                         'valid_interval' : ['1d', '1wk', '1mo'],
                         'valid_volume' : [True, False],
@@ -192,7 +457,8 @@ class equity:
                         'valid_legend': [True, False],
                         'valid_title': [True, False],
                         'valid_show' : [True, False],
-                        'valid_save' : [True, False]}
+                        'valid_save' : [True, False],
+                        'valid_candle_cap' : [True, False]}
         
         params = {'period': period,
                   'interval': interval,
@@ -204,7 +470,8 @@ class equity:
                   'legend': legend,
                   'title': title,
                   'show': show,
-                  'save': save}
+                  'save': save,
+                  'candle_cap': candle_cap}
         
         #SMA will be int or list from 10-300 inclusive
         #bollinger will be 0.1-3.0 SDs floats inclusive with 0.05 increments; only works when sma is an int
@@ -213,13 +480,15 @@ class equity:
             if param_value not in valid_param:
                 raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
+        self.validate()
+
         #RAW DATA/OBSERVATIONS-------------------------------------------------------------
         data = self.timeseries(period=period, data='all', calculation='price', round=True, interval=interval, start=start, end=end)
         data['DateNum'] = [x for x in range(0,len(data))]
         #----------------------------------------------------------------------------------
 
         #SETTING LIMITS ON NUMBER OF DATA DF ROWS POSSIBLE---------------------------------(this is to prevent overly cramped candlestick formatting)
-        if len(data) > 265:
+        if candle_cap and len(data) > 265:
             raise ChartReadabilityError(f"Number of OHLC candles are capped at 265 to ensure plot readability. The current selection contains {len(data)} data points. Please reduce the time period or choose a larger interval.")
             #1d interval and 1y period is ~262 datapoints
             #1wk interval and 5y period is ~250 datapoints
@@ -247,30 +516,24 @@ class equity:
 
         #SETTING UP DATA DATAFRAME WITH OPTIONAL SMA AND BOLLINGER BAND COLUMN(S)----------
         if sma is not None:
-            max_c_data = self.timeseries(period='max', data='all', calculation='price', round=True, interval=interval)
+            close = data[f'{self.ticker} Close']
+            #only the max(sma) - 1 bars before the plotted window are downloaded to warm up the rolling windows
+            if period != 'max' or start != None:
+                warmup_bars = max(sma) - 1
+                warmup = History.download(self.ticker, start=warmup_start(data.index[0], warmup_bars, interval).strftime('%Y-%m-%d'), end=data.index[0].strftime('%Y-%m-%d'), interval=interval, rounding=True)
+                if not warmup.empty:
+                    warmup_close = warmup['Close'].iloc[:, 0]
+                    warmup_close = warmup_close[warmup_close.index < data.index[0]].tail(warmup_bars)
+                    close = pd.concat([warmup_close, close])
             #creating sma columns in data dataframe based on bollinger condition
-            if bollinger == None:
-                for i in sma:
-                    max_c_data[f'SMA {i}'] = max_c_data[f'{self.ticker} Close'].rolling(window=i).mean()
-                    data[f'SMA {i}'] = max_c_data[f'SMA {i}'].tail(len(data))
-            elif isinstance(bollinger, list):
-                for i, b in zip(sma, bollinger):
-                    if b != None:
-                        max_c_data[f'SMA {i}'] = max_c_data[f'{self.ticker} Close'].rolling(window=i).mean()
-                        data[f'SMA {i}'] = max_c_data[f'SMA {i}'].tail(len(data))
-                        max_c_data[f'SD {i}'] = max_c_data[f'{self.ticker} Close'].rolling(window=i).std()
-                        data[f'bollinger_upper {i}'] = data[f'SMA {i}'] + (b * max_c_data[f'SD {i}'].tail(len(data)))
-                        data[f'bollinger_lower {i}'] = data[f'SMA {i}'] - (b * max_c_data[f'SD {i}'].tail(len(data)))
-                    elif b == None:
-                        max_c_data[f'SMA {i}'] = max_c_data[f'{self.ticker} Close'].rolling(window=i).mean()
-                        data[f'SMA {i}'] = max_c_data[f'SMA {i}'].tail(len(data))
+            moving_averages(data, close, sma, bollinger)
 
         #CREATING THE MAIN FIG AX PAIR WITH AN OPTIONAL VOLUME AX--------------------------
         if volume == True:
-            fig, (ax_p, ax_v) = plt.subplots(nrows=2, ncols=1, gridspec_kw={'height_ratios': [3,1]}, figsize=(10, 6), dpi=300)
-            plt.subplots_adjust(hspace=0)
+            fig, (ax_p, ax_v) = subplots(nrows=2, ncols=1, gridspec_kw={'height_ratios': [3,1]}, figsize=(10, 6), dpi=300)
+            fig.subplots_adjust(hspace=0)
         elif volume == False:
-            fig, ax_p = plt.subplots(figsize=(10, 4.5), dpi=300)
+            fig, ax_p = subplots(figsize=(10, 4.5), dpi=300)
 
         #PLOTTING THE MAIN OHLC CANDLESTICKS-----------------------------------------------
         if len(data) > 200:
@@ -284,27 +547,11 @@ class equity:
         else:
             candle_width = 0.7
         
-        for index, row in data.iterrows():
-            color = 'green' if row[f'{self.ticker} Close'] >= row[f'{self.ticker} Open'] else 'red'
-            #wick
-            ax_p.vlines(row['DateNum'], row[f'{self.ticker} Low'], row[f'{self.ticker} High'], color=color, linewidth=0.25)
-            #box
-            ax_p.add_patch(plt.Rectangle(
-                (row['DateNum'] - (candle_width/2), min(row[f'{self.ticker} Open'], row[f'{self.ticker} Close'])), # bottom left corner of the rectangle
-                candle_width, # horizontal width of the rectangle
-                abs(row[f'{self.ticker} Close'] - row[f'{self.ticker} Open']), #vertical height of the rectangle
-                color=color #fill color of the rectangle
-            ))
+        candlesticks(ax_p, data['DateNum'], data[f'{self.ticker} Open'], data[f'{self.ticker} High'], data[f'{self.ticker} Low'], data[f'{self.ticker} Close'], candle_width)
         
         #PLOTTING THE OPTIONAL VOLUME BARS IN SEPERATE AXES BELOW THE OHLC CHART-----------
         if volume == True:
-            for index, row in data.iterrows():
-                color = 'green' if row[f'{self.ticker} Close'] >= row[f'{self.ticker} Open'] else 'red'
-                ax_v.bar(row['DateNum'],
-                        row[f'{self.ticker} Volume'],
-                        color = 'green' if row[f'{self.ticker} Close'] >= row[f'{self.ticker} Open'] else 'red',
-                        width = 0.8,
-                        alpha = 0.3)
+            volume_bars(ax_v, data['DateNum'], data[f'{self.ticker} Open'], data[f'{self.ticker} Close'], data[f'{self.ticker} Volume'])
                 
         #REPLACING VOLUME CHART YAXIS LABELS WITH USER FRIENDLY OPTIONS--------------------
         if volume == True:
@@ -319,7 +566,7 @@ class equity:
                     return f'{x:.0f}'
 
             # Apply to volume axis
-            ax_v.yaxis.set_major_formatter(FuncFormatter(human_format))
+            ax_v.yaxis.set_major_formatter(mticker.FuncFormatter(human_format))
 
         #PLOTTING OPTIONAL SMA AND BOLLINGER BAND LINES------------------------------------
         if isinstance(sma, list):
@@ -461,15 +708,8 @@ class equity:
             last_date = data.index[-1].strftime('%b %Y')
             ax_p.set_title(f'{self.ticker} Stock Price — {interval_map[interval]} OHLC{' and Volume' if volume else ''} ({first_date} - {last_date})', fontsize=6.5, loc='left', pad=4, fontname='Arial', weight='bold')
 
-        #SAVE------------------------------------------------------------------------------
-        if save:
-            plt.savefig(f'{self.ticker}_{interval_map[interval]}CandleChart_{data.index[0].strftime('%b%Y')}_{data.index[-1].strftime('%b%Y')}.png', dpi=300, bbox_inches='tight')
-
-        #SHOW------------------------------------------------------------------------------
-        if show:
-            plt.show()
-        elif show == False:
-            plt.close(fig)
+        #SAVE/SHOW-------------------------------------------------------------------------
+        finish(fig, f'{self.ticker}_{interval_map[interval]}CandleChart_{data.index[0].strftime('%b%Y')}_{data.index[-1].strftime('%b%Y')}.png', show, save)
 #------------------------------------------------------------------------------------------
     def realtime(self, display: str = 'json'): 
         valid_params = {'display': ['json', 'pretty']}
@@ -484,12 +724,14 @@ class equity:
         if Config.td_apikey is None:
             raise MissingConfigObject('Missing td_apikey. Please set your Twelve Data api key using the set_config() function.')
 
+        self.validate()
+
         #RAW DATA/OBSERVATIONS-------------------------------------------------------------
         url_1 = Config.td_baseurl + f'price?apikey={Config.td_apikey}&symbol={self.mticker}'
-        td_realtime = requests.get(url_1).json()
+        td_realtime = Transport.get(url_1).json()
 
         url_2 = Config.td_baseurl + f'quote?apikey={Config.td_apikey}&symbol={self.mticker}'
-        td_quote = requests.get(url_2).json()
+        td_quote = Transport.get(url_2).json()
         #----------------------------------------------------------------------------------
         
         #PARAMETER - DISPLAY ==============================================================
@@ -508,7 +750,7 @@ Currency: {td_quote['currency']}'''
     def statement(self, display: str = 'json', statement: str = 'all', currency: str = None, unit: str = 'raw', decimal: bool = False, interval: str = 'annual'): 
         valid_params = {'valid_statement' : ['income', 'balance', 'cash', 'all'],
                         'valid_unit' : ['thousand', 'million', 'raw'],
-                        'valid_display' : ['json', 'table'],
+                        'valid_display' : ['json', 'table', 'numeric'],
                         'valid_decimal' : [True, False],
                         'valid_interval' : ['annual', 'quarter']}
         
@@ -523,9 +765,9 @@ Currency: {td_quote['currency']}'''
                 raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
         
-        #RAW DATA/OBSERVATIONS--------------------------------------------------------------
-        firm = yf.Ticker(self.ticker)
+        self.validate()
 
+        #RAW DATA/OBSERVATIONS--------------------------------------------------------------
         #STATEMENT ITEMS
         statement_items = {
             'income': ['Total Revenue',
@@ -638,9 +880,9 @@ Currency: {td_quote['currency']}'''
         #PARAMETER - INTERVAL ==============================================================
         def Income():
             if interval == 'annual':
-                IS = firm.income_stmt.iloc[:, 0:4]
+                IS = self.memo('income_stmt').iloc[:, 0:4].copy() #the memoized frame is shared, so it is never written to
             elif interval == 'quarter':
-                IS = firm.quarterly_income_stmt.iloc[:, 0:5]
+                IS = self.memo('quarterly_income_stmt').iloc[:, 0:5].copy()
 
                     #creating new IS line item
             IS.loc['Other Operating Expenses'] = (
@@ -659,9 +901,9 @@ Currency: {td_quote['currency']}'''
         
         def Balance():
             if interval == 'annual':
-                BS = firm.balance_sheet.iloc[:, 0:4]
+                BS = self.memo('balance_sheet').iloc[:, 0:4].copy()
             elif interval == 'quarter':
-                BS = firm.quarterly_balance_sheet.iloc[:, 0:5]
+                BS = self.memo('quarterly_balance_sheet').iloc[:, 0:5].copy()
 
             BS.loc['Other Current Assets'] = (
                 (BS.loc['Current Assets'] if 'Current Assets' in BS.index else np.nan)
@@ -696,9 +938,9 @@ Currency: {td_quote['currency']}'''
 
         def Cash():
             if interval == 'annual':
-                CF = firm.cash_flow.iloc[:, 0:4]
+                CF = self.memo('cash_flow').iloc[:, 0:4].copy()
             elif interval == 'quarter':
-                CF = firm.quarterly_cash_flow.iloc[:, 0:5]
+                CF = self.memo('quarterly_cash_flow').iloc[:, 0:5].copy()
 
             CF.loc['Other Operating Cash Flow'] = (
                 (CF.loc['Operating Cash Flow'] if 'Operating Cash Flow' in CF.index else np.nan)
@@ -762,7 +1004,8 @@ Currency: {td_quote['currency']}'''
             data /= 1000000
 
         #PARAMETER - CURRENCY ==============================================================
-        current_currency = firm.get_info()['financialCurrency'] if 'financialCurrency' in firm.get_info().keys() else '---'
+        #info is a heavy request, so the reporting currency is only looked up when a conversion is asked for
+        current_currency = self.memo('info').get('financialCurrency', '---') if currency != None else None
         
         if currency == current_currency or currency == '---':
             None
@@ -772,14 +1015,14 @@ Currency: {td_quote['currency']}'''
             
             forex_pair = f'{current_currency}/{currency}'
             url = Config.td_baseurl + f'price?apikey={Config.td_apikey}&symbol={forex_pair}'
-            exchange_rate = requests.get(url).json()['price']
+            exchange_rate = Transport.get(url).json()['price']
             
             data *= float(exchange_rate)
             
         #PARAMETER - DECIMAL ===============================================================
+        #the frame stays float64 until the display step, + 0.0 turns the -0.0 left by rounding into 0.0
         if decimal == False:
-            data = data.map(lambda x: str(x) if pd.isna(x) else x)
-            data = data.map(lambda x: int('{:.0f}'.format(x)) if isinstance(x, float) else x)
+            data = data.round(0) + 0.0
 
         #COLUMN RENAMING
         if interval == 'annual':
@@ -789,11 +1032,25 @@ Currency: {td_quote['currency']}'''
             data.columns = [f'{str(col)[:7]}' for col in data.columns]
 
         #PARAMETER - DISPLAY ===============================================================
+        if display == 'numeric':
+            output = data
+            return output
+
+        #formatting happens once over the whole array: whole numbers become python ints and missing values 'nan'
+        values = data.to_numpy(dtype='float64')
+        finite = np.isfinite(values)
+        cells = values.astype(object)
+        if decimal == False:
+            cells[finite] = values[finite].astype(np.int64)
+            cells[~finite] = values[~finite].astype(str)
+
         if display == 'json':
-            output = data.to_dict()
+            output = pd.DataFrame(cells, index=data.index, columns=data.columns).to_dict()
             return output
         elif display == 'table':
-            output = data.map(lambda x: f'{x:,}' if isinstance(x, (int, float)) and pd.notna(x) else x)
+            shown = ~np.isnan(values) if decimal else finite
+            cells[shown] = [f'{x:,}' for x in cells[shown]]
+            output = pd.DataFrame(cells, index=data.index, columns=data.columns)
             return output
 #------------------------------------------------------------------------------------------
     def equity_quote(self, display: str = 'json'):
@@ -806,17 +1063,20 @@ Currency: {td_quote['currency']}'''
                 raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
 
+        self.validate()
+
         #RAW DATA/OBSERVATIONS--------------------------------------------------------------
         today = date.today().strftime("%Y-%m-%d")
         six_y_ago = str(int(today[0:4])-6) + today[4:]
         
-        yf_download = yf.download(self.ticker, progress=False, auto_adjust=True, start=six_y_ago, end=today)
+        #one six year fetch up to the latest bar, every window and the last close below are read from it
+        yf_download = History.download(self.ticker, start=six_y_ago)
         
-        yf_quote = yf.Ticker(self.ticker).get_fast_info()
+        yf_quote = self.memo('fast_info')
 
-        yf_history_metadata = yf.Ticker(self.ticker).get_history_metadata()
+        yf_history_metadata = self.memo('metadata')
 
-        yf_eod = yf.download(self.ticker, progress=False, auto_adjust=True)['Close'].iloc[-1].iloc[0]
+        yf_eod = yf_download['Close'].iloc[-1].iloc[0]
 
         current_year = pd.Timestamp.now().year
         #-----------------------------------------------------------------------------------
@@ -832,12 +1092,9 @@ Currency: {td_quote['currency']}'''
 
         initial_dates = [pd.Timestamp(d) for d in initial_dates]
 
-        final_dates = []
-
-        for d in initial_dates:
-            while d not in yf_download.index.tolist():
-                d = d + relativedelta(days=1)
-            final_dates.append(d)
+        #first trading day on or after each date, resolved with a binary search on the sorted index
+        date_pos = yf_download.index.searchsorted(initial_dates, side='left').clip(0, len(yf_download.index) - 1)
+        final_dates = yf_download.index[date_pos].tolist()
         
         #JSON FORMAT DATA
         quote_data = {
@@ -920,30 +1177,20 @@ MOVING AVERAGES-------------------------
                 raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
 
+        self.validate()
+
         #RAW DATA/OBSERVATIONS--------------------------------------------------------------
-        yf_history_metadata = yf.Ticker(self.ticker).get_history_metadata()
+        yf_history_metadata = self.memo('metadata')
 
-        yf_info = yf.Ticker(self.ticker).get_info()
+        yf_info = self.memo('info')
 
-        yf_calendar = yf.Ticker(self.ticker).get_calendar()
+        yf_calendar = self.memo('calendar')
 
         #cik id
         if Config.email_address is None:
                 raise MissingConfigObject('Missing email_address. Please set your email address using the set_config() function.')
 
-        sec_header = {'User-Agent': f"{Config.email_address}"}
-        sec_list = requests.get(f'{Config.sec_baseurl}files/company_tickers.json', headers=sec_header).json()
-
-        companyData = pd.DataFrame.from_dict(sec_list, orient='index')
-
-        companyData['cik_str'] = companyData['cik_str'].astype(str).str.zfill(10)
-
-        try:
-            index_of_ticker = int(companyData[companyData['ticker'] == self.ticker].index[0])
-
-            sec_cik = companyData.iloc[index_of_ticker,0]
-        except IndexError:
-            sec_cik = '-'
+        sec_cik = SEC.cik(self.ticker) or '-'
         #-----------------------------------------------------------------------------------
 
         #COMPANY OFFICERS
@@ -1008,35 +1255,61 @@ COMPANY OFFICERS--------------------------------------------------
             
             print(output)
 #------------------------------------------------------------------------------------------
-    def filings(self, form: str = None): 
-        
+    def iter_filings(self, form = None, limit: int = None, start: str = None, end: str = None, history: str = 'all'):
+        valid_params = {'valid_history': ['recent', 'all']}
+
+        params = {'history': history}
+
+        for param_key, param_value, valid_param in zip(params.keys(), params.values(), valid_params.values()):
+            if param_value not in valid_param:
+                raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
+                                            f"Please choose a valid parameter: {', '.join(valid_param)}")
+
         if Config.email_address is None:
                 raise MissingConfigObject('Missing email_address. Please set your email address using the set_config() function.')
 
+        self.validate()
+
         #RAW DATA/OBSERVATIONS-------------------------------------------------------------
-        headers = {'User-Agent': f"{Config.email_address}"}
-        companyTickers = requests.get(f'{Config.sec_baseurl}files/company_tickers.json', headers=headers) #ticker-cik json data request
-        
-        companyData = pd.DataFrame.from_dict(companyTickers.json(), orient='index')
-        companyData['cik_str'] = companyData['cik_str'].astype(str).str.zfill(10) # adding leading zeros to cik
+        sec_cik = SEC.cik(self.ticker) #ticker-cik lookup
+        if sec_cik is None:
+            raise InvalidSecurityError(f"Symbol '{self.ticker}' is not listed in the SEC ticker-cik map.")
+        #----------------------------------------------------------------------------------
 
-        index_of_ticker = int(companyData[companyData['ticker'] == self.ticker].index[0]) #finding the row with the desired ticker
+        #filings are yielded newest first as each page is parsed, older pages are only requested if iteration gets to them,
+        #so stopping early (limit reached, dates older than start, or the caller breaking out) saves every remaining request
+        forms = None if form is None else ({form} if isinstance(form, str) else set(form))
 
-        sec_cik = companyData.iloc[index_of_ticker,0] #retriving the cik id of the ticker
+        def stream():
+            count = 0
 
-        filingMetadata = requests.get(f'https://data.sec.gov/submissions/CIK{sec_cik}.json', headers=headers) #requesting raw json filing data
-        #----------------------------------------------------------------------------------
+            for block in SEC.submissions(sec_cik, start=start, end=end, history=history):
+                fields = list(block.keys())
+                for values in zip(*(block[field] for field in fields)):
+                    filing = dict(zip(fields, values))
 
-        #DATAFRAME ORGANIZATION
-        allForms = pd.DataFrame.from_dict(filingMetadata.json()['filings']['recent'])
+                    #PARAMETER - START/END/FORM ===========================================
+                    if end is not None and filing['filingDate'] >= end:
+                        continue
+                    if start is not None and filing['filingDate'] < start:
+                        break
+                    if forms is not None and filing['form'] not in forms:
+                        continue
 
-        allForms = allForms[['accessionNumber','filingDate','form']]
+                    yield filing
+                    count += 1
 
-        allForms = allForms.set_index('accessionNumber')
+                    #PARAMETER - LIMIT =====================================================
+                    if limit is not None and count >= limit:
+                        return
 
-        #PARAMETER - FORM =================================================================
-        if form != None:
-            allForms = allForms[allForms['form'] == form]
+        return stream()
+#------------------------------------------------------------------------------------------
+    def filings(self, form: str = None, history: str = 'all'): 
+        #DATAFRAME ORGANIZATION
+        allForms = pd.DataFrame.from_records(self.iter_filings(form=form, history=history), columns=['accessionNumber','filingDate','form'])
+
+        allForms = allForms.set_index('accessionNumber')
 
         return allForms
 #------------------------------------------------------------------------------------------
@@ -1050,18 +1323,18 @@ COMPANY OFFICERS--------------------------------------------------
                 raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
             
-        #RAW DATA/OBSERVATIONS-------------------------------------------------------------
-        firm = yf.Ticker(self.ticker)
+        self.validate()
 
-        yf_calendar = firm.get_calendar()
-        yf_earnings_estimate = firm.get_earnings_estimate()
-        yf_revenue_estimate = firm.get_revenue_estimate()
-        yf_growth_estimate = firm.get_growth_estimates()
-        yf_price_estimate = firm.get_analyst_price_targets()
+        #RAW DATA/OBSERVATIONS-------------------------------------------------------------
+        yf_calendar = self.memo('calendar')
+        yf_earnings_estimate = self.memo('earnings_estimate')
+        yf_revenue_estimate = self.memo('revenue_estimate')
+        yf_growth_estimate = self.memo('growth_estimates')
+        yf_price_estimate = self.memo('analyst_price_targets')
 
-        yf_history_metadata = firm.get_history_metadata()
+        yf_history_metadata = self.memo('metadata')
 
-        yf_info = yf.Ticker(self.ticker).get_info()
+        yf_info = self.memo('info')
         #----------------------------------------------------------------------------------
 
         #renaming a json format EARNINGS estimate data
@@ -1181,8 +1454,10 @@ PRICE ESTIMATE----------------------------------------------------------
                 raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
     
+        self.validate()
+
         #RAW DATA/OBSERVATIONS-------------------------------------------------------------
-        yf_dividends = yf.Ticker(self.ticker).get_dividends()
+        yf_dividends = self.memo('dividends')
         #----------------------------------------------------------------------------------
 
         renamed_dates = {}
@@ -1220,23 +1495,15 @@ PRICE ESTIMATE----------------------------------------------------------
 
         #PARAMETER - DISPLAY ==============================================================
         if display == 'json':
-            dividends_df.index = dividends_df.index.strftime('%Y-%m-%d')
-
-            dividends_json_list = []
-            for index, row in dividends_df.iterrows():
-                a = {
-                    'Date': index,
-                    f'{self.ticker} Dividends': float(row[f'{self.ticker} Dividends'])
-                }
-                dividends_json_list.append(a)
-            return dividends_json_list
+            output = records(dividends_df)
+            return output
         elif display == 'table':
             output = dividends_df
             return output
         else:
             dividends_df.index = dividends_df.index.to_period('M').to_timestamp()
 
-            fig, ax = plt.subplots(figsize=(10, 4.5), dpi=300)
+            fig, ax = subplots(figsize=(10, 4.5), dpi=300)
 
             if display == 'bar': ax.bar(dividends_df.index, dividends_df[dividends_df.columns[0]], width=40)
             elif display == 'line':
@@ -1273,15 +1540,8 @@ PRICE ESTIMATE----------------------------------------------------------
                 label.set_fontname('Arial')
 
             ax.set_axisbelow(True) #making the grid and everything below the actual data line
-            #SAVE--------------------------------------------------------------------------
-            if save:
-                plt.savefig(f'{self.ticker}_Dividends_{dividends_df.index[0].strftime('%b%Y')}_{dividends_df.index[-1].strftime('%b%Y')}.png', dpi=300, bbox_inches='tight')
-
-            #SHOW--------------------------------------------------------------------------
-            if show:
-                plt.show()
-            elif show == False:
-                plt.close(fig)
+            #SAVE/SHOW---------------------------------------------------------------------
+            finish(fig, f'{self.ticker}_Dividends_{dividends_df.index[0].strftime('%b%Y')}_{dividends_df.index[-1].strftime('%b%Y')}.png', show, save)
 #------------------------------------------------------------------------------------------
     def split(self, display: str = 'json'): 
         valid_params = {'valid_display': ['json', 'table'],}
@@ -1293,8 +1553,10 @@ PRICE ESTIMATE----------------------------------------------------------
                 raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
             
+        self.validate()
+
         #RAW DATA/OBSERVATIONS-------------------------------------------------------------
-        yf_splits = yf.Ticker(self.ticker).get_splits()
+        yf_splits = self.memo('splits')
         #----------------------------------------------------------------------------------
 
         renamed_dates = {}
@@ -1312,16 +1574,8 @@ PRICE ESTIMATE----------------------------------------------------------
 
         #PARAMETER - DISPLAY ==============================================================
         if display == 'json':
-            splits_df.index = splits_df.index.strftime('%Y-%m-%d')
-
-            splits_json_list = []
-            for index, row in splits_df.iterrows():
-                a = {
-                    'Date': index,
-                    f'{self.ticker} Splits': float(row[f'{self.ticker} Splits'])
-                }
-                splits_json_list.append(a)
-            return splits_json_list
+            output = records(splits_df)
+            return output
         elif display == 'table':
             output = splits_df
             return output
@@ -1336,107 +1590,50 @@ PRICE ESTIMATE----------------------------------------------------------
                 raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
         
+        self.validate()
+
         #RAW DATA/OBSERVATIONS-------------------------------------------------------------
         #ANNUAL DATA
-        stmt_df = self.statement(display='table', unit='million') #gathering all statement item data
-        stmt_df = stmt_df.map(lambda x: pd.to_numeric(x.replace(',', ''), errors='coerce') if isinstance(x, str) else x) #returning all df element datatypes to numerics
-        stmt_loc = stmt_df.loc
+        stmt_df = self.statement(display='numeric', unit='million') #gathering all statement item data as float64
 
-        yf_raw_IS = yf.Ticker(self.ticker).income_stmt
+        yf_raw_IS = self.memo('income_stmt')
 
         #QUARTERLY DATA
-        q_stmt_df = self.statement(display='table', unit='million', interval='quarter')
-        q_stmt_df = q_stmt_df.map(lambda x: pd.to_numeric(x.replace(',', ''), errors='coerce') if isinstance(x, str) else x)
+        q_stmt_df = self.statement(display='numeric', unit='million', interval='quarter')
 
-        yf_raw_qIS = yf.Ticker(self.ticker).quarterly_income_stmt
+        yf_raw_qIS = self.memo('quarterly_income_stmt')
 
         #OTHER
-        yf_eod = yf.download(self.ticker, progress=False, auto_adjust=True)['Close'].iloc[-1].iloc[0]
+        #one five year download covers both the latest close and every FY end price lookup below
+        yf_download = History.download(self.ticker, period='5y')
+
+        yf_eod = yf_download['Close'].iloc[-1].iloc[0]
 
-        yf_quote = yf.Ticker(self.ticker).get_fast_info()
+        yf_quote = self.memo('fast_info')
 
-        yf_history_metadata = yf.Ticker(self.ticker).get_history_metadata()
+        yf_history_metadata = self.memo('metadata')
         #-----------------------------------------------------------------------------------
 
         #CALCULATING ANNUAL FIGURES---------------------------------------------------------
-
-        #ANNUAL FIGURES - PROFITABILITY
-        stmt_loc['gross margin'] = stmt_loc['Gross Profit']/stmt_loc['Total Revenue']
-        stmt_loc['ebit margin'] = stmt_loc['EBIT']/stmt_loc['Total Revenue']
-        stmt_loc['net margin'] = stmt_loc['Net Income']/stmt_loc['Total Revenue']
-        stmt_loc['roa'] = stmt_loc['Net Income']/stmt_loc['Total Assets']
-        stmt_loc['roe'] = stmt_loc['Net Income']/stmt_loc['Total Equity']
-
-        #ANNUAL FIGURES - LIQUIDITY
-        stmt_loc['current ratio'] = stmt_loc['Total Current Assets']/stmt_loc['Total Current Liabilities']
-        stmt_loc['quick ratio'] = (stmt_loc['Total Current Assets'] - stmt_loc['Inventory'])/stmt_loc['Total Current Liabilities']
-        stmt_loc['cash ratio'] = stmt_loc['Cash And Cash Equivalents']/stmt_loc['Total Current Liabilities']
-
-        #ANNUAL FIGURES - LEVERAGE
-        stmt_loc['debt to equity'] = stmt_loc['Total Liabilities']/stmt_loc['Total Equity']
-        stmt_loc['debt to assets'] = stmt_loc['Total Liabilities']/stmt_loc['Total Assets']
-        stmt_loc['interest coverage ratio'] = stmt_loc['EBIT']/stmt_loc['Interest Expense']
-
-        #ANNUAL FIGURES - EFFICIENCY
-        stmt_loc['inventory turnover'] = stmt_loc['Cost Of Revenue'] / ((stmt_loc['Inventory'] + stmt_df.shift(-1, axis=1).loc['Inventory'])/2)
-        stmt_loc['receivables turnover'] = stmt_loc['Total Revenue'] / ((stmt_loc['Accounts Receivable'] + stmt_df.shift(-1, axis=1).loc['Accounts Receivable'])/2)
-        stmt_loc['payables turnover'] = stmt_loc['Cost Of Revenue'] / ((stmt_loc['Accounts Payable'] + stmt_df.shift(-1, axis=1).loc['Accounts Payable'])/2)
-        stmt_loc['dio'] = 365 / stmt_loc['inventory turnover']
-        stmt_loc['dso'] = 365 / stmt_loc['receivables turnover']
-        stmt_loc['dpo'] = 365 / stmt_loc['payables turnover']
-        stmt_loc['cash conversion cycle'] = stmt_loc['dso'] + stmt_loc['dio'] - stmt_loc['dpo']
-
-        #ANNUAL FIGURES - CASH FLOW
-        stmt_loc['fcff_DA.WC'] = stmt_loc['EBIT'] * (1 - (stmt_loc['Tax Provision']/stmt_loc['Pretax Income'])) + stmt_loc['Depreciation and Amortization'] + stmt_loc['Change In Working Capital'] + stmt_loc['Capital Expenditure']
-        stmt_loc['fcff_DA.WC.otherNonCash'] = stmt_loc['fcff_DA.WC'] + stmt_loc['Other Operating Cash Flow']
-        stmt_loc['fcfe_DA.WC'] = stmt_loc['Net Income'] + stmt_loc['Depreciation and Amortization'] + stmt_loc['Change In Working Capital'] + stmt_loc['Capital Expenditure'] + stmt_loc['Net Issuance/Payments Of Debt']
-        stmt_loc['fcfe_DA.WC.otherNonCash'] = stmt_loc['Operating Cash Flow'] + stmt_loc['Capital Expenditure'] + stmt_loc['Net Issuance/Payments Of Debt']
-
-        #ANNUAL FIGURES - GROWTH
-        stmt_loc['revenue growth rate'] = (stmt_loc['Total Revenue'] / stmt_df.shift(-1, axis=1).loc['Total Revenue']) - 1
-        stmt_loc['EBIT growth rate'] = (stmt_loc['EBIT'] / stmt_df.shift(-1, axis=1).loc['EBIT']) - 1
-
-        #ANNUAL FIGURES - VALUATION
         #fy end date stock prices
-        date_lists = []
-        for i in yf_raw_IS.columns[0:4]:
-            a = []
-            a.append(str(i.date()))
-            a.append(str(i.date() + timedelta(days=-1)))
-            a.append(str(i.date() + timedelta(days=-2)))
-            a.append(str(i.date() + timedelta(days=-3)))
-            a.append(str(i.date() + timedelta(days=-4)))
-            a.append(str(i.date() + timedelta(days=-5)))
-            date_lists.append(a)
-
-        FY_prices = []
-        for date_list in date_lists:
-            for date in date_list:
-                try:
-                    a = yf.download(self.ticker, progress=False, ignore_tz=True, auto_adjust=True, period='5y').loc[date]
-                    FY_prices.append(float(a.iloc[0]))
-                    break
-                except KeyError:
-                    None
-
-        if len(FY_prices) == len(yf_raw_IS.columns[0:4]):
-            for i in range(len(yf_raw_IS.columns[0:4]) - len(FY_prices)):
-                FY_prices.append(np.nan)
-
-        #valuation ratio calculations
-        stmt_loc['stock price'] = FY_prices
-        stmt_loc['shares outstanding'] = yf_raw_IS.loc['Basic Average Shares'].tolist()[0:4]
-        stmt_loc['market cap'] = (stmt_loc['stock price'] * stmt_loc['shares outstanding'])/1000000
-
-        stmt_loc['pe'] = stmt_loc['market cap'] / stmt_loc['Net Income']
-        stmt_loc['ps'] = stmt_loc['market cap'] / stmt_loc['Total Revenue']
-        stmt_loc['pb'] = stmt_loc['market cap'] / stmt_loc['Total Equity']
-        stmt_loc['eps'] = yf_raw_IS.loc['Basic EPS'].tolist()[0:4]
-        stmt_loc['dividend yield'] = -stmt_loc['Cash Dividends Paid'] / stmt_loc['market cap']
-        stmt_loc['dividend payout ratio'] = -stmt_loc['Cash Dividends Paid'] / stmt_loc['Net Income']
-        stmt_loc['enterprise value'] = stmt_loc['market cap'] + stmt_loc['Total Liabilities'] - stmt_loc['Cash And Cash Equivalents']
-        stmt_loc['ev/ebitda'] = stmt_loc['enterprise value'] / stmt_loc['EBITDA']
-        stmt_loc['ev/ebit'] = stmt_loc['enterprise value'] / stmt_loc['EBIT']
+        #as-of lookup: close on the FY end date or the nearest prior trading day up to 5 days back, NaN otherwise
+        fy_end_dates = pd.DatetimeIndex(yf_raw_IS.columns[0:4])
+        fy_close = yf_download['Close'].iloc[:, 0]
+
+        fy_pos = fy_close.index.searchsorted(fy_end_dates, side='right') - 1
+        fy_found = (fy_pos >= 0) & ((fy_end_dates - fy_close.index[fy_pos.clip(0)]) <= timedelta(days=5))
+        FY_prices = np.where(fy_found, fy_close.to_numpy()[fy_pos.clip(0)], np.nan).tolist()
+
+        #the same whole-array ratio engine as equity.ratios(), run over a one ticker panel
+        fy_count = stmt_df.shape[1]
+        annual_panel = ratios(Panel.from_frames({self.ticker: stmt_df}, periods=fy_count, unit='million'),
+                              price=[FY_prices[0:fy_count]],
+                              shares=[yf_raw_IS.loc['Basic Average Shares'].tolist()[0:fy_count]],
+                              eps=[yf_raw_IS.loc['Basic EPS'].tolist()[0:fy_count]])
+
+        annual_df = annual_panel.ticker(self.ticker, display='table')
+        annual_df.columns = stmt_df.columns
+        stmt_loc = annual_df.loc
         #-----------------------------------------------------------------------------------
 
         #CALCULATING RECENT FIGURES---------------------------------------------------------
@@ -1617,7 +1814,7 @@ PRICE ESTIMATE----------------------------------------------------------
             },
             'growth': {
                 'revenue growth rate': stmt_loc['revenue growth rate'].to_dict(),
-                'ebit growth rate': stmt_loc['EBIT growth rate'].to_dict()
+                'ebit growth rate': stmt_loc['ebit growth rate'].to_dict()
             }
         }
         #-----------------------------------------------------------------------------------
@@ -1773,8 +1970,10 @@ CASH FLOW-----------------------------------------------------------------------
                 raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
     
+        self.validate()
+
         #RAW DATA/OBSERVATIONS-------------------------------------------------------------
-        yf_eps_df = yf.Ticker(self.ticker).get_earnings_dates()
+        yf_eps_df = self.memo('earnings_dates').copy()
         #----------------------------------------------------------------------------------
 
         yf_eps_df.index = yf_eps_df.index.normalize().tz_localize(None)
@@ -1789,16 +1988,7 @@ CASH FLOW-----------------------------------------------------------------------
 
         #PARAMETER - DISPLAY ==============================================================
         if display == 'json':
-            yf_eps_df.index = yf_eps_df.index.strftime('%Y-%m-%d')
-
-            yf_eps_dictlist = []
-            for index, row in yf_eps_df.iterrows():
-                a = {'Date': index,
-                    f'{self.ticker} EPS Estimate': float(row[f'{self.ticker} EPS Estimate']) if isinstance(row[f'{self.ticker} EPS Estimate'], np.float64) else row[f'{self.ticker} EPS Estimate'],
-                    f'{self.ticker} EPS Actual': float(row[f'{self.ticker} EPS Actual']) if isinstance(row[f'{self.ticker} EPS Actual'], np.float64) else row[f'{self.ticker} EPS Estimate'],
-                    f'{self.ticker} EPS Surprise(%)': float(row[f'{self.ticker} EPS Surprise(%)']) if isinstance(row[f'{self.ticker} EPS Surprise(%)'], np.float64) else row[f'{self.ticker} EPS Estimate']}
-                yf_eps_dictlist.append(a)
-            output = yf_eps_dictlist
+            output = records(yf_eps_df)
             return output
         elif display == 'table':
             output = yf_eps_df
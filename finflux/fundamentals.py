@@ -0,0 +1,163 @@
+import numpy as np # type: ignore
+import pandas as pd # type: ignore
+
+#------------------------------------------------------------------------------------------
+class InvalidParameterError(Exception):
+    def __init__(self, msg):
+        self.msg = msg
+
+#------------------------------------------------------------------------------------------
+class Panel:
+    #statement line items of many companies in one C-contiguous float64 array shaped (ticker, item, period).
+    #periods are positional, 0 is each company's most recent statement, so a period slice is a cross-section
+    #of the latest (or n-th latest) filings even when fiscal year ends differ. dates holds every company's own
+    #period labels ('FY 2025' or '2025-06') with None where a company has fewer periods.
+    #item(), period() and ticker() return views into values, nothing is copied
+    def __init__(self, values, tickers: list, items: list, dates, unit: str = 'raw'):
+        self.values = values
+        self.tickers = list(tickers)
+        self.items = list(items)
+        self.periods = list(range(values.shape[2]))
+        self.dates = dates
+        self.unit = unit
+
+        self.ticker_index = {ticker: i for i, ticker in enumerate(self.tickers)}
+        self.item_index = {item: i for i, item in enumerate(self.items)}
+
+    @classmethod
+    def from_frames(cls, frames: dict, periods: int, unit: str = 'raw'):
+        #{ticker: item x period frame} with the same items in every frame, e.g. equity.statement(display='numeric')
+        tickers = list(frames)
+        items = list(next(iter(frames.values())).index) if frames else []
+
+        values = np.full((len(tickers), len(items), periods), np.nan)
+        dates = np.full((len(tickers), periods), None, dtype=object)
+        for i, frame in enumerate(frames.values()):
+            frame = frame.reindex(items).iloc[:, :periods]
+            values[i, :, :frame.shape[1]] = frame.to_numpy(dtype='float64')
+            dates[i, :frame.shape[1]] = [str(column) for column in frame.columns]
+        return cls(values, tickers, items, dates, unit)
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def lookup(self, index: dict, key, name: str):
+        if key not in index:
+            raise InvalidParameterError(f"Invalid {name} '{key}'. "
+                                        f"Please choose a valid {name}: {', '.join(str(k) for k in index)}")
+        return index[key]
+
+    def output(self, values, display: str, index, columns):
+        if display not in ('array', 'table'):
+            raise InvalidParameterError(f"Invalid display parameter '{display}'. "
+                                        f"Please choose a valid parameter: array, table")
+        if display == 'table':
+            return pd.DataFrame(values, index=index, columns=columns, copy=False)
+        return values
+
+    def item(self, item: str, display: str = 'array'):
+        #ticker x period
+        values = self.values[:, self.lookup(self.item_index, item, 'item'), :]
+        return self.output(values, display, pd.Index(self.tickers, name='Ticker'), self.periods)
+
+    def period(self, period: int, display: str = 'array'):
+        #ticker x item
+        values = self.values[:, :, self.lookup(dict(zip(self.periods, self.periods)), period, 'period')]
+        return self.output(values, display, pd.Index(self.tickers, name='Ticker'), self.items)
+
+    def ticker(self, ticker: str, display: str = 'array'):
+        #item x period, labelled with the company's own period dates in table form
+        i = self.lookup(self.ticker_index, ticker, 'ticker')
+        columns = [date if date is not None else period for period, date in zip(self.periods, self.dates[i])]
+        return self.output(self.values[i], display, self.items, columns)
+
+    def to_frame(self):
+        #(ticker, item) x period, the reshape of the contiguous array is itself a view
+        index = pd.MultiIndex.from_product([self.tickers, self.items], names=['Ticker', 'Item'])
+        return pd.DataFrame(self.values.reshape(-1, self.values.shape[2]), index=index, columns=self.periods, copy=False)
+
+#------------------------------------------------------------------------------------------
+#equity.stats() annual ratios, grouped and named as in its json output
+ratio_groups = {
+    'profitability': ['gross margin', 'ebit margin', 'net margin', 'roa', 'roe'],
+    'liquidity': ['current ratio', 'quick ratio', 'cash ratio'],
+    'leverage': ['debt to equity', 'debt to assets', 'interest coverage ratio'],
+    'efficiency': ['inventory turnover', 'receivables turnover', 'payables turnover', 'dio', 'dso', 'dpo', 'cash conversion cycle'],
+    'valuation': ['pe', 'ps', 'pb', 'eps', 'dividend yield', 'dividend payout ratio', 'enterprise value', 'market cap', 'ev/ebitda', 'ev/ebit'],
+    'cash flow': ['fcff_DA.WC', 'fcff_DA.WC.otherNonCash', 'fcfe_DA.WC', 'fcfe_DA.WC.otherNonCash'],
+    'growth': ['revenue growth rate', 'ebit growth rate'],
+}
+
+ratio_items = [ratio for group in ratio_groups.values() for ratio in group]
+
+unit_scale = {'raw': 1, 'thousand': 1000, 'million': 1000000}
+
+def ratios(panel: Panel, price=None, shares=None, eps=None):
+    #every ratio of every ticker and period as whole-array operations on (ticker, period) slices of an 'all' statement panel.
+    #price (period end close), shares (basic average shares) and eps are optional (ticker, period) arrays, the valuation
+    #ratios are NaN without them. the period after p is the year (or quarter) before it, used for averages and growth
+    T, _, P = panel.shape
+    missing = np.full((T, P), np.nan)
+    price = missing if price is None else np.asarray(price, dtype='float64')
+    shares = missing if shares is None else np.asarray(shares, dtype='float64')
+    eps = missing if eps is None else np.asarray(eps, dtype='float64')
+
+    item = panel.item
+    def prior(x):
+        return np.concatenate((x[:, 1:], np.full((T, 1), np.nan)), axis=1)
+
+    out = {}
+    with np.errstate(divide='ignore', invalid='ignore'):
+        #PROFITABILITY
+        out['gross margin'] = item('Gross Profit') / item('Total Revenue')
+        out['ebit margin'] = item('EBIT') / item('Total Revenue')
+        out['net margin'] = item('Net Income') / item('Total Revenue')
+        out['roa'] = item('Net Income') / item('Total Assets')
+        out['roe'] = item('Net Income') / item('Total Equity')
+
+        #LIQUIDITY
+        out['current ratio'] = item('Total Current Assets') / item('Total Current Liabilities')
+        out['quick ratio'] = (item('Total Current Assets') - item('Inventory')) / item('Total Current Liabilities')
+        out['cash ratio'] = item('Cash And Cash Equivalents') / item('Total Current Liabilities')
+
+        #LEVERAGE
+        out['debt to equity'] = item('Total Liabilities') / item('Total Equity')
+        out['debt to assets'] = item('Total Liabilities') / item('Total Assets')
+        out['interest coverage ratio'] = item('EBIT') / item('Interest Expense')
+
+        #EFFICIENCY
+        out['inventory turnover'] = item('Cost Of Revenue') / ((item('Inventory') + prior(item('Inventory'))) / 2)
+        out['receivables turnover'] = item('Total Revenue') / ((item('Accounts Receivable') + prior(item('Accounts Receivable'))) / 2)
+        out['payables turnover'] = item('Cost Of Revenue') / ((item('Accounts Payable') + prior(item('Accounts Payable'))) / 2)
+        out['dio'] = 365 / out['inventory turnover']
+        out['dso'] = 365 / out['receivables turnover']
+        out['dpo'] = 365 / out['payables turnover']
+        out['cash conversion cycle'] = out['dso'] + out['dio'] - out['dpo']
+
+        #VALUATION
+        out['market cap'] = (price * shares) / unit_scale[panel.unit]
+        out['pe'] = out['market cap'] / item('Net Income')
+        out['ps'] = out['market cap'] / item('Total Revenue')
+        out['pb'] = out['market cap'] / item('Total Equity')
+        out['eps'] = eps
+        out['dividend yield'] = -item('Cash Dividends Paid') / out['market cap']
+        out['dividend payout ratio'] = -item('Cash Dividends Paid') / item('Net Income')
+        out['enterprise value'] = out['market cap'] + item('Total Liabilities') - item('Cash And Cash Equivalents')
+        out['ev/ebitda'] = out['enterprise value'] / item('EBITDA')
+        out['ev/ebit'] = out['enterprise value'] / item('EBIT')
+
+        #CASH FLOW
+        out['fcff_DA.WC'] = item('EBIT') * (1 - (item('Tax Provision') / item('Pretax Income'))) + item('Depreciation and Amortization') + item('Change In Working Capital') + item('Capital Expenditure')
+        out['fcff_DA.WC.otherNonCash'] = out['fcff_DA.WC'] + item('Other Operating Cash Flow')
+        out['fcfe_DA.WC'] = item('Net Income') + item('Depreciation and Amortization') + item('Change In Working Capital') + item('Capital Expenditure') + item('Net Issuance/Payments Of Debt')
+        out['fcfe_DA.WC.otherNonCash'] = item('Operating Cash Flow') + item('Capital Expenditure') + item('Net Issuance/Payments Of Debt')
+
+        #GROWTH
+        out['revenue growth rate'] = (item('Total Revenue') / prior(item('Total Revenue'))) - 1
+        out['ebit growth rate'] = (item('EBIT') / prior(item('EBIT'))) - 1
+
+    values = np.empty((T, len(ratio_items), P))
+    for i, ratio in enumerate(ratio_items):
+        values[:, i, :] = out[ratio]
+    return Panel(values, panel.tickers, ratio_items, panel.dates, panel.unit)
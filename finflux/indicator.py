@@ -1,15 +1,18 @@
-from finflux.base_var import Config
+from finflux.base_var import Config, Transport, LazyModule
+from finflux.cache import History
+from finflux.serialize import records
+from finflux.clients import FRED, BLS, BEA
+from finflux.render import subplots, finish
 
-import yfinance as yf # type: ignore
 import numpy as np # type: ignore
-import requests # type: ignore
 import pandas as pd # type: ignore
 from datetime import timedelta, datetime, date
 import json
 from dateutil.relativedelta import relativedelta
-import matplotlib.pyplot as plt
 from pandas.tseries.offsets import BDay
-from matplotlib.ticker import FuncFormatter
+
+yf = LazyModule('yfinance')
+mticker = LazyModule('matplotlib.ticker')
 
 #------------------------------------------------------------------------------------------
 class InvalidParameterError(Exception):
@@ -63,28 +66,10 @@ class indicator:
             raise MissingConfigObject('Missing bea_apikey. Please set your BEA api key using the set_config() function.')
 
         #RAW DATA/OBSERVATION-----------------------------------------------------------BEA
-        url = f'{Config.bea_baseurl}/?&UserID={Config.bea_apikey}' + '&method=GetData' + '&datasetname=NIPA' + f'&TableName={identifiers[type][0]}' + '&Frequency=Q' + '&Year=X'
-        response = requests.get(url).json()
+        data_series = BEA.series(identifiers[type][0], 'Q', identifiers[type][1], f'{identifiers[type][2]}')
         #----------------------------------------------------------------------------------
 
-        data_list = response['BEAAPI']['Results']['Data']
-
-        quarter_to_month = {
-                    'Q1': '-03-01',
-                    'Q2': '-06-01',
-                    'Q3': '-09-01',
-                    'Q4': '-12-01',
-                }
-
-        data_dict = {}
-        for i in data_list:
-            if i['SeriesCode'] == identifiers[type][1]:
-                data_value = i['DataValue']
-                data_value = data_value.replace(',','')
-                date = i['TimePeriod'][0:4] + quarter_to_month[i['TimePeriod'][4:6]]
-                data_dict[date] = int(data_value) if type!='d' else float(data_value)
-
-        data_df = pd.DataFrame.from_dict(data_dict, orient='index', columns=[f'{identifiers[type][2]}'])
+        data_df = (data_series.astype(int) if type!='d' else data_series).to_frame()
 
         #PARAMETER - FIGURE ===============================================================
         if figure == 'raw':
@@ -109,12 +94,11 @@ class indicator:
         if period == 'max':
             data_df = data_df
         elif period == 'ytd':
-            current_year = str(datetime.now().year)
-            data_df = data_df[data_df.index.str[0:4] == current_year]
+            current_year = datetime.now().year
+            data_df = data_df[data_df.index.year == current_year]
         elif period != 'max' or period != 'ytd':
             data_df = data_df.iloc[period_to_df[period]:]
         
-        data_df.index = pd.to_datetime(data_df.index) # converting all row indices to datetime objects
         data_df.index.name = 'Date'
 
         #PARAMETER - DISPLAY ==============================================================
@@ -122,22 +106,13 @@ class indicator:
             output = data_df
             return output
         elif display == 'json':
-            data_df.index = data_df.index.strftime('%Y-%m-%d')
-            
-            data_json_list = []
-            for index, row in data_df.iterrows():
-                a = {
-                    'Date': index,
-                    f'{data_df.columns[0]}': float(row[f'{data_df.columns[0]}'])
-                }
-                data_json_list.append(a)
-            output = data_json_list
+            output = records(data_df)
             return output
         else:
             if figure in ('n', 'r'):
                 data_df[f'{data_df.columns[0]}'] = data_df[f'{data_df.columns[0]}'] * 1000000
 
-            fig, ax = plt.subplots(figsize=(10, 4.5), dpi=300)
+            fig, ax = subplots(figsize=(10, 4.5), dpi=300)
 
             if display == 'bar': ax.bar(data_df.index, data_df[data_df.columns[0]], width=40)
             elif display == 'line':
@@ -193,22 +168,15 @@ class indicator:
                     else:
                         return f'{x:.0f}'
 
-                ax.yaxis.set_major_formatter(FuncFormatter(human_format))
-            #SAVE--------------------------------------------------------------------------
-            if save:
-                figure_dict = {
-                    'raw': 'RAW',
-                    'yoy': 'YoY',
-                    'pop': 'QoQ'
-                }
-
-                plt.savefig(f'{identifiers[type][4]}_{figure_dict[figure]}_{data_df.index[0].strftime('%b%Y')}_{data_df.index[-1].strftime('%b%Y')}.png', dpi=300, bbox_inches='tight')
+                ax.yaxis.set_major_formatter(mticker.FuncFormatter(human_format))
+            #SAVE/SHOW---------------------------------------------------------------------
+            figure_dict = {
+                'raw': 'RAW',
+                'yoy': 'YoY',
+                'pop': 'QoQ'
+            }
 
-            #SHOW--------------------------------------------------------------------------
-            if show:
-                plt.show()
-            elif show == False:
-                plt.close(fig)
+            finish(fig, f'{identifiers[type][4]}_{figure_dict[figure]}_{data_df.index[0].strftime('%b%Y')}_{data_df.index[-1].strftime('%b%Y')}.png', show, save)
 #------------------------------------------------------------------------------------------
     def price_index(self, display: str = 'table', type: str = 'c', period: str = '5y', figure: str = 'yoy', show: str = True, save: str = False): 
         valid_params = {'valid_display': ['table', 'json', 'line', 'bar'],
@@ -231,84 +199,22 @@ class indicator:
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
 
         identifiers = {
-            'c': ['CUUR0000SA0', 'CPI (Index)', 'Consumer Price Index', 'ConsumerPriceIndex'], #1913
-            'p': ['WPUFD4', 'PPI (Index)', 'Producer Price Index', 'ProducerPriceIndex'], #2009
-            'cc': ['CUUR0000SA0L1E', 'Core CPI (Index)', 'Core Consumer Price Index', 'CoreConsumerPriceIndex'], #1957
-            'cp': ['WPUFD49104', 'Core PPI (Index)', 'Core Producer Price Index', 'CoreProducerPriceIndex'] #2010
+            'c': ['CUUR0000SA0', 'CPI (Index)', 'Consumer Price Index', 'ConsumerPriceIndex', 1911], #1913
+            'p': ['WPUFD4', 'PPI (Index)', 'Producer Price Index', 'ProducerPriceIndex', 1991], #2009
+            'cc': ['CUUR0000SA0L1E', 'Core CPI (Index)', 'Core Consumer Price Index', 'CoreConsumerPriceIndex', 1951], #1957
+            'cp': ['WPUFD49104', 'Core PPI (Index)', 'Core Producer Price Index', 'CoreProducerPriceIndex', 1991] #2010
         }
 
         if Config.bls_apikey is None:
             raise MissingConfigObject('Missing bls_apikey. Please set your BLS api key using the set_config() function.')
 
         #RAW DATA/OBSERVATION-----------------------------------------------------------BLS
-        if period != 'max':
-            end_year = str(datetime.now().year)
-            start_year = str(datetime.now().year - 11)
-            
-            headers = {'Content-type': 'application/json'}
-            data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":start_year, "endyear":end_year, 'registrationkey':Config.bls_apikey})
-            response = requests.post(Config.bls_baseurl, data=data, headers=headers).json()
-
-            data_list = response['Results']['series'][0]['data'][::-1]
-
-        elif period == 'max':
-            end_year = str(datetime.now().year)
-            headers = {'Content-type': 'application/json'}
-
-            def dlist(response):
-                return response['Results']['series'][0]['data']
-
-            data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":'2011', "endyear":end_year, 'registrationkey':Config.bls_apikey})
-            response_1 = requests.post(Config.bls_baseurl, data=data, headers=headers).json()
-            data_list = dlist(response_1)
-
-            data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":'1991', "endyear":'2010', 'registrationkey':Config.bls_apikey})
-            response_2 = requests.post(Config.bls_baseurl, data=data, headers=headers).json()
-            data_list.extend(dlist(response_2))
-
-            if type not in ('p', 'cp'):
-                data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":'1971', "endyear":'1990', 'registrationkey':Config.bls_apikey})
-                response_3 = requests.post(Config.bls_baseurl, data=data, headers=headers).json()
-                data_list.extend(dlist(response_3))
-
-                data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":'1951', "endyear":'1970', 'registrationkey':Config.bls_apikey})
-                response_4 = requests.post(Config.bls_baseurl, data=data, headers=headers).json()
-                data_list.extend(dlist(response_4))
-
-                if type not in ('cc'):
-                    data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":'1931', "endyear":'1950', 'registrationkey':Config.bls_apikey})
-                    response_5 = requests.post(Config.bls_baseurl, data=data, headers=headers).json()
-                    data_list.extend(dlist(response_5))
-
-                    data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":'1911', "endyear":'1930', 'registrationkey':Config.bls_apikey})
-                    response_6 = requests.post(Config.bls_baseurl, data=data, headers=headers).json()
-                    data_list.extend(dlist(response_6))
-            
-            data_list = data_list[::-1]
-
+        #'max' requests everything back to the series' first year, all 20 year windows at once
+        start_year = datetime.now().year - 11 if period != 'max' else identifiers[type][4]
+        data_list = BLS.observations([identifiers[type][0]], start_year)[identifiers[type][0]]
         #----------------------------------------------------------------------------------
 
-        month_to_month = {
-                    'M01': '-01-01',
-                    'M02': '-02-01',
-                    'M03': '-03-01',
-                    'M04': '-04-01',
-                    'M05': '-05-01',
-                    'M06': '-06-01',
-                    'M07': '-07-01',
-                    'M08': '-08-01',
-                    'M09': '-09-01',
-                    'M10': '-10-01',
-                    'M11': '-11-01',
-                    'M12': '-12-01',
-                }
-
-        data_dict = {}
-        for i in data_list:
-            date = i['year'] + month_to_month[i['period']]
-            data_dict[date] = float(i['value'])
-
-        data_df = pd.DataFrame.from_dict(data_dict, orient='index', columns=[f'{identifiers[type][1]}'])
+        data_df = BLS.parse(data_list, f'{identifiers[type][1]}').to_frame()
 
         #PARAMETER - FIGURE ================================================================
         if figure == 'raw':
@@ -333,12 +239,11 @@ class indicator:
         if period == 'max':
             data_df = data_df
         elif period == 'ytd':
-            current_year = str(datetime.now().year)
-            data_df = data_df[data_df.index.str[0:4] == current_year]
+            current_year = datetime.now().year
+            data_df = data_df[data_df.index.year == current_year]
         elif period != 'max' or period != 'ytd':
             data_df = data_df.iloc[period_to_df[period]:]
         
-        data_df.index = pd.to_datetime(data_df.index) # converting all row indices to datetime objects
         data_df.index.name = 'Date'
 
         #PARAMETER - DISPLAY ==============================================================
@@ -346,19 +251,10 @@ class indicator:
             output = data_df
             return output
         elif display == 'json':
-            data_df.index = data_df.index.strftime('%Y-%m-%d')
-
-            data_json_list = []
-            for index, row in data_df.iterrows():
-                a = {
-                    'Date': index,
-                    f'{data_df.columns[0]}': float(row[f'{data_df.columns[0]}'])
-                }
-                data_json_list.append(a)
-            output = data_json_list
+            output = records(data_df)
             return output
         else:
-            fig, ax = plt.subplots(figsize=(10, 4.5), dpi=300)
+            fig, ax = subplots(figsize=(10, 4.5), dpi=300)
 
             if display == 'bar': ax.bar(data_df.index, data_df[data_df.columns[0]], width=10)
             elif display == 'line':
@@ -400,21 +296,14 @@ class indicator:
                 label.set_fontname('Arial')
 
             ax.set_axisbelow(True) #making the grid and everything below the actual data line
-            #SAVE--------------------------------------------------------------------------
-            if save:
-                figure_dict = {
-                    'raw': 'RAW',
-                    'yoy': 'YoY',
-                    'pop': 'MoM'
-                }
-
-                plt.savefig(f'{identifiers[type][3]}_{figure_dict[figure]}_{data_df.index[0].strftime('%b%Y')}_{data_df.index[-1].strftime('%b%Y')}.png', dpi=300, bbox_inches='tight')
+            #SAVE/SHOW---------------------------------------------------------------------
+            figure_dict = {
+                'raw': 'RAW',
+                'yoy': 'YoY',
+                'pop': 'MoM'
+            }
 
-            #SHOW--------------------------------------------------------------------------
-            if show:
-                plt.show()
-            elif show == False:
-                plt.close(fig)
+            finish(fig, f'{identifiers[type][3]}_{figure_dict[figure]}_{data_df.index[0].strftime('%b%Y')}_{data_df.index[-1].strftime('%b%Y')}.png', show, save)
 #------------------------------------------------------------------------------------------
     def pce(self, display: str = 'table', type: str = 'raw', period: str = '5y', figure: str = 'yoy', show: str = True, save: str = False): 
         valid_params = {'valid_display': ['table', 'json', 'line', 'bar'],
@@ -445,36 +334,10 @@ class indicator:
             raise MissingConfigObject('Missing bea_apikey. Please set your BEA api key using the set_config() function.')
 
         #RAW DATA/OBSERVATION-----------------------------------------------------------BEA
-        url = f'{Config.bea_baseurl}/?&UserID={Config.bea_apikey}' + '&method=GetData' + '&datasetname=NIPA' + f'&TableName={identifiers[type][0]}' + '&Frequency=M' + '&Year=X'
-        response = requests.get(url).json()
+        data_series = BEA.series(identifiers[type][0], 'M', identifiers[type][1], f'{identifiers[type][2]}')
         #----------------------------------------------------------------------------------
 
-        data_list = response['BEAAPI']['Results']['Data']
-
-        month_to_month = {
-                    'M01': '-01-01',
-                    'M02': '-02-01',
-                    'M03': '-03-01',
-                    'M04': '-04-01',
-                    'M05': '-05-01',
-                    'M06': '-06-01',
-                    'M07': '-07-01',
-                    'M08': '-08-01',
-                    'M09': '-09-01',
-                    'M10': '-10-01',
-                    'M11': '-11-01',
-                    'M12': '-12-01',
-                }
-
-        data_dict = {}
-        for i in data_list:
-            if i['SeriesCode'] == identifiers[type][1]:
-                data_value = i['DataValue']
-                data_value = data_value.replace(',','')
-                date = i['TimePeriod'][0:4] + month_to_month[i['TimePeriod'][4:7]]
-                data_dict[date] = float(data_value)
-
-        data_df = pd.DataFrame.from_dict(data_dict, orient='index', columns=[f'{identifiers[type][2]}'])
+        data_df = data_series.to_frame()
 
         #PARAMETER - FIGURE ================================================================
         if figure == 'raw':
@@ -499,12 +362,11 @@ class indicator:
         if period == 'max':
             data_df = data_df
         elif period == 'ytd':
-            current_year = str(datetime.now().year)
-            data_df = data_df[data_df.index.str[0:4] == current_year]
+            current_year = datetime.now().year
+            data_df = data_df[data_df.index.year == current_year]
         elif period != 'max' or period != 'ytd':
             data_df = data_df.iloc[period_to_df[period]:]
 
-        data_df.index = pd.to_datetime(data_df.index) # converting all row indices to datetime objects
         data_df.index.name = 'Date'
 
         #PARAMETER - DISPLAY ==============================================================
@@ -512,19 +374,10 @@ class indicator:
             output = data_df
             return output
         elif display == 'json':
-            data_df.index = data_df.index.strftime('%Y-%m-%d')
-
-            data_json_list = []
-            for index, row in data_df.iterrows():
-                a = {
-                    'Date': index,
-                    f'{data_df.columns[0]}': float(row[f'{data_df.columns[0]}'])
-                }
-                data_json_list.append(a)
-            output = data_json_list
+            output = records(data_df)
             return output
         else:
-            fig, ax = plt.subplots(figsize=(10, 4.5), dpi=300)
+            fig, ax = subplots(figsize=(10, 4.5), dpi=300)
 
             if display == 'bar': ax.bar(data_df.index, data_df[data_df.columns[0]], width=10)
             elif display == 'line':
@@ -566,21 +419,14 @@ class indicator:
                 label.set_fontname('Arial')
 
             ax.set_axisbelow(True) #making the grid and everything below the actual data line
-            #SAVE--------------------------------------------------------------------------
-            if save:
-                figure_dict = {
-                    'raw': 'RAW',
-                    'yoy': 'YoY',
-                    'pop': 'MoM'
-                }
-
-                plt.savefig(f'{identifiers[type][4]}_{figure_dict[figure]}_{data_df.index[0].strftime('%b%Y')}_{data_df.index[-1].strftime('%b%Y')}.png', dpi=300, bbox_inches='tight')
+            #SAVE/SHOW---------------------------------------------------------------------
+            figure_dict = {
+                'raw': 'RAW',
+                'yoy': 'YoY',
+                'pop': 'MoM'
+            }
 
-            #SHOW--------------------------------------------------------------------------
-            if show:
-                plt.show()
-            elif show == False:
-                plt.close(fig)
+            finish(fig, f'{identifiers[type][4]}_{figure_dict[figure]}_{data_df.index[0].strftime('%b%Y')}_{data_df.index[-1].strftime('%b%Y')}.png', show, save)
 #------------------------------------------------------------------------------------------
     def unemployment(self, display: str = 'table', type: str = 'U-3', period: str = '5y', show: str = True, save: str = False): 
         valid_params = {'valid_display': ['table', 'json', 'line', 'bar'],
@@ -601,88 +447,29 @@ class indicator:
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
 
         identifiers = {
-            'U-3': ['LNS14000000', 'UNRATE [U-3]', 'Unemployment Rate (U-3)','UnrateU3'], #1943
-            'U-6': ['LNS13327709', 'UNRATE [U-6]', 'Unemployment Rate (U-6)', 'UnrateU6'], #1994
-            'g=male': ['LNS14000025', 'UNRATE [Male]', 'Unemployment Rate (Male)', 'UnrateMale'], #1948
-            'g=female': ['LNS14000026', 'UNRATE [Female]', 'Unemployment Rate (Female)', 'UnrateFemale'], #1948
-            'r=white': ['LNS14000003', 'UNRATE [White]', 'Unemployment Rate (White)', 'UnrateWhite'], #1954
-            'r=black': ['LNS14000006', 'UNRATE [Black]', 'Unemployment Rate (Black)', 'UnrateBlack'], #1972
-            'r=asian': ['LNS14032183', 'UNRATE [Asian]', 'Unemployment Rate (Asian)', 'UnrateAsian'], #2003
-            'r=hispanic': ['LNS14000009', 'UNRATE [Hispanic]', 'Unemployment Rate (Hispanic)', 'UnrateHispanic'], #1973
-            'e<hs': ['LNS14027659', 'UNRATE [<High School]', 'Unemployment Rate (Less than HS Education)', 'UnrateLessThanHS'], #1992
-            'e=hs': ['LNS14027660', 'UNRATE [=High School]', 'Unemployment Rate (HS Diploma)', 'UnrateHS'], #1992
-            'e<bach': ['LNS14027689', 'UNRATE [<Bachelor]', 'Unemployment Rate (Less than Bachelor\'s Degree)', 'UnrateLessThanBachelor'], #1992
-            'e>=bach': ['LNS14027662', 'UNRATE [>=Bachelor]', 'Unemployment Rate (Greater than or Equal to Bachelor\'s Degree)', 'UnrateMoreThanOrEqualToBachelor'], #1992
+            'U-3': ['LNS14000000', 'UNRATE [U-3]', 'Unemployment Rate (U-3)','UnrateU3', 1941], #1943
+            'U-6': ['LNS13327709', 'UNRATE [U-6]', 'Unemployment Rate (U-6)', 'UnrateU6', 1981], #1994
+            'g=male': ['LNS14000025', 'UNRATE [Male]', 'Unemployment Rate (Male)', 'UnrateMale', 1941], #1948
+            'g=female': ['LNS14000026', 'UNRATE [Female]', 'Unemployment Rate (Female)', 'UnrateFemale', 1941], #1948
+            'r=white': ['LNS14000003', 'UNRATE [White]', 'Unemployment Rate (White)', 'UnrateWhite', 1941], #1954
+            'r=black': ['LNS14000006', 'UNRATE [Black]', 'Unemployment Rate (Black)', 'UnrateBlack', 1961], #1972
+            'r=asian': ['LNS14032183', 'UNRATE [Asian]', 'Unemployment Rate (Asian)', 'UnrateAsian', 2001], #2003
+            'r=hispanic': ['LNS14000009', 'UNRATE [Hispanic]', 'Unemployment Rate (Hispanic)', 'UnrateHispanic', 1961], #1973
+            'e<hs': ['LNS14027659', 'UNRATE [<High School]', 'Unemployment Rate (Less than HS Education)', 'UnrateLessThanHS', 1981], #1992
+            'e=hs': ['LNS14027660', 'UNRATE [=High School]', 'Unemployment Rate (HS Diploma)', 'UnrateHS', 1981], #1992
+            'e<bach': ['LNS14027689', 'UNRATE [<Bachelor]', 'Unemployment Rate (Less than Bachelor\'s Degree)', 'UnrateLessThanBachelor', 1981], #1992
+            'e>=bach': ['LNS14027662', 'UNRATE [>=Bachelor]', 'Unemployment Rate (Greater than or Equal to Bachelor\'s Degree)', 'UnrateMoreThanOrEqualToBachelor', 1981], #1992
         }
 
         if Config.bls_apikey is None:
             raise MissingConfigObject('Missing bls_apikey. Please set your BLS api key using the set_config() function.')
 
         #RAW DATA/OBSERVATION-----------------------------------------------------------BLS
-        if period != 'max':
-            end_year = str(datetime.now().year)
-            start_year = str(datetime.now().year - 11)
-            
-            headers = {'Content-type': 'application/json'}
-            data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":start_year, "endyear":end_year, 'registrationkey':Config.bls_apikey})
-            response = requests.post(Config.bls_baseurl, data=data, headers=headers).json()
-
-            data_list = response['Results']['series'][0]['data'][::-1]
-
-        elif period == 'max':
-            end_year = str(datetime.now().year)
-            headers = {'Content-type': 'application/json'}
-
-            def dlist(response):
-                return response['Results']['series'][0]['data']
-
-            data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":'2021', "endyear":end_year, 'registrationkey':Config.bls_apikey})
-            response_1 = requests.post(Config.bls_baseurl, data=data, headers=headers).json()
-            data_list = dlist(response_1)
-
-            data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":'2001', "endyear":'2020', 'registrationkey':Config.bls_apikey})
-            response_2 = requests.post(Config.bls_baseurl, data=data, headers=headers).json()
-            data_list.extend(dlist(response_2))
-
-            if type not in ('r=asian'):
-                data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":'1981', "endyear":'2000', 'registrationkey':Config.bls_apikey})
-                response_3 = requests.post(Config.bls_baseurl, data=data, headers=headers).json()
-                data_list.extend(dlist(response_3))
-
-                if type not in ('U-6', 'e<hs', 'e=hs', 'e<bach', 'e>=bach'):
-                    data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":'1961', "endyear":'1980', 'registrationkey':Config.bls_apikey})
-                    response_4 = requests.post(Config.bls_baseurl, data=data, headers=headers).json()
-                    data_list.extend(dlist(response_4))
-
-                    if type not in ('r=black', 'r=hispanic'):
-                        data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":'1941', "endyear":'1960', 'registrationkey':Config.bls_apikey})
-                        response_5 = requests.post(Config.bls_baseurl, data=data, headers=headers).json()
-                        data_list.extend(dlist(response_5))
-            
-            data_list = data_list[::-1]
+        start_year = datetime.now().year - 11 if period != 'max' else identifiers[type][4]
+        data_list = BLS.observations([identifiers[type][0]], start_year)[identifiers[type][0]]
         #----------------------------------------------------------------------------------
 
-        month_to_month = {
-                    'M01': '-01-01',
-                    'M02': '-02-01',
-                    'M03': '-03-01',
-                    'M04': '-04-01',
-                    'M05': '-05-01',
-                    'M06': '-06-01',
-                    'M07': '-07-01',
-                    'M08': '-08-01',
-                    'M09': '-09-01',
-                    'M10': '-10-01',
-                    'M11': '-11-01',
-                    'M12': '-12-01',
-                }
-
-        data_dict = {}
-        for i in data_list:
-            date = i['year'] + month_to_month[i['period']]
-            data_dict[date] = float(i['value'])
-
-        data_df = pd.DataFrame.from_dict(data_dict, orient='index', columns=[f'{identifiers[type][1]}'])
+        data_df = BLS.parse(data_list, f'{identifiers[type][1]}').to_frame()
 
         #PARAMETER - PERIOD ================================================================
         period_to_df = {
@@ -695,12 +482,11 @@ class indicator:
         if period == 'max':
             data_df = data_df
         elif period == 'ytd':
-            current_year = str(datetime.now().year)
-            data_df = data_df[data_df.index.str[0:4] == current_year]
+            current_year = datetime.now().year
+            data_df = data_df[data_df.index.year == current_year]
         elif period != 'max' or period != 'ytd':
             data_df = data_df.iloc[period_to_df[period]:]
         
-        data_df.index = pd.to_datetime(data_df.index) # converting all row indices to datetime objects
         data_df.index.name = 'Date'
 
         #PARAMETER - DISPLAY ==============================================================
@@ -708,19 +494,10 @@ class indicator:
             output = data_df
             return output
         elif display == 'json':
-            data_df.index = data_df.index.strftime('%Y-%m-%d')
-
-            data_json_list = []
-            for index, row in data_df.iterrows():
-                a = {
-                    'Date': index,
-                    f'{data_df.columns[0]}': float(row[f'{data_df.columns[0]}'])
-                }
-                data_json_list.append(a)
-            output = data_json_list
+            output = records(data_df)
             return output
         else:
-            fig, ax = plt.subplots(figsize=(10, 4.5), dpi=300)
+            fig, ax = subplots(figsize=(10, 4.5), dpi=300)
 
             if display == 'bar': 
                 ax.bar(data_df.index, data_df[data_df.columns[0]], width=10)
@@ -758,15 +535,8 @@ class indicator:
                 label.set_fontname('Arial')
 
             ax.set_axisbelow(True) #making the grid and everything below the actual data line
-            #SAVE--------------------------------------------------------------------------
-            if save:
-                plt.savefig(f'{identifiers[type][3]}_RAW_{data_df.index[0].strftime('%b%Y')}_{data_df.index[-1].strftime('%b%Y')}.png', dpi=300, bbox_inches='tight')
-
-            #SHOW--------------------------------------------------------------------------
-            if show:
-                plt.show()
-            elif show == False:
-                plt.close(fig)
+            #SAVE/SHOW---------------------------------------------------------------------
+            finish(fig, f'{identifiers[type][3]}_RAW_{data_df.index[0].strftime('%b%Y')}_{data_df.index[-1].strftime('%b%Y')}.png', show, save)
 #------------------------------------------------------------------------------------------
     def labor(self, display: str = 'table', type: str = 'participation', period: str = '5y', show: str = True, save: str = False): 
         valid_params = {'valid_display': ['table', 'json', 'line', 'bar'],
@@ -787,11 +557,11 @@ class indicator:
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
 
         identifiers = {
-            'participation': ['LNS11300000', 'Labor Force Participation Rate, Monthly', 0, 'LaborForceParticipationRate'], #1948 M
-            'payroll': ['CES0000000001', 'Nonfarm Payrolls, MoM Change', 0, 'NonfarmPayrolls'], #1939 M (this provides different figures from the one provided in the Employment Situation Summary which is the more widely used source for payroll data)
-            'quits': ['JTS000000000000000QUR', 'Quits Rate, Monthly', 0, 'QuitsRate'], #2001 M
-            'openings': ['JTS000000000000000JOR', 'Job Openings Rate, Monthly', 0, 'JobOpeningsRate'], #2001 M
-            'earnings': ['CES0500000003', 'Average Hourly Earnings, Monthly', 0, 'AverageHourlyEarnings'], #2006 M
+            'participation': ['LNS11300000', 'Labor Force Participation Rate, Monthly', 0, 'LaborForceParticipationRate', 1931], #1948 M
+            'payroll': ['CES0000000001', 'Nonfarm Payrolls, MoM Change', 0, 'NonfarmPayrolls', 1931], #1939 M (this provides different figures from the one provided in the Employment Situation Summary which is the more widely used source for payroll data)
+            'quits': ['JTS000000000000000QUR', 'Quits Rate, Monthly', 0, 'QuitsRate', 1991], #2001 M
+            'openings': ['JTS000000000000000JOR', 'Job Openings Rate, Monthly', 0, 'JobOpeningsRate', 1991], #2001 M
+            'earnings': ['CES0500000003', 'Average Hourly Earnings, Monthly', 0, 'AverageHourlyEarnings', 1991], #2006 M
             'claims': ['ICSA', 'Initial Claims, Weekly', 1, 'InitialClaims'], # FRED (not BLS) 1967 W
         }
 
@@ -805,77 +575,19 @@ class indicator:
 
         #RAW DATA/OBSERVATION-----------------------------------------------------------BLS
         if type != 'claims':
-            if period != 'max':
-                end_year = str(datetime.now().year)
-                start_year = str(datetime.now().year - 11)
-                
-                headers = {'Content-type': 'application/json'}
-                data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":start_year, "endyear":end_year, 'registrationkey':Config.bls_apikey})
-                response = requests.post(Config.bls_baseurl, data=data, headers=headers).json()
-
-                data_list = response['Results']['series'][0]['data'][::-1]
-
-            elif period == 'max':
-                end_year = str(datetime.now().year)
-                headers = {'Content-type': 'application/json'}
-
-                def dlist(response):
-                    return response['Results']['series'][0]['data']
-
-                data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":'2011', "endyear":end_year, 'registrationkey':Config.bls_apikey})
-                response_1 = requests.post(Config.bls_baseurl, data=data, headers=headers).json()
-                data_list = dlist(response_1)
-
-                data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":'1991', "endyear":'2010', 'registrationkey':Config.bls_apikey})
-                response_2 = requests.post(Config.bls_baseurl, data=data, headers=headers).json()
-                data_list.extend(dlist(response_2))
-
-                if type not in ('quits', 'openings', 'earnings'):
-                    data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":'1971', "endyear":'1990', 'registrationkey':Config.bls_apikey})
-                    response_3 = requests.post(Config.bls_baseurl, data=data, headers=headers).json()
-                    data_list.extend(dlist(response_3))
-
-                    data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":'1951', "endyear":'1970', 'registrationkey':Config.bls_apikey})
-                    response_4 = requests.post(Config.bls_baseurl, data=data, headers=headers).json()
-                    data_list.extend(dlist(response_4))
-
-                    data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":'1931', "endyear":'1950', 'registrationkey':Config.bls_apikey})
-                    response_5 = requests.post(Config.bls_baseurl, data=data, headers=headers).json()
-                    data_list.extend(dlist(response_5))
-                
-                data_list = data_list[::-1]
+            start_year = datetime.now().year - 11 if period != 'max' else identifiers[type][4]
+            data_list = BLS.observations([identifiers[type][0]], start_year)[identifiers[type][0]]
 
         if type == 'claims':
-            FRED_url = f'https://api.stlouisfed.org/fred/series/observations?series_id={identifiers[type][0]}&api_key={Config.fred_apikey}&file_type=json'
-            data_list = requests.get(FRED_url).json()['observations']
+            #one extra year so the trailing point count taken below is always inside the window
+            data_list = FRED.observations(identifiers[type][0], observation_start=FRED.window_start(period, relativedelta(years=1)))
         #----------------------------------------------------------------------------------
 
-        month_to_month = {
-                    'M01': '-01-01',
-                    'M02': '-02-01',
-                    'M03': '-03-01',
-                    'M04': '-04-01',
-                    'M05': '-05-01',
-                    'M06': '-06-01',
-                    'M07': '-07-01',
-                    'M08': '-08-01',
-                    'M09': '-09-01',
-                    'M10': '-10-01',
-                    'M11': '-11-01',
-                    'M12': '-12-01',
-                }
-
-        data_dict = {}
         if type != 'claims':
-            for i in data_list:
-                date = i['year'] + month_to_month[i['period']]
-                data_dict[date] = float(i['value'])
+            data_df = BLS.parse(data_list, f'{identifiers[type][1]}').to_frame()
 
         elif type == 'claims':
-            for i in data_list:
-                data_dict[i['date']] = int(i['value'])
-
-        data_df = pd.DataFrame.from_dict(data_dict, orient='index', columns=[f'{identifiers[type][1]}'])
+            data_df = FRED.parse(data_list, f'{identifiers[type][1]}').astype(int).to_frame()
 
         #PARAMETER - PERIOD ================================================================
         period_to_df = {
@@ -888,8 +600,8 @@ class indicator:
         if period == 'max':
             data_df = data_df
         elif period == 'ytd':
-            current_year = str(datetime.now().year)
-            data_df = data_df[data_df.index.str[0:4] == current_year]
+            current_year = datetime.now().year
+            data_df = data_df[data_df.index.year == current_year]
         elif period != 'max' or period != 'ytd':
             if type == 'payroll':
                 data_df = (data_df - data_df.shift(1)) * 1000
@@ -898,7 +610,6 @@ class indicator:
             elif type != 'payroll':
                 data_df = data_df.iloc[period_to_df[period][identifiers[type][2]]:]
         
-        data_df.index = pd.to_datetime(data_df.index) # converting all row indices to datetime objects
         data_df.index.name = 'Date'
 
         #PARAMETER - DISPLAY ==============================================================
@@ -906,19 +617,10 @@ class indicator:
             output = data_df
             return output
         elif display == 'json':
-            data_df.index = data_df.index.strftime('%Y-%m-%d')
-
-            data_json_list = []
-            for index, row in data_df.iterrows():
-                a = {
-                    'Date': index,
-                    f'{data_df.columns[0]}': float(row[f'{data_df.columns[0]}'])
-                }
-                data_json_list.append(a)
-            output = data_json_list
+            output = records(data_df)
             return output
         else:
-            fig, ax = plt.subplots(figsize=(10, 4.5), dpi=300)
+            fig, ax = subplots(figsize=(10, 4.5), dpi=300)
 
             if display == 'bar': 
                 if type == 'claims':
@@ -978,16 +680,58 @@ class indicator:
                     else:
                         return f'{x:.0f}'
 
-            ax.yaxis.set_major_formatter(FuncFormatter(human_format))
-            #SAVE--------------------------------------------------------------------------
-            if save:
-                plt.savefig(f'{identifiers[type][3]}_RAW_{data_df.index[0].strftime('%b%Y')}_{data_df.index[-1].strftime('%b%Y')}.png', dpi=300, bbox_inches='tight')
+            ax.yaxis.set_major_formatter(mticker.FuncFormatter(human_format))
+            #SAVE/SHOW---------------------------------------------------------------------
+            finish(fig, f'{identifiers[type][3]}_RAW_{data_df.index[0].strftime('%b%Y')}_{data_df.index[-1].strftime('%b%Y')}.png', show, save)
+#------------------------------------------------------------------------------------------
+    def bls(self, series: list, display: str = 'table', period: str = '5y', workers: int = 8): 
+        valid_params = {'valid_display': ['table', 'json'],
+                        'valid_period': ['1y', '2y', '5y', '10y', 'max', 'ytd']}
+        
+        params = {'display': display,
+                  'period': period}
+
+        for param_key, param_value, valid_param in zip(params.keys(), params.values(), valid_params.values()):
+            if param_value not in valid_param:
+                raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
+                                            f"Please choose a valid parameter: {', '.join(valid_param)}")
+
+        if Config.bls_apikey is None:
+            raise MissingConfigObject('Missing bls_apikey. Please set your BLS api key using the set_config() function.')
+
+        #RAW DATA/OBSERVATION-----------------------------------------------------------BLS
+        #any number of BLS series ids (e.g. CPI, core CPI, PPI and core PPI together) are packed 50 per request
+        start_year = datetime.now().year - 11 if period != 'max' else 1911
+        data = BLS.observations(series, start_year, workers=workers)
+        #----------------------------------------------------------------------------------
+
+        #one column per series, aligned on a shared monthly index
+        data_df = pd.concat([BLS.parse(data_list, series_id) for series_id, data_list in data.items()], axis=1).sort_index()
+        data_df.index.name = 'Date'
 
-            #SHOW--------------------------------------------------------------------------
-            if show:
-                plt.show()
-            elif show == False:
-                plt.close(fig)
+        #PARAMETER - PERIOD ================================================================
+        period_to_df = {
+            '1y': -13,
+            '2y': -25,
+            '5y': -61,
+            '10y': -121
+        }
+
+        if period == 'max':
+            data_df = data_df
+        elif period == 'ytd':
+            current_year = datetime.now().year
+            data_df = data_df[data_df.index.year == current_year]
+        elif period != 'max' or period != 'ytd':
+            data_df = data_df.iloc[period_to_df[period]:]
+
+        #PARAMETER - DISPLAY ==============================================================
+        if display == 'table':
+            output = data_df
+            return output
+        elif display == 'json':
+            output = records(data_df)
+            return output
 #------------------------------------------------------------------------------------------
     def sentiment(self, display: str = 'table', type: str = 'c_mcsi', period: str = '5y', show: str = True, save: str = False): 
         valid_params = {'valid_display': ['table', 'json', 'line', 'bar'],
@@ -1028,56 +772,34 @@ class indicator:
         #RAW DATA/OBSERVATION--------------------------------------------------------------
         id = FRED_IDs[type][0]
 
-        FRED_url = f'{Config.fred_baseurl}series/observations?series_id={id}&api_key={Config.fred_apikey}&file_type=json'
-        FRED_yield = requests.get(FRED_url).json()
+        observations = FRED.observations(id, observation_start=FRED.window_start(period, relativedelta(years=1)))
+        data_series = FRED.parse(observations, f'{FRED_IDs[type][1]}')
 
         current_year = pd.Timestamp.now().year
         #----------------------------------------------------------------------------------
-
-        def is_numeric(str):
-            try:
-                float(str)
-                return True
-            except ValueError:
-                return False
         
         #PARAMETER - PERIOD ================================================================  
-        data = {}
         if period == 'max':
-            for data_point in FRED_yield['observations']:
-                data[data_point['date']] = (float(data_point['value']) if is_numeric(data_point['value']) else np.nan)
+            data_series = data_series
 
         elif period == 'ytd':
-            for data_point in FRED_yield['observations'][-15:]:
-                if data_point['date'][0:4] == str(current_year):
-                    data[data_point['date']] = (float(data_point['value']) if is_numeric(data_point['value']) else np.nan)
+            data_series = data_series.iloc[-15:]
+            data_series = data_series[data_series.index.year == current_year]
 
         else:
-            for data_point in FRED_yield['observations'][period_points[period]:]:
-                data[data_point['date']] = (float(data_point['value']) if is_numeric(data_point['value']) else np.nan)
+            data_series = data_series.iloc[period_points[period]:]
 
-        data_df = pd.DataFrame.from_dict(data, orient='index', columns=[f'{FRED_IDs[type][1]}'])
-        data_df.index = pd.to_datetime(data_df.index)
-        data_df.index.name = 'Date'
+        data_df = data_series.to_frame()
 
         #PARAMETER - DISPLAY ==============================================================
         if display == 'table':
             output = data_df
             return output
         elif display == 'json':
-            data_df.index = data_df.index.strftime('%Y-%m-%d')
-
-            data_json_list = []
-            for index, row in data_df.iterrows():
-                a = {
-                    'Date': index,
-                    f'{data_df.columns[0]}': float(row[f'{data_df.columns[0]}'])
-                }
-                data_json_list.append(a)
-            output = data_json_list
+            output = records(data_df)
             return output
         else:
-            fig, ax = plt.subplots(figsize=(10, 4.5), dpi=300)
+            fig, ax = subplots(figsize=(10, 4.5), dpi=300)
 
             if display == 'bar': ax.bar(data_df.index, data_df[data_df.columns[0]], width=10)
             elif display == 'line':
@@ -1114,15 +836,8 @@ class indicator:
                 label.set_fontname('Arial')
 
             ax.set_axisbelow(True) #making the grid and everything below the actual data line
-            #SAVE--------------------------------------------------------------------------
-            if save:
-                plt.savefig(f'{FRED_IDs[type][2]}_RAW_{data_df.index[0].strftime('%b%Y')}_{data_df.index[-1].strftime('%b%Y')}.png', dpi=300, bbox_inches='tight')
-
-            #SHOW--------------------------------------------------------------------------
-            if show:
-                plt.show()
-            elif show == False:
-                plt.close(fig)
+            #SAVE/SHOW---------------------------------------------------------------------
+            finish(fig, f'{FRED_IDs[type][2]}_RAW_{data_df.index[0].strftime('%b%Y')}_{data_df.index[-1].strftime('%b%Y')}.png', show, save)
 #------------------------------------------------------------------------------------------
     def fed_rate(self, display: str = 'table', interval: str = '1d', period: str = '5y', show: str = True, save: str = False): 
         valid_params = {'valid_display': ['table', 'json', 'line', 'bar'],
@@ -1170,26 +885,11 @@ class indicator:
             }
         }
 
-        def is_numeric(str):
-            try:
-                float(str)
-                return True
-            except ValueError:
-                return False
-
         #RAW DATA/OBSERVATION--------------------------------------------------------------
         id = FRED_IDs[interval][0]
 
-        FRED_url = f'{Config.fred_baseurl}series/observations?series_id={id}&api_key={Config.fred_apikey}&file_type=json'
-        FRED_rate = requests.get(FRED_url).json()
-        
-        data = {}
-        for data_point in FRED_rate['observations']:
-            data[data_point['date']] = (float(data_point['value']) if is_numeric(data_point['value']) else np.nan)
-        
-        data_df = pd.DataFrame.from_dict(data, orient='index', columns=[f'Federal Funds Rate ({FRED_IDs[interval][1]})'])
-        data_df.index = pd.to_datetime(data_df.index)
-        data_df.index.name= 'Date'
+        observations = FRED.observations(id, observation_start=FRED.window_start(period, relativedelta(years=1)))
+        data_df = FRED.parse(observations, f'Federal Funds Rate ({FRED_IDs[interval][1]})').to_frame()
 
         current_year = pd.Timestamp.now().year
         #----------------------------------------------------------------------------------
@@ -1204,12 +904,9 @@ class indicator:
 
         initial_dates = [pd.Timestamp(d) for d in initial_dates]
 
-        final_dates_list = []
-
-        for d in initial_dates:
-            while d not in data_df.index.tolist():
-                d = d + relativedelta(days=1)
-            final_dates_list.append(d)
+        #first observation on or after each date, resolved with a binary search on the sorted index
+        date_pos = data_df.index.searchsorted(initial_dates, side='left').clip(0, len(data_df.index) - 1)
+        final_dates_list = data_df.index[date_pos].tolist()
 
         final_dates = {
             '1y': final_dates_list[0],
@@ -1236,19 +933,10 @@ class indicator:
             output = data_df
             return output
         elif display == 'json':
-            data_df.index = data_df.index.strftime('%Y-%m-%d')
-
-            data_json_list = []
-            for index, row in data_df.iterrows():
-                a = {
-                    'Date': index,
-                    f'{data_df.columns[0]}': float(row[f'{data_df.columns[0]}'])
-                }
-                data_json_list.append(a)
-            output = data_json_list
+            output = records(data_df)
             return output
         else:
-            fig, ax = plt.subplots(figsize=(10, 4.5), dpi=300)
+            fig, ax = subplots(figsize=(10, 4.5), dpi=300)
 
             interval_to_dict = {
                     '1d': [0.3, 'Daily'],
@@ -1303,15 +991,8 @@ class indicator:
                 label.set_fontname('Arial')
 
             ax.set_axisbelow(True) #making the grid and everything below the actual data line
-            #SAVE--------------------------------------------------------------------------
-            if save:
-                plt.savefig(f'{FRED_IDs[interval][1].capitalize()}FedRate_{data_df.index[0].strftime('%b%Y')}_{data_df.index[-1].strftime('%b%Y')}.png', dpi=300, bbox_inches='tight')
-
-            #SHOW--------------------------------------------------------------------------
-            if show:
-                plt.show()
-            elif show == False:
-                plt.close(fig)
+            #SAVE/SHOW---------------------------------------------------------------------
+            finish(fig, f'{FRED_IDs[interval][1].capitalize()}FedRate_{data_df.index[0].strftime('%b%Y')}_{data_df.index[-1].strftime('%b%Y')}.png', show, save)
 #------------------------------------------------------------------------------------------
     def housing(self, display: str = 'table', type: str = 'starts', period: str = '5y', figure: str = 'raw', show: str = True, save: str = False): 
         valid_params = {'valid_display': ['table', 'json', 'line', 'bar'],
@@ -1342,25 +1023,19 @@ class indicator:
         }
         
         #RAW DATA/OBSERVATION----------------------------------------------------------FRED
-        FRED_url = f'{Config.fred_baseurl}series/observations?series_id={identifiers[type][0]}&api_key={Config.fred_apikey}&file_type=json'
-        data_list = requests.get(FRED_url).json()['observations']
+        #two extra years: one for the trailing point count taken below and one for the yoy shift
+        data_list = FRED.observations(identifiers[type][0], observation_start=FRED.window_start(period, relativedelta(years=2)))
         #----------------------------------------------------------------------------------
         
-        def is_numeric(str):
-            try:
-                float(str)
-                return True
-            except ValueError:
-                return False
-        
-        data_dict = {}
-        for i in data_list:
-            if identifiers[type][3] == 0:
-                data_dict[i['date']] = int(float(i['value'])) if is_numeric(i['value']) else np.nan
-            if identifiers[type][3] == 1:
-                data_dict[i['date']] = float(i['value']) if is_numeric(i['value']) else np.nan
+        data_series = FRED.parse(data_list, f'{identifiers[type][1]}')
 
-        data_df = pd.DataFrame.from_dict(data_dict, orient='index', columns=[f'{identifiers[type][1]}'])
+        if identifiers[type][3] == 0:
+            #monthly counts are whole units, kept as int unless a missing value forces float
+            data_series = np.trunc(data_series)
+            if not data_series.isna().any():
+                data_series = data_series.astype(int)
+
+        data_df = data_series.to_frame()
 
         if type == 'esales':
             data_df = data_df.drop(data_df.index[0])
@@ -1404,35 +1079,23 @@ class indicator:
         if period == 'max':
             data_df = data_df
         elif period == 'ytd':
-            current_year = str(datetime.now().year)
-            data_df = data_df[data_df.index.str[0:4] == current_year]
+            current_year = datetime.now().year
+            data_df = data_df[data_df.index.year == current_year]
         elif period != 'max' or period != 'ytd':
             data_df = data_df[period_to_df[period][identifiers[type][3]]:]
-        
-        data_df.index = pd.to_datetime(data_df.index) # converting all row indices to datetime objects
-        data_df.index.name = 'Date'
 
         #PARAMETER - DISPLAY ==============================================================
         if display == 'table':
             output = data_df
             return output
         elif display == 'json':
-            data_df.index = data_df.index.strftime('%Y-%m-%d')
-
-            data_json_list = []
-            for index, row in data_df.iterrows():
-                a = {
-                    'Date': index,
-                    f'{data_df.columns[0]}': float(row[f'{data_df.columns[0]}'])
-                }
-                data_json_list.append(a)
-            output = data_json_list
+            output = records(data_df)
             return output
         else:
             if figure in ('starts', 'nsales', 'esales'):
                 data_df[f'{data_df.columns[0]}'] = data_df[f'{data_df.columns[0]}'] * 1000
             
-            fig, ax = plt.subplots(figsize=(10, 4.5), dpi=300)
+            fig, ax = subplots(figsize=(10, 4.5), dpi=300)
 
             if display == 'bar': 
                 if type in ('30y_rate', '15y_rate'):
@@ -1503,31 +1166,24 @@ class indicator:
                     else:
                         return f'{x:.0f}'
 
-            ax.yaxis.set_major_formatter(FuncFormatter(human_format))
-            #SAVE--------------------------------------------------------------------------
-            if save:
-                if type in ('starts', 'nsales', 'esales'):
-                    figure_dict = {
-                        'raw': 'RAW',
-                        'yoy': 'YoY',
-                        'pop': 'MoM'
-                    }
-                elif type in ('30y_rate', '15y_rate'):
-                    figure_dict = {
-                        'raw': 'RAW',
-                        'yoy': 'YoY',
-                        'pop': 'WoW'
-                    }
-
-                plt.savefig(f'{identifiers[type][6]}_{figure_dict[figure]}_{data_df.index[0].strftime('%b%Y')}_{data_df.index[-1].strftime('%b%Y')}.png', dpi=300, bbox_inches='tight')
-
-            #SHOW--------------------------------------------------------------------------
-            if show:
-                plt.show()
-            elif show == False:
-                plt.close(fig)
+            ax.yaxis.set_major_formatter(mticker.FuncFormatter(human_format))
+            #SAVE/SHOW---------------------------------------------------------------------
+            if type in ('starts', 'nsales', 'esales'):
+                figure_dict = {
+                    'raw': 'RAW',
+                    'yoy': 'YoY',
+                    'pop': 'MoM'
+                }
+            elif type in ('30y_rate', '15y_rate'):
+                figure_dict = {
+                    'raw': 'RAW',
+                    'yoy': 'YoY',
+                    'pop': 'WoW'
+                }
+
+            finish(fig, f'{identifiers[type][6]}_{figure_dict[figure]}_{data_df.index[0].strftime('%b%Y')}_{data_df.index[-1].strftime('%b%Y')}.png', show, save)
 #------------------------------------------------------------------------------------------
-    def vix(self, display: str = 'table', period: str = '5y', start: str = None, end: str = None, interval: str = '1d', data: str = 'all', show: str = True, save: str = False):
+    def vix(self, display: str = 'table', period: str = '5y', start: str = None, end: str = None, interval: str = '1d', data: str = 'all', show: str = True, save: str = False, stream: bool = False):
         valid_params = {'valid_display': ['table', 'json', 'line'],
                         'valid_period' : ['1mo', '6mo', '1y', '2y', '5y', '10y', 'ytd', 'max'],
                         'valid_interval' : ['1d', '1wk', '1mo', '3mo'],
@@ -1549,9 +1205,9 @@ class indicator:
         #RAW DATA/OBSERVATIONS-------------------------------------------------------------
         #Note: start and end parameters will override any period parameter presence
         if start == None and end == None:
-            yf_download = yf.download('^VIX', period=period, interval=interval, ignore_tz=True, rounding=True, group_by='column', progress=False, auto_adjust=True)
+            yf_download = History.download('^VIX', period=period, interval=interval, rounding=True)
         elif start != None and end != None:
-            yf_download = yf.download('^VIX', start=start, end=end, interval=interval, ignore_tz=True, rounding=True, group_by='column', progress=False, auto_adjust=True)
+            yf_download = History.download('^VIX', start=start, end=end, interval=interval, rounding=True)
         #----------------------------------------------------------------------------------
 
         #STANDARDIZING TABLE---------------------------------------------------------------
@@ -1571,26 +1227,14 @@ class indicator:
             output = yf_download
             return output
         elif display == 'json':
-            yf_download.index = yf_download.index.strftime('%Y-%m-%d')
-
-            data_json_list = []
-            for index, row in yf_download.iterrows():
-                a = {
-                    'Date': index,
-                    f'{yf_download.columns[0]}': float(row[f'{yf_download.columns[0]}']),
-                    f'{yf_download.columns[1]}': float(row[f'{yf_download.columns[1]}']),
-                    f'{yf_download.columns[2]}': float(row[f'{yf_download.columns[2]}']),
-                    f'{yf_download.columns[3]}': float(row[f'{yf_download.columns[3]}'])
-                }
-                data_json_list.append(a)
-            output = data_json_list
+            output = records(yf_download, stream=stream)
             return output
         elif display == 'line':
             if data == 'all':
                 raise ChartReadabilityError('For optimal plot readability, only one type of OHLC price or volume data can be selected at a time. Currently, multiple options are selected. Please choose a single data parameter.')
             
             elif data != 'all':
-                fig, ax = plt.subplots(figsize=(10, 4.5), dpi=300)
+                fig, ax = subplots(figsize=(10, 4.5), dpi=300)
 
                 ax.plot(yf_download.index, yf_download)
                 
@@ -1629,17 +1273,10 @@ class indicator:
                     label.set_fontname('Arial')
 
                 ax.set_axisbelow(True) #making the grid and everything below the actual data line
-                #SAVE--------------------------------------------------------------------------
-                if save:
-                    plt.savefig(f'VIX_Simple{interval_map[interval]}{data.capitalize()}_{yf_download.index[0].strftime('%b%Y')}_{yf_download.index[-1].strftime('%b%Y')}.png', dpi=300, bbox_inches='tight')
-
-                #SHOW--------------------------------------------------------------------------
-                if show:
-                    plt.show()
-                elif show == False:
-                    plt.close(fig)
+                #SAVE/SHOW-----------------------------------------------------------------
+                finish(fig, f'VIX_Simple{interval_map[interval]}{data.capitalize()}_{yf_download.index[0].strftime('%b%Y')}_{yf_download.index[-1].strftime('%b%Y')}.png', show, save)
 #------------------------------------------------------------------------------------------
-    def dollar_index(self, display: str = 'table', period: str = '5y', start: str = None, end: str = None, interval: str = '1d', data: str = 'all', show: str = True, save: str = False):
+    def dollar_index(self, display: str = 'table', period: str = '5y', start: str = None, end: str = None, interval: str = '1d', data: str = 'all', show: str = True, save: str = False, stream: bool = False):
         valid_params = {'valid_display': ['table', 'json', 'line'],
                         'valid_period' : ['1mo', '6mo', '1y', '2y', '5y', '10y', 'ytd', 'max'],
                         'valid_interval' : ['1d', '1wk', '1mo', '3mo'],
@@ -1661,9 +1298,9 @@ class indicator:
         #RAW DATA/OBSERVATIONS-------------------------------------------------------------
         #Note: start and end parameters will override any period parameter presence
         if start == None and end == None:
-            yf_download = yf.download('DX-Y.NYB', period=period, interval=interval, ignore_tz=True, rounding=True, group_by='column', progress=False, auto_adjust=True)
+            yf_download = History.download('DX-Y.NYB', period=period, interval=interval, rounding=True)
         elif start != None and end != None:
-            yf_download = yf.download('DX-Y.NYB', start=start, end=end, interval=interval, ignore_tz=True, rounding=True, group_by='column', progress=False, auto_adjust=True)
+            yf_download = History.download('DX-Y.NYB', start=start, end=end, interval=interval, rounding=True)
         #----------------------------------------------------------------------------------
 
         #STANDARDIZING TABLE---------------------------------------------------------------
@@ -1685,26 +1322,14 @@ class indicator:
             output = yf_download
             return output
         elif display == 'json':
-            yf_download.index = yf_download.index.strftime('%Y-%m-%d')
-
-            data_json_list = []
-            for index, row in yf_download.iterrows():
-                a = {
-                    'Date': index,
-                    f'{yf_download.columns[0]}': float(row[f'{yf_download.columns[0]}']),
-                    f'{yf_download.columns[1]}': float(row[f'{yf_download.columns[1]}']),
-                    f'{yf_download.columns[2]}': float(row[f'{yf_download.columns[2]}']),
-                    f'{yf_download.columns[3]}': float(row[f'{yf_download.columns[3]}'])
-                }
-                data_json_list.append(a)
-            output = data_json_list
+            output = records(yf_download, stream=stream)
             return output
         elif display == 'line':
             if data == 'all':
                 raise ChartReadabilityError('For optimal plot readability, only one type of OHLC price or volume data can be selected at a time. Currently, multiple options are selected. Please choose a single data parameter.')
             
             elif data != 'all':
-                fig, ax = plt.subplots(figsize=(10, 4.5), dpi=300)
+                fig, ax = subplots(figsize=(10, 4.5), dpi=300)
 
                 ax.plot(yf_download.index, yf_download)
                 
@@ -1743,13 +1368,6 @@ class indicator:
                     label.set_fontname('Arial')
 
                 ax.set_axisbelow(True) #making the grid and everything below the actual data line
-                #SAVE--------------------------------------------------------------------------
-                if save:
-                    plt.savefig(f'DollarIndex_Simple{interval_map[interval]}{data.capitalize()}_{yf_download.index[0].strftime('%b%Y')}_{yf_download.index[-1].strftime('%b%Y')}.png', dpi=300, bbox_inches='tight')
-
-                #SHOW--------------------------------------------------------------------------
-                if show:
-                    plt.show()
-                elif show == False:
-                    plt.close(fig)
+                #SAVE/SHOW-----------------------------------------------------------------
+                finish(fig, f'DollarIndex_Simple{interval_map[interval]}{data.capitalize()}_{yf_download.index[0].strftime('%b%Y')}_{yf_download.index[-1].strftime('%b%Y')}.png', show, save)
 #------------------------------------------------------------------------------------------
\ No newline at end of file
@@ -0,0 +1,123 @@
+from finflux.base_var import Config, LazyModule
+
+import io
+import inspect
+import os
+import threading
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np # type: ignore
+
+plt = LazyModule('matplotlib.pyplot')
+mcollections = LazyModule('matplotlib.collections')
+mfigure = LazyModule('matplotlib.figure')
+magg = LazyModule('matplotlib.backends.backend_agg')
+
+#------------------------------------------------------------------------------------------
+def candlesticks(ax, x, open, high, low, close, candle_width):
+    #all wicks as one LineCollection and all bodies as one PolyCollection instead of one artist per candle
+    x, open, high, low, close = (np.asarray(a, dtype=float) for a in (x, open, high, low, close))
+    colors = np.where(close >= open, 'green', 'red')
+
+    wicks = np.stack([np.column_stack([x, low]), np.column_stack([x, high])], axis=1)
+    ax.add_collection(mcollections.LineCollection(wicks, colors=colors, linewidths=0.25))
+
+    left, right = x - (candle_width/2), x + (candle_width/2)
+    bottom, top = np.minimum(open, close), np.maximum(open, close)
+    bodies = np.stack([np.column_stack([left, bottom]),
+                       np.column_stack([left, top]),
+                       np.column_stack([right, top]),
+                       np.column_stack([right, bottom])], axis=1)
+    ax.add_collection(mcollections.PolyCollection(bodies, facecolors=colors, edgecolors=colors))
+
+    ax.autoscale_view()
+
+def volume_bars(ax, x, open, close, volume):
+    colors = np.where(np.asarray(close) >= np.asarray(open), 'green', 'red')
+    ax.bar(x, volume, color=colors, width=0.8, alpha=0.3)
+
+#------------------------------------------------------------------------------------------
+class Render:
+    #while a chart job runs on a thread, figures are built on a bare Agg canvas (no pyplot global state)
+    #and handed back to the job instead of being shown or saved
+    state = threading.local()
+
+    @classmethod
+    def active(cls):
+        return getattr(cls.state, 'active', False)
+
+def subplots(nrows: int = 1, ncols: int = 1, figsize: tuple = None, dpi: int = 300, gridspec_kw: dict = None):
+    if Render.active():
+        fig = mfigure.Figure(figsize=figsize, dpi=dpi)
+        magg.FigureCanvasAgg(fig)
+        return fig, fig.subplots(nrows=nrows, ncols=ncols, gridspec_kw=gridspec_kw)
+    return plt.subplots(nrows=nrows, ncols=ncols, figsize=figsize, dpi=dpi, gridspec_kw=gridspec_kw)
+
+def finish(fig, filename: str, show: bool, save: bool):
+    if Render.active():
+        Render.state.figure = fig
+        Render.state.filename = filename
+        return
+
+    #SAVE----------------------------------------------------------------------------------
+    if save:
+        fig.savefig(filename, dpi=300, bbox_inches='tight')
+
+    #SHOW----------------------------------------------------------------------------------
+    if show:
+        plt.show()
+    elif show == False:
+        plt.close(fig)
+
+#------------------------------------------------------------------------------------------
+def render_job(job: dict, directory: str, dpi: int, settings: dict):
+    #runs inside a worker process, so the caller's set_config() values are reapplied first
+    for key, value in settings.items():
+        setattr(Config, key, value)
+
+    import finflux
+    obj = getattr(finflux, job['class'])(*job.get('args', []))
+
+    method = getattr(obj, job['method'])
+    #functions without show/save parameters (statements, quotes, ...) never draw a chart
+    if not {'show', 'save'} <= set(inspect.signature(method).parameters):
+        raise ValueError(f"Chart job {job['class']}.{job['method']} does not produce a chart. "
+                         f"Please select a chart function (e.g. equity_candle).")
+
+    kwargs = dict(job.get('kwargs', {}))
+    kwargs['show'] = False
+    kwargs['save'] = False
+
+    Render.state.active = True
+    Render.state.figure = None
+    Render.state.filename = None
+    try:
+        method(**kwargs)
+        fig, filename = Render.state.figure, Render.state.filename
+    finally:
+        Render.state.active = False
+        Render.state.figure = None
+
+    if fig is None:
+        raise ValueError(f"Chart job {job['class']}.{job['method']} did not produce a chart. "
+                         f"Please select a chart display parameter (e.g. display='line').")
+
+    if directory is None:
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format='png', dpi=dpi, bbox_inches='tight')
+        return buffer.getvalue()
+
+    path = os.path.join(directory, job.get('filename', filename))
+    fig.savefig(path, dpi=dpi, bbox_inches='tight')
+    return path
+
+def render(jobs: list, directory: str = None, dpi: int = 300, workers: int = None):
+    #jobs: [{'class': 'equity', 'args': ['AAPL'], 'method': 'equity_candle', 'kwargs': {...}, 'filename': optional}, ...]
+    #returns PNG bytes per job, or the written file paths when a directory is given
+    if directory is not None:
+        os.makedirs(directory, exist_ok=True)
+
+    settings = {key: value for key, value in vars(Config).items() if not key.startswith('__')}
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(render_job, jobs, repeat(directory), repeat(dpi), repeat(settings)))
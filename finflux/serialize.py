@@ -0,0 +1,38 @@
+import pandas as pd # type: ignore
+
+#------------------------------------------------------------------------------------------
+def column_values(column):
+    #whole-column conversion to python scalars instead of a float() call per cell
+    if pd.api.types.is_numeric_dtype(column):
+        return column.to_numpy(dtype=float).tolist()
+    return column.tolist()
+
+#rows converted per block by records(stream=True)
+chunk_rows = 10000
+
+def rows(data, columns: list, index_label: str):
+    if isinstance(data.index, pd.DatetimeIndex):
+        index = data.index.strftime('%Y-%m-%d').tolist()
+    else:
+        index = data.index.tolist()
+
+    keys = [index_label] + [f'{column}' for column in columns]
+    values = [index] + [column_values(data[column]) for column in columns]
+    return (dict(zip(keys, row)) for row in zip(*values))
+
+def stream_rows(data, columns: list, index_label: str):
+    #converts chunk_rows rows at a time, so only one block of python values exists alongside the frame
+    for start in range(0, len(data), chunk_rows):
+        yield from rows(data.iloc[start:start + chunk_rows], columns, index_label)
+
+def records(data, columns: list = None, index_label: str = 'Date', stream: bool = False):
+    #row oriented json output: [{'Date': 'YYYY-MM-DD', column: value, ...}, ...]
+    #stream=True returns a generator that converts and yields the rows block by block instead of the full list
+    if isinstance(data, pd.Series):
+        data = data.to_frame()
+    if columns is None:
+        columns = list(data.columns)
+
+    if stream:
+        return stream_rows(data, columns, index_label)
+    return list(rows(data, columns, index_label))
@@ -0,0 +1,212 @@
+import os
+import time
+import sqlite3
+import threading
+from collections import OrderedDict
+
+#------------------------------------------------------------------------------------------
+#response cache backends, all store opaque bytes under a hashed key with an absolute expiry time
+#and evict the least recently used entries once max_bytes is exceeded
+
+class MemoryStore:
+    #per-process, an OrderedDict kept in recency order
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.lock = threading.Lock()
+
+    def get(self, key: str):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.time():
+                self.size -= len(self.entries.pop(key)[1])
+                return None
+            self.entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: bytes, ttl: float):
+        with self.lock:
+            if key in self.entries:
+                self.size -= len(self.entries.pop(key)[1])
+            self.entries[key] = (time.time() + ttl, value)
+            self.size += len(value)
+
+            while self.size > self.max_bytes and self.entries:
+                self.size -= len(self.entries.popitem(last=False)[1][1])
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+class SQLiteStore:
+    #one database file shared by every process on the host, WAL mode lets readers run alongside a writer.
+    #the byte total is summed once when the store is opened and kept up to date by set, get and clear, so
+    #writes made by other processes since then are only counted after the next open
+    def __init__(self, path: str, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.local = threading.local()
+        self.lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+
+        with self.connection() as connection:
+            connection.execute('CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, expires REAL, accessed REAL, size INTEGER, value BLOB)')
+            connection.execute('CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)')
+            self.size = connection.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+
+    def connection(self):
+        #sqlite3 connections cannot be shared between threads, so each thread opens its own
+        connection = getattr(self.local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30)
+            #switching a new database to WAL fails at once instead of waiting on the busy timeout while
+            #another process is opening it, so the switch is retried within the same 30 seconds
+            deadline = time.monotonic() + 30
+            while True:
+                try:
+                    connection.execute('PRAGMA journal_mode=WAL')
+                    break
+                except sqlite3.OperationalError:
+                    if time.monotonic() > deadline:
+                        raise
+                    time.sleep(0.01)
+            self.local.connection = connection
+        return connection
+
+    def get(self, key: str):
+        now = time.time()
+        with self.connection() as connection:
+            row = connection.execute('SELECT expires, size, value FROM responses WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            if row[0] < now:
+                if connection.execute('DELETE FROM responses WHERE key = ?', (key,)).rowcount:
+                    with self.lock:
+                        self.size -= row[1]
+                return None
+            connection.execute('UPDATE responses SET accessed = ? WHERE key = ?', (now, key))
+            return bytes(row[2])
+
+    def set(self, key: str, value: bytes, ttl: float):
+        now = time.time()
+        with self.connection() as connection:
+            row = connection.execute('SELECT size FROM responses WHERE key = ?', (key,)).fetchone()
+            connection.execute('INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)', (key, now + ttl, now, len(value), value))
+            with self.lock:
+                self.size += len(value) - (row[0] if row else 0)
+                over = self.size > self.max_bytes
+
+            if over:
+                #walks the accessed index from the oldest entry and stops as soon as the total fits
+                for old_key, size in connection.execute('SELECT key, size FROM responses ORDER BY accessed'):
+                    with self.lock:
+                        if self.size <= self.max_bytes:
+                            break
+                        if connection.execute('DELETE FROM responses WHERE key = ?', (old_key,)).rowcount:
+                            self.size -= size
+
+    def clear(self):
+        with self.connection() as connection:
+            connection.execute('DELETE FROM responses')
+            with self.lock:
+                self.size = 0
+
+class FileStore:
+    #one file per response in a shared directory, the expiry time is the first line and the mtime is the last access.
+    #the directory is scanned once when the store is opened, after that the sizes and recency order of the files
+    #are tracked in memory so a write never lists the directory
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.lock = threading.Lock()
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+
+        found = []
+        for entry in os.scandir(directory):
+            if entry.name.endswith('.bin'):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                found.append((stat.st_mtime, entry.name[:-4], stat.st_size))
+        for _, key, size in sorted(found):
+            self.entries[key] = size
+            self.size += size
+
+    def path(self, key: str):
+        return os.path.join(self.directory, f'{key}.bin')
+
+    def forget(self, key: str):
+        with self.lock:
+            self.size -= self.entries.pop(key, 0)
+
+    def get(self, key: str):
+        path = self.path(key)
+        try:
+            with open(path, 'rb') as file:
+                expires = float(file.readline())
+                value = file.read()
+        except (OSError, ValueError):
+            return None
+
+        if expires < time.time():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            self.forget(key)
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: bytes, ttl: float):
+        #write-then-rename so a process reading the same key never sees a partially written file
+        path = self.path(key)
+        tmp_path = f'{path}.tmp{os.getpid()}.{threading.get_ident()}'
+        header = f'{time.time() + ttl}\n'.encode()
+        with open(tmp_path, 'wb') as file:
+            file.write(header)
+            file.write(value)
+        os.replace(tmp_path, path)
+
+        evicted = []
+        with self.lock:
+            self.size += len(header) + len(value) - self.entries.pop(key, 0)
+            self.entries[key] = len(header) + len(value)
+            while self.size > self.max_bytes and self.entries:
+                old_key, size = self.entries.popitem(last=False)
+                self.size -= size
+                evicted.append(old_key)
+
+        for old_key in evicted:
+            try:
+                os.remove(self.path(old_key))
+            except OSError:
+                pass
+
+    def clear(self):
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.bin'):
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
@@ -0,0 +1,349 @@
+import math
+import numbers
+import numpy as np # type: ignore
+import pandas as pd # type: ignore
+from dateutil.relativedelta import relativedelta
+
+#------------------------------------------------------------------------------------------
+def warmup_start(first_date, bars: int, interval: str):
+    #start of a request that ends at first_date and still holds at least `bars` bars,
+    #daily bars leave room for weekends, market holidays and the odd missing session
+    if interval == '1d':
+        return first_date - relativedelta(days=bars * 3 // 2 + 20)
+    elif interval == '1wk':
+        return first_date - relativedelta(weeks=bars + 1)
+    elif interval == '1mo':
+        return first_date - relativedelta(months=bars + 1)
+    elif interval == '3mo':
+        return first_date - relativedelta(months=3 * (bars + 1))
+
+#------------------------------------------------------------------------------------------
+def rolling_moments(values, windows: list):
+    #{window: (mean, sample standard deviation)} for every window from one cumulative sum and sum of squares,
+    #a window's total is then the difference of two cumulative sums. values are centered on their first finite
+    #value to keep the sums small, and windows containing a NaN come out NaN like pandas rolling()
+    values = np.asarray(values, dtype='float64')
+    finite = np.isfinite(values)
+    shift = values[finite][0] if finite.any() else 0.0
+    centered = np.where(finite, values - shift, 0.0)
+
+    count = np.concatenate(([0], np.cumsum(finite)))
+    total = np.concatenate(([0.0], np.cumsum(centered)))
+    squares = np.concatenate(([0.0], np.cumsum(centered * centered)))
+
+    moments = {}
+    for window in windows:
+        mean = np.full(len(values), np.nan)
+        std = np.full(len(values), np.nan)
+        if window <= len(values):
+            full = (count[window:] - count[:-window]) == window
+            window_total = total[window:] - total[:-window]
+            window_squares = squares[window:] - squares[:-window]
+
+            window_mean = window_total / window
+            mean[window - 1:] = np.where(full, window_mean + shift, np.nan)
+
+            #a one value window has no sample standard deviation, it stays NaN like pandas rolling(1).std()
+            if window > 1:
+                window_var = np.maximum(window_squares - window_total * window_mean, 0.0) / (window - 1)
+                std[window - 1:] = np.where(full, np.sqrt(window_var), np.nan)
+        moments[window] = (mean, std)
+    return moments
+
+def moving_averages(data, close, sma: list, bollinger: list = None):
+    #adds the 'SMA n' and optional 'bollinger_upper n'/'bollinger_lower n' columns to the plotted data,
+    #close may start with warm-up bars before data's first row so the first plotted values are already complete
+    if bollinger is None:
+        bollinger = [None] * len(sma)
+
+    moments = rolling_moments(close.to_numpy(), sma)
+    for i, b in zip(sma, bollinger):
+        mean, std = moments[i]
+        data[f'SMA {i}'] = pd.Series(mean, index=close.index)
+        if b is not None:
+            data[f'bollinger_upper {i}'] = data[f'SMA {i}'] + (b * pd.Series(std, index=close.index))
+            data[f'bollinger_lower {i}'] = data[f'SMA {i}'] - (b * pd.Series(std, index=close.index))
+    return data
+
+#------------------------------------------------------------------------------------------
+class InvalidParameterError(Exception):
+    def __init__(self, msg):
+        self.msg = msg
+
+def check_window(window, name: str):
+    if not isinstance(window, numbers.Integral) or isinstance(window, bool) or window < 1:
+        raise InvalidParameterError(f"Invalid {name} window '{window}'. "
+                                    f"Please choose a whole number of bars of at least 1")
+
+#------------------------------------------------------------------------------------------
+#incremental indicators: seed() computes the whole history as numpy arrays (one array per column) and keeps
+#only the state needed to continue, update() then takes one new bar and returns the latest values in O(1)
+
+class SMA:
+    #ring buffer of the last `window` values with a running count, sum and sum of squares. the sums are centered
+    #on a reference value and rebuilt from the buffer once per trip around it, so rounding error never builds up
+    inputs = ('close',)
+
+    def __init__(self, window: int):
+        check_window(window, 'SMA')
+        self.window = window
+        self.columns = (f'SMA {window}',)
+        self.buffer = np.full(window, np.nan)
+        self.position = 0
+        self.recompute()
+
+    def recompute(self):
+        finite = np.isfinite(self.buffer)
+        self.shift = self.buffer[finite][0] if finite.any() else None
+        centered = self.buffer[finite] - (self.shift or 0.0)
+        self.count = int(finite.sum())
+        self.total = float(centered.sum())
+        self.squares = float((centered * centered).sum())
+
+    def moments(self):
+        if self.count < self.window:
+            return math.nan, math.nan
+        mean = self.total / self.window
+        if self.window == 1:
+            return mean + self.shift, math.nan
+        var = max(self.squares - self.total * mean, 0.0) / (self.window - 1)
+        return mean + self.shift, math.sqrt(var)
+
+    def push(self, value: float):
+        old = float(self.buffer[self.position])
+        self.buffer[self.position] = value
+        self.position = (self.position + 1) % self.window
+
+        if self.position == 0:
+            self.recompute()
+            return
+        if math.isfinite(old):
+            old -= self.shift
+            self.count -= 1
+            self.total -= old
+            self.squares -= old * old
+        if math.isfinite(value):
+            if self.shift is None:
+                self.shift = value
+            value -= self.shift
+            self.count += 1
+            self.total += value
+            self.squares += value * value
+
+    def seed_moments(self, close):
+        close = np.asarray(close, dtype='float64')
+        tail = close[-self.window:]
+        self.buffer = np.concatenate((np.full(self.window - len(tail), np.nan), tail))
+        self.position = 0
+        self.recompute()
+        return rolling_moments(close, [self.window])[self.window]
+
+    def seed(self, close):
+        return (self.seed_moments(close)[0],)
+
+    def update(self, close: float):
+        self.push(close)
+        return (self.moments()[0],)
+
+class Bollinger(SMA):
+    #SMA plus and minus `deviations` rolling sample standard deviations, same columns as the candle charts
+    def __init__(self, window: int, deviations: float = 2):
+        super().__init__(window)
+        self.deviations = deviations
+        self.columns = (f'SMA {window}', f'bollinger_upper {window}', f'bollinger_lower {window}')
+
+    def bands(self, mean, std):
+        return mean, mean + self.deviations * std, mean - self.deviations * std
+
+    def seed(self, close):
+        return self.bands(*self.seed_moments(close))
+
+    def update(self, close: float):
+        self.push(close)
+        return self.bands(*self.moments())
+
+class EMA:
+    #exponential moving average started from the first value, i.e. pandas ewm(adjust=False),
+    #a NaN bar leaves the average unchanged
+    inputs = ('close',)
+
+    def __init__(self, span: int = None, alpha: float = None, min_periods: int = 0):
+        self.alpha = alpha if alpha is not None else 2 / (span + 1)
+        self.min_periods = min_periods
+        self.columns = (f'EMA {span}',) if span is not None else (f'EMA a{alpha}',)
+        self.value = np.nan
+        self.count = 0
+
+    def smooth(self, values):
+        values = np.asarray(values, dtype='float64')
+        smoothed = pd.Series(values).ewm(alpha=self.alpha, adjust=False, ignore_na=True, min_periods=self.min_periods).mean().to_numpy()
+        average = pd.Series(values).ewm(alpha=self.alpha, adjust=False, ignore_na=True).mean().to_numpy()
+
+        self.count = int(np.isfinite(values).sum())
+        self.value = float(average[-1]) if len(average) else math.nan
+        return smoothed
+
+    def step(self, value: float):
+        if math.isfinite(value):
+            self.count += 1
+            self.value = value if math.isnan(self.value) else self.value + self.alpha * (value - self.value)
+        return self.value if self.count >= self.min_periods else math.nan
+
+    def seed(self, close):
+        return (self.smooth(close),)
+
+    def update(self, close: float):
+        return (self.step(close),)
+
+class RSI:
+    #Wilder's relative strength index, gains and losses smoothed with alpha = 1/window
+    inputs = ('close',)
+
+    def __init__(self, window: int = 14):
+        check_window(window, 'RSI')
+        self.window = window
+        self.columns = (f'RSI {window}',)
+        self.gain = EMA(alpha=1 / window, min_periods=window)
+        self.loss = EMA(alpha=1 / window, min_periods=window)
+        self.previous = np.nan
+
+    @staticmethod
+    def index(gain, loss):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return 100 * gain / (gain + loss)
+
+    def seed(self, close):
+        close = np.asarray(close, dtype='float64')
+        change = np.diff(close, prepend=np.nan)
+        gain = self.gain.smooth(np.where(np.isnan(change), np.nan, np.maximum(change, 0.0)))
+        loss = self.loss.smooth(np.where(np.isnan(change), np.nan, np.maximum(-change, 0.0)))
+        self.previous = float(close[-1]) if len(close) else math.nan
+        return (self.index(gain, loss),)
+
+    def update(self, close: float):
+        change = close - self.previous
+        self.previous = close
+        gain = self.gain.step(max(change, 0.0) if math.isfinite(change) else math.nan)
+        loss = self.loss.step(max(-change, 0.0) if math.isfinite(change) else math.nan)
+        return (100 * gain / (gain + loss) if gain + loss > 0 else math.nan,)
+
+class MACD:
+    #fast EMA minus slow EMA, its signal line (an EMA of the MACD line) and the histogram between them
+    inputs = ('close',)
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self.columns = ('MACD', 'MACD Signal', 'MACD Histogram')
+        self.fast = EMA(fast)
+        self.slow = EMA(slow)
+        self.signal = EMA(signal)
+
+    def seed(self, close):
+        macd = self.fast.smooth(close) - self.slow.smooth(close)
+        signal = self.signal.smooth(macd)
+        return macd, signal, macd - signal
+
+    def update(self, close: float):
+        macd = self.fast.step(close) - self.slow.step(close)
+        signal = self.signal.step(macd)
+        return macd, signal, macd - signal
+
+class ATR:
+    #average true range with Wilder smoothing, the first bar's true range is its high - low
+    inputs = ('high', 'low', 'close')
+
+    def __init__(self, window: int = 14):
+        check_window(window, 'ATR')
+        self.columns = (f'ATR {window}',)
+        self.range = EMA(alpha=1 / window, min_periods=window)
+        self.previous = np.nan
+
+    def seed(self, high, low, close):
+        high, low, close = (np.asarray(x, dtype='float64') for x in (high, low, close))
+        previous = np.concatenate(([np.nan], close[:-1]))
+        true_range = np.fmax(high - low, np.fmax(np.abs(high - previous), np.abs(low - previous)))
+        self.previous = float(close[-1]) if len(close) else math.nan
+        return (self.range.smooth(true_range),)
+
+    def update(self, high: float, low: float, close: float):
+        if math.isnan(self.previous):
+            true_range = high - low
+        else:
+            true_range = max(high - low, abs(high - self.previous), abs(low - self.previous))
+        self.previous = close
+        return (self.range.step(true_range),)
+
+class VWAP:
+    #volume weighted typical price (high + low + close) / 3, cumulative since seed() or the last reset()
+    inputs = ('high', 'low', 'close', 'volume')
+
+    def __init__(self):
+        self.columns = ('VWAP',)
+        self.reset()
+
+    def reset(self):
+        self.price_volume = 0.0
+        self.volume = 0.0
+
+    def seed(self, high, low, close, volume):
+        high, low, close, volume = (np.asarray(x, dtype='float64') for x in (high, low, close, volume))
+        price_volume = (high + low + close) / 3 * volume
+        valid = np.isfinite(price_volume)
+        price_volume = np.cumsum(np.where(valid, price_volume, 0.0))
+        volume = np.cumsum(np.where(valid, volume, 0.0))
+
+        self.price_volume = float(price_volume[-1]) if len(price_volume) else 0.0
+        self.volume = float(volume[-1]) if len(volume) else 0.0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return (np.where(volume > 0, price_volume / volume, np.nan),)
+
+    def update(self, high: float, low: float, close: float, volume: float):
+        price_volume = (high + low + close) / 3 * volume
+        if math.isfinite(price_volume):
+            self.price_volume += price_volume
+            self.volume += volume
+        return (self.price_volume / self.volume if self.volume > 0 else math.nan,)
+
+#------------------------------------------------------------------------------------------
+class Indicators:
+    #a set of indicators for one symbol. seed() takes an OHLCV frame such as equity.timeseries(data='all')
+    #(or bond.sovereign_timeseries for indicators without volume), columns are matched on their ' Open',
+    #' High', ' Low', ' Close' and ' Volume' suffixes. update() then appends one bar at a time
+    def __init__(self, *indicators):
+        self.indicators = list(indicators)
+
+        #an SMA(n) and a Bollinger(n) share the same 'SMA n' middle band, which is output once. any other repeated
+        #column would be two different series under one name (e.g. Bollinger(20, 2) and Bollinger(20, 3))
+        self.columns = []
+        for indicator in self.indicators:
+            for column in indicator.columns:
+                if column not in self.columns:
+                    self.columns.append(column)
+                elif not column.startswith('SMA '):
+                    raise InvalidParameterError(f"Indicator column '{column}' is produced by more than one indicator. "
+                                                f"Please register indicators with distinct columns.")
+
+    def seed(self, data):
+        fields = {}
+        for field in ('open', 'high', 'low', 'close', 'volume'):
+            matches = [column for column in data.columns if str(column).endswith(f' {field.capitalize()}')]
+            if matches:
+                fields[field] = data[matches[0]].to_numpy(dtype='float64')
+
+        output = {}
+        for indicator in self.indicators:
+            missing = [field for field in indicator.inputs if field not in fields]
+            if missing:
+                raise InvalidParameterError(f"{type(indicator).__name__} requires {', '.join(missing)} data, which is missing from the seed data. Please seed with OHLCV data.")
+            output.update(zip(indicator.columns, indicator.seed(*[fields[field] for field in indicator.inputs])))
+        return pd.DataFrame(output, index=data.index, columns=self.columns)
+
+    def update(self, close: float, high: float = None, low: float = None, volume: float = None):
+        #one new bar, returns {column: latest value}
+        bar = {'close': close, 'high': high, 'low': low, 'volume': volume}
+        output = {}
+        for indicator in self.indicators:
+            missing = [field for field in indicator.inputs if bar[field] is None]
+            if missing:
+                raise InvalidParameterError(f"{type(indicator).__name__} requires {', '.join(missing)} data. Please pass the bar's {', '.join(missing)}.")
+            output.update(zip(indicator.columns, indicator.update(*[float(bar[field]) for field in indicator.inputs])))
+        return output
@@ -1,12 +1,11 @@
-from finflux.base_var import Config
+from finflux.base_var import Config, LazyModule
 
-import yfinance as yf # type: ignore
 import numpy as np # type: ignore
-import requests # type: ignore
 import pandas as pd # type: ignore
 from datetime import timedelta
 from datetime import date
-from yfinance import EquityQuery
+
+yf = LazyModule('yfinance')
 
 #------------------------------------------------------------------------------------------
 class InvalidParameterError(Exception):
@@ -38,21 +37,21 @@ class top:
             
         #RAW DATA/OBSERVATIONS-------------------------------------------------------------
         if sector == 'all':
-            q = EquityQuery('and', [
-                    EquityQuery('gt', ['percentchange', 0.1]),
-                    EquityQuery('is-in', ['exchange', 'NMS', 'NYQ', 'NGM', 'NCM']),
-                    EquityQuery('gte', ['intradaymarketcap', 300000000]),
-                    EquityQuery('gte', ['intradayprice', 5]),
-                    EquityQuery('gte', ['dayvolume', 500000])
+            q = yf.EquityQuery('and', [
+                    yf.EquityQuery('gt', ['percentchange', 0.1]),
+                    yf.EquityQuery('is-in', ['exchange', 'NMS', 'NYQ', 'NGM', 'NCM']),
+                    yf.EquityQuery('gte', ['intradaymarketcap', 300000000]),
+                    yf.EquityQuery('gte', ['intradayprice', 5]),
+                    yf.EquityQuery('gte', ['dayvolume', 500000])
                 ])
         elif sector != 'all':
-            q = EquityQuery('and', [
-                    EquityQuery('eq', ['sector', sector.title()]),
-                    EquityQuery('gt', ['percentchange', 0.1]),
-                    EquityQuery('is-in', ['exchange', 'NMS', 'NYQ', 'NGM', 'NCM']),
-                    EquityQuery('gte', ['intradaymarketcap', 300000000]),
-                    EquityQuery('gte', ['intradayprice', 5]),
-                    EquityQuery('gte', ['dayvolume', 500000])
+            q = yf.EquityQuery('and', [
+                    yf.EquityQuery('eq', ['sector', sector.title()]),
+                    yf.EquityQuery('gt', ['percentchange', 0.1]),
+                    yf.EquityQuery('is-in', ['exchange', 'NMS', 'NYQ', 'NGM', 'NCM']),
+                    yf.EquityQuery('gte', ['intradaymarketcap', 300000000]),
+                    yf.EquityQuery('gte', ['intradayprice', 5]),
+                    yf.EquityQuery('gte', ['dayvolume', 500000])
                 ])
         quotes = yf.screen(q, sortField = 'percentchange', sortAsc = False, size=10)['quotes']
         #----------------------------------------------------------------------------------
@@ -99,21 +98,21 @@ class top:
             
         #RAW DATA/OBSERVATIONS-------------------------------------------------------------
         if sector == 'all':
-            q = EquityQuery('and', [
-                    EquityQuery('lt', ['percentchange', -0.1]),
-                    EquityQuery('is-in', ['exchange', 'NMS', 'NYQ', 'NGM', 'NCM']),
-                    EquityQuery('gte', ['intradaymarketcap', 300000000]),
-                    EquityQuery('gte', ['intradayprice', 5]),
-                    EquityQuery('gte', ['dayvolume', 500000])
+            q = yf.EquityQuery('and', [
+                    yf.EquityQuery('lt', ['percentchange', -0.1]),
+                    yf.EquityQuery('is-in', ['exchange', 'NMS', 'NYQ', 'NGM', 'NCM']),
+                    yf.EquityQuery('gte', ['intradaymarketcap', 300000000]),
+                    yf.EquityQuery('gte', ['intradayprice', 5]),
+                    yf.EquityQuery('gte', ['dayvolume', 500000])
                 ])
         elif sector != 'all':
-            q = EquityQuery('and', [
-                    EquityQuery('eq', ['sector', sector.title()]),
-                    EquityQuery('lt', ['percentchange', -0.1]),
-                    EquityQuery('is-in', ['exchange', 'NMS', 'NYQ', 'NGM', 'NCM']),
-                    EquityQuery('gte', ['intradaymarketcap', 300000000]),
-                    EquityQuery('gte', ['intradayprice', 5]),
-                    EquityQuery('gte', ['dayvolume', 500000])
+            q = yf.EquityQuery('and', [
+                    yf.EquityQuery('eq', ['sector', sector.title()]),
+                    yf.EquityQuery('lt', ['percentchange', -0.1]),
+                    yf.EquityQuery('is-in', ['exchange', 'NMS', 'NYQ', 'NGM', 'NCM']),
+                    yf.EquityQuery('gte', ['intradaymarketcap', 300000000]),
+                    yf.EquityQuery('gte', ['intradayprice', 5]),
+                    yf.EquityQuery('gte', ['dayvolume', 500000])
                 ])
         quotes = yf.screen(q, sortField = 'percentchange', sortAsc = True, size=10)['quotes']
         #----------------------------------------------------------------------------------
@@ -160,17 +159,17 @@ class top:
             
         #RAW DATA/OBSERVATIONS-------------------------------------------------------------
         if sector == 'all':
-            q = EquityQuery('and', [
-                    EquityQuery('is-in', ['exchange', 'NMS', 'NYQ', 'NGM', 'NCM']),
-                    EquityQuery('gte', ['intradaymarketcap', 300000000]),
-                    EquityQuery('gte', ['dayvolume', 500000])
+            q = yf.EquityQuery('and', [
+                    yf.EquityQuery('is-in', ['exchange', 'NMS', 'NYQ', 'NGM', 'NCM']),
+                    yf.EquityQuery('gte', ['intradaymarketcap', 300000000]),
+                    yf.EquityQuery('gte', ['dayvolume', 500000])
                 ])
         elif sector != 'all':
-            q = EquityQuery('and', [
-                    EquityQuery('eq', ['sector', sector.title()]),
-                    EquityQuery('is-in', ['exchange', 'NMS', 'NYQ', 'NGM', 'NCM']),
-                    EquityQuery('gte', ['intradaymarketcap', 300000000]),
-                    EquityQuery('gte', ['dayvolume', 500000])
+            q = yf.EquityQuery('and', [
+                    yf.EquityQuery('eq', ['sector', sector.title()]),
+                    yf.EquityQuery('is-in', ['exchange', 'NMS', 'NYQ', 'NGM', 'NCM']),
+                    yf.EquityQuery('gte', ['intradaymarketcap', 300000000]),
+                    yf.EquityQuery('gte', ['dayvolume', 500000])
                 ])
         quotes = yf.screen(q, sortField = 'dayvolume', sortAsc = False, size=10)['quotes']
         #----------------------------------------------------------------------------------
@@ -217,15 +216,15 @@ class top:
             
         #RAW DATA/OBSERVATIONS-------------------------------------------------------------
         if sector == 'all':
-            q = EquityQuery('and', [
-                    EquityQuery('is-in', ['exchange', 'NMS', 'NYQ', 'NGM', 'NCM']),
-                    EquityQuery('gt', ['intradaymarketcap', 1000000000])
+            q = yf.EquityQuery('and', [
+                    yf.EquityQuery('is-in', ['exchange', 'NMS', 'NYQ', 'NGM', 'NCM']),
+                    yf.EquityQuery('gt', ['intradaymarketcap', 1000000000])
                 ])
         elif sector != 'all':
-            q = EquityQuery('and', [
-                    EquityQuery('eq', ['sector', sector.title()]),
-                    EquityQuery('is-in', ['exchange', 'NMS', 'NYQ', 'NGM', 'NCM']),
-                    EquityQuery('gte', ['intradaymarketcap', 1000000000])
+            q = yf.EquityQuery('and', [
+                    yf.EquityQuery('eq', ['sector', sector.title()]),
+                    yf.EquityQuery('is-in', ['exchange', 'NMS', 'NYQ', 'NGM', 'NCM']),
+                    yf.EquityQuery('gte', ['intradaymarketcap', 1000000000])
                 ])
         quotes = yf.screen(q, sortField = 'intradaymarketcap', sortAsc = False, size=10)['quotes']
         #----------------------------------------------------------------------------------
@@ -0,0 +1,126 @@
+import time
+import importlib
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from finflux.cache import History
+
+equity_module = importlib.import_module('finflux.equity')
+
+#------------------------------------------------------------------------------------------
+#offline yfinance stand-ins shared by the equity tests
+INCOME = ['Total Revenue', 'Cost Of Revenue', 'Gross Profit', 'Research And Development', 'EBITDA', 'Reconciled Depreciation',
+          'EBIT', 'Interest Expense', 'Interest Income', 'Pretax Income', 'Tax Provision', 'Net Income',
+          'Basic Average Shares', 'Basic EPS']
+BALANCE = ['Total Assets', 'Current Assets', 'Cash And Cash Equivalents', 'Accounts Receivable', 'Inventory',
+           'Total Non Current Assets', 'Net PPE', 'Goodwill And Other Intangible Assets', 'Total Liabilities Net Minority Interest',
+           'Current Liabilities', 'Accounts Payable', 'Current Debt And Capital Lease Obligation',
+           'Total Non Current Liabilities Net Minority Interest', 'Long Term Debt And Capital Lease Obligation',
+           'Total Equity Gross Minority Interest', 'Retained Earnings']
+CASH = ['Operating Cash Flow', 'Net Income From Continuing Operations', 'Depreciation Amortization Depletion', 'Change In Working Capital',
+        'Investing Cash Flow', 'Capital Expenditure', 'Financing Cash Flow', 'Net Issuance Payments Of Debt', 'Net Common Stock Issuance',
+        'Cash Dividends Paid', 'Beginning Cash Position', 'Changes In Cash', 'End Cash Position']
+
+def statement_frame(items, dates, seed):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(rng.uniform(1e8, 1e10, (len(items), len(dates))), index=items, columns=dates)
+
+class FakeTicker:
+    #yfinance.Ticker with synthetic statements seeded from the symbol, nothing here touches the network
+    def __init__(self, ticker):
+        seed = sum(map(ord, ticker)) * 10
+        annual = pd.DatetimeIndex(['2025-09-30', '2024-09-30', '2023-09-30', '2022-09-30'])
+        quarter = pd.date_range(end='2025-09-30', periods=5, freq='QE')[::-1]
+        self.income_stmt = statement_frame(INCOME, annual, seed + 1)
+        self.quarterly_income_stmt = statement_frame(INCOME, quarter, seed + 2)
+        self.balance_sheet = statement_frame(BALANCE, annual, seed + 3)
+        self.quarterly_balance_sheet = statement_frame(BALANCE, quarter, seed + 4)
+        self.cash_flow = statement_frame(CASH, annual, seed + 5)
+        self.quarterly_cash_flow = statement_frame(CASH, quarter, seed + 6)
+
+    def get_fast_info(self):
+        return {'shares': 15e9, 'currency': 'USD'}
+
+    def get_history_metadata(self):
+        return {'instrumentType': 'EQUITY', 'currency': 'USD'}
+
+PERIOD_BARS = {'1mo': 21, '6mo': 126, '1y': 252, '2y': 504, '5y': 1260}
+
+def fake_download(ticker, period=None, start=None, end=None, **kwargs):
+    #five years of business days in the (Price, Ticker) column layout of yf.download, cut to the period or [start, end) like yfinance.
+    #a list of tickers is one grouped download, the n-th symbol's prices are (1 + n/10) times the first one's
+    tickers = [ticker] if isinstance(ticker, str) else list(ticker)
+    index = pd.bdate_range(end='2025-10-15', periods=1300)
+    close = np.linspace(100, 250, len(index))[:, None] * (1 + np.arange(len(tickers)) / 10)
+    columns = pd.MultiIndex.from_product([['Close', 'Open', 'High', 'Low', 'Volume'], tickers], names=['Price', 'Ticker'])
+    data = pd.DataFrame(np.tile(close, 5), index=index, columns=columns)
+    if period in PERIOD_BARS:
+        data = data.iloc[-PERIOD_BARS[period]:]
+    if start is not None:
+        data = data[data.index >= pd.Timestamp(start)]
+    if end is not None:
+        data = data[data.index < pd.Timestamp(end)]
+    return data
+
+@pytest.fixture
+def stub_yf(monkeypatch):
+    #equity's yfinance module and History.download replaced by the fakes above, every download call (single or grouped) is recorded
+    stub = SimpleNamespace(Ticker=FakeTicker, download=fake_download, calls=[])
+    def download(ticker, *args, **kwargs):
+        stub.calls.append((ticker, args, kwargs))
+        return fake_download(ticker, *args, **kwargs)
+    monkeypatch.setattr(equity_module, 'yf', SimpleNamespace(Ticker=FakeTicker, download=download))
+    monkeypatch.setattr(History, 'download', staticmethod(download))
+    return stub
+
+#------------------------------------------------------------------------------------------
+#offline SEC endpoints, a fake session answers from a {url: payload} dict and records every request
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def json(self):
+        return self.payload
+
+def filing_block(dates, form='10-Q'):
+    #column-oriented block in the layout of the submissions file, newest first
+    return {'accessionNumber': [f'0000320193-{date}' for date in dates], 'filingDate': list(dates), 'form': [form] * len(dates)}
+
+@pytest.fixture
+def stub_sec(monkeypatch):
+    from finflux.base_var import Config, Transport
+    from finflux.clients import SEC
+
+    #AAPL with a recent block and two older pages
+    pages = {
+        'CIK0000320193-submissions-001.json': filing_block(['2015-11-01', '2014-06-01', '2013-01-15']),
+        'CIK0000320193-submissions-002.json': filing_block(['2010-05-01', '2008-03-01']),
+    }
+    submissions = {'filings': {
+        'recent': filing_block(['2025-08-01', '2025-05-02', '2024-11-01', '2024-02-02'], form='10-K'),
+        'files': [{'name': 'CIK0000320193-submissions-001.json', 'filingFrom': '2013-01-15', 'filingTo': '2015-11-01'},
+                  {'name': 'CIK0000320193-submissions-002.json', 'filingFrom': '2008-03-01', 'filingTo': '2010-05-01'}],
+    }}
+    payloads = {
+        f'{Config.sec_baseurl}files/company_tickers.json': {'0': {'cik_str': 320193, 'ticker': 'AAPL', 'title': 'Apple Inc.'}},
+        'https://data.sec.gov/submissions/CIK0000320193.json': submissions,
+    }
+    payloads.update({f'https://data.sec.gov/submissions/{name}': page for name, page in pages.items()})
+
+    #the fake session sits below Transport.get, so the SEC throttle and host slots still apply to every request
+    stub = SimpleNamespace(calls=[], payloads=payloads)
+    def get(url, **kwargs):
+        stub.calls.append((url, threading.get_ident(), time.monotonic()))
+        return FakeResponse(payloads[url])
+
+    monkeypatch.setattr(Config, 'email_address', 'test@example.com')
+    monkeypatch.setattr(Config, 'response_cache', None)
+    monkeypatch.setattr(Transport, 'session', SimpleNamespace(get=get))
+    monkeypatch.setattr(Transport, 'rate_next', {})
+    monkeypatch.setattr(SEC, 'loaded', None)
+    return stub
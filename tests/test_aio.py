@@ -0,0 +1,21 @@
+import asyncio
+import threading
+
+from finflux.aio import equity_async, async_iterator
+
+def test_iter_filings_is_an_async_iterator(stub_sec):
+    async def collect():
+        iterator = await equity_async('AAPL', validate='none').iter_filings(start='2014-01-01')
+        assert isinstance(iterator, async_iterator)
+        return [filing async for filing in iterator], threading.get_ident()
+
+    filings, loop_thread = asyncio.run(collect())
+    assert [filing['filingDate'] for filing in filings] == ['2025-08-01', '2025-05-02', '2024-11-01', '2024-02-02', '2015-11-01', '2014-06-01']
+    #every SEC request, including the ticker map and each page, ran on the worker pool rather than the event loop
+    assert stub_sec.calls and all(thread != loop_thread for _, thread, _ in stub_sec.calls)
+
+def test_plain_methods_return_their_output(stub_sec):
+    async def call():
+        return await equity_async.ciks(['AAPL', 'NOPE'])
+
+    assert asyncio.run(call()) == {'AAPL': '0000320193', 'NOPE': None}
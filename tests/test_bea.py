@@ -0,0 +1,84 @@
+import threading
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from finflux.base_var import Config, Transport
+from finflux.clients import BEA
+
+DATA = [
+    {'SeriesCode': 'A939RC', 'TimePeriod': '2024Q4', 'DataValue': '86,270'},
+    {'SeriesCode': 'A939RC', 'TimePeriod': '2025Q1', 'DataValue': '86,902'},
+    {'SeriesCode': 'A939RX', 'TimePeriod': '2024Q4', 'DataValue': '69,001'},
+    {'SeriesCode': 'A939RX', 'TimePeriod': '2025Q1', 'DataValue': '68,960'},
+    #a revised row of the same period replaces the earlier one
+    {'SeriesCode': 'A939RX', 'TimePeriod': '2025Q1', 'DataValue': '68,990'},
+]
+
+@pytest.fixture
+def stub_bea(monkeypatch):
+    #Transport.get answered with DATA for every table, every requested url is recorded
+    urls = []
+    lock = threading.Lock()
+    def get(url, **kwargs):
+        with lock:
+            urls.append(url)
+        return SimpleNamespace(json=lambda: {'BEAAPI': {'Results': {'Data': DATA}}})
+    monkeypatch.setattr(Config, 'bea_apikey', 'key')
+    monkeypatch.setattr(Config, 'response_cache', 'memory')
+    monkeypatch.setattr(Transport, 'get', staticmethod(get))
+    monkeypatch.setattr(BEA, 'tables', {})
+    monkeypatch.setattr(BEA, 'table_locks', {})
+    return urls
+
+def test_parse_dates_annual_quarterly_and_monthly_periods():
+    table = BEA.parse([{'SeriesCode': 'X', 'TimePeriod': '2024', 'DataValue': '1,000.5'},
+                       {'SeriesCode': 'X', 'TimePeriod': '2024Q3', 'DataValue': '2'},
+                       {'SeriesCode': 'X', 'TimePeriod': '2024M07', 'DataValue': '3'},
+                       {'SeriesCode': 'X', 'TimePeriod': '2024Q4', 'DataValue': '(NA)'}])
+    series = table.xs('X', level='SeriesCode')
+
+    #quarters are dated on their last month
+    assert [d.strftime('%Y-%m-%d') for d in series.index] == ['2024-01-01', '2024-07-01', '2024-09-01', '2024-12-01']
+    assert series.iloc[0] == 1000.5 and series.dtype == 'float64'
+    assert np.isnan(series.iloc[-1])
+
+def test_parse_keeps_the_last_row_of_a_period():
+    series = BEA.parse(DATA).xs('A939RX', level='SeriesCode')
+    assert series.tolist() == [69001.0, 68990.0]
+
+def test_series_of_one_table_share_a_request(stub_bea):
+    nominal = BEA.series('T70100', 'Q', 'A939RC', 'Nominal')
+    real = BEA.series('T70100', 'Q', 'A939RX', 'Real')
+
+    assert len(stub_bea) == 1 and 'TableName=T70100' in stub_bea[0] and 'Frequency=Q' in stub_bea[0]
+    assert nominal.name == 'Nominal' and nominal.tolist() == [86270.0, 86902.0]
+    assert real.tolist() == [69001.0, 68990.0]
+
+    #another frequency is another table
+    BEA.series('T70100', 'A', 'A939RC')
+    assert len(stub_bea) == 2
+
+def test_concurrent_callers_download_a_table_once(stub_bea):
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda code: BEA.series('T20805', 'M', code), ['A939RC', 'A939RX'] * 8))
+    assert len(stub_bea) == 1
+
+def test_tables_follow_the_response_cache(stub_bea, monkeypatch):
+    BEA.table('T70100', 'Q')
+    BEA.table('T70100', 'Q')
+    assert len(stub_bea) == 1
+
+    #expired after the bea time-to-live
+    monkeypatch.setattr(Config, 'response_ttl', dict(Config.response_ttl, bea=0))
+    BEA.table('T70100', 'Q')
+    assert len(stub_bea) == 2
+
+    #not kept at all with the cache disabled
+    monkeypatch.setattr(Config, 'response_ttl', dict(Config.response_ttl, bea=3600))
+    monkeypatch.setattr(Config, 'response_cache', None)
+    BEA.table('T70100', 'Q')
+    BEA.table('T70100', 'Q')
+    assert len(stub_bea) == 4
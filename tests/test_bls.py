@@ -0,0 +1,67 @@
+import json
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from finflux.base_var import Config, Transport
+from finflux.clients import BLS
+
+def points(series_id, start_year, end_year):
+    #BLS v2 data points of one window, newest first with the M13 annual average row BLS adds to some series
+    data = []
+    for year in range(end_year, start_year - 1, -1):
+        data.append({'year': str(year), 'period': 'M13', 'value': '0.0'})
+        data.extend({'year': str(year), 'period': f'M{month:02d}', 'value': f'{year + month/100:.2f}'} for month in range(12, 0, -1))
+    return data
+
+@pytest.fixture
+def stub_bls(monkeypatch):
+    #Transport.post answered from points(), every request payload is recorded
+    requests = []
+    lock = threading.Lock()
+    def post(url, data=None, **kwargs):
+        payload = json.loads(data)
+        with lock:
+            requests.append(payload)
+        series = [{'seriesID': s, 'data': points(s, int(payload['startyear']), int(payload['endyear']))} for s in payload['seriesid']]
+        return SimpleNamespace(json=lambda: {'Results': {'series': series}})
+    monkeypatch.setattr(Config, 'bls_apikey', 'key')
+    monkeypatch.setattr(Transport, 'post', staticmethod(post))
+    return requests
+
+def test_windows_span_at_most_twenty_years():
+    assert BLS.windows(2000, 2025) == [(2006, 2025), (2000, 2005)]
+    assert BLS.windows(1980, 2019) == [(2000, 2019), (1980, 1999)]
+    assert BLS.windows(2025, 2025) == [(2025, 2025)]
+    assert BLS.windows(2026, 2025) == []
+
+def test_observations_pack_series_into_fifty_id_requests(stub_bls):
+    series_ids = [f'S{i:03d}' for i in range(120)]
+    data = BLS.observations(series_ids + series_ids[:10], 2010, 2025)
+
+    #120 unique ids in 3 chunks of at most 50, each over one 16 year window
+    assert len(stub_bls) == 3
+    assert sorted(len(request['seriesid']) for request in stub_bls) == [20, 50, 50]
+    assert all((request['startyear'], request['endyear']) == ('2010', '2025') for request in stub_bls)
+    assert list(data) == series_ids
+
+def test_observations_merge_windows_in_calendar_order(stub_bls):
+    data = BLS.observations(['CUUR0000SA0'], 1990, 2025)['CUUR0000SA0']
+
+    assert sorted((request['startyear'], request['endyear']) for request in stub_bls) == [('1990', '2005'), ('2006', '2025')]
+    keys = [(i['year'], i['period']) for i in data]
+    assert keys == sorted(keys) and keys[0] == ('1990', 'M01') and keys[-1] == ('2025', 'M13')
+
+def test_parse_drops_annual_averages(stub_bls):
+    parsed = BLS.parse(BLS.observations(['CUUR0000SA0'], 2024, 2025)['CUUR0000SA0'], 'CPI')
+
+    assert len(parsed) == 24 and parsed.name == 'CPI' and parsed.dtype == 'float64'
+    assert parsed.index.is_monotonic_increasing
+    assert parsed.index[0].strftime('%Y-%m-%d') == '2024-01-01'
+    assert parsed.iloc[-1] == pytest.approx(2025.12)
+
+    #missing values ('-') become NaN
+    parsed = BLS.parse([{'year': '2025', 'period': 'M01', 'value': '-'}])
+    assert np.isnan(parsed.iloc[0])
@@ -0,0 +1,57 @@
+import time
+import importlib
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+bond_module = importlib.import_module('finflux.bond')
+
+MATURITIES = ['6mo', '1y', '2y', '3y', '5y', '7y', '10y', '20y', '30y']
+
+@pytest.fixture
+def investpy_calls(monkeypatch):
+    #investpy stand-in: each request takes 50ms and returns a linear 6 month daily yield history,
+    #Japan does not issue a 20Y bond
+    calls = []
+    lock = threading.Lock()
+
+    def get_bond_historical_data(bond, from_date, to_date, interval):
+        with lock:
+            calls.append(bond)
+        time.sleep(0.05)
+        if bond == 'Japan 20Y':
+            raise RuntimeError('bond not found')
+        maturity = bond.split(' ')[-1]
+        level = MATURITIES.index(maturity.lower()) + 1
+        index = pd.bdate_range(end='2025-10-15', periods=127)
+        close = np.linspace(level, level + 1, len(index))
+        return pd.DataFrame({'Open': close, 'High': close, 'Low': close, 'Close': close}, index=index)
+
+    monkeypatch.setattr(bond_module, 'ip', SimpleNamespace(bonds=SimpleNamespace(get_bond_historical_data=get_bond_historical_data)))
+    return calls
+
+def test_curve_makes_one_request_per_maturity_concurrently(investpy_calls):
+    start = time.perf_counter()
+    curve = bond_module.bond().curve(display='json', country='US')
+    elapsed = time.perf_counter() - start
+
+    assert sorted(investpy_calls) == sorted(f'U.S. {maturity.upper()}' for maturity in MATURITIES)
+    #nine 50ms legs one after another would take at least 0.45s
+    assert elapsed < 0.3
+    assert list(curve['eod']) == MATURITIES
+    assert curve['eod']['10y'] == pytest.approx(8.0)
+    assert curve['6mo']['10y'] == pytest.approx(7.0)
+
+def test_curves_share_one_pool_and_mark_missing_maturities(investpy_calls):
+    table = bond_module.bond().curves(['US', 'JP', 'US'], display='table')
+    #duplicate countries are fetched once
+    assert len(investpy_calls) == 18
+    assert list(table.index.get_level_values('Country').unique()) == ['US', 'JP']
+    assert table.loc[('JP', '20y')].isna().all()
+    assert table.loc[('JP', '30y'), 'EOD'] == pytest.approx(10.0)
+
+    curves = bond_module.bond().curves(['US', 'JP'], display='json')
+    assert curves['US'] == bond_module.bond().curve(display='json', country='US')
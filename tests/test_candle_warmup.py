@@ -0,0 +1,49 @@
+import importlib
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from finflux.technical import warmup_start, moving_averages
+
+equity_module = importlib.import_module('finflux.equity')
+plt = importlib.import_module('matplotlib.pyplot')
+
+@pytest.mark.parametrize('interval, freq, bars', [('1d', 'B', 299), ('1wk', 'W-MON', 50), ('1mo', 'MS', 12), ('3mo', 'QS', 8)])
+def test_warmup_start_leaves_enough_bars(interval, freq, bars):
+    first = pd.Timestamp('2025-04-01')
+    start = warmup_start(first, bars, interval)
+    assert len(pd.date_range(start, first, freq=freq, inclusive='left')) >= bars
+
+def test_moving_averages_are_complete_from_the_first_plotted_bar():
+    close = pd.Series(np.arange(1.0, 61.0), index=pd.bdate_range('2025-01-01', periods=60))
+    data = pd.DataFrame(index=close.index[19:])
+    moving_averages(data, close, [20], [2])
+
+    #the first plotted bar averages the 19 warm-up bars and itself
+    assert not data.isna().any().any()
+    assert data['SMA 20'].iloc[0] == pytest.approx(10.5)
+    np.testing.assert_allclose(data['bollinger_upper 20'] - data['SMA 20'], 2 * close.rolling(20).std().iloc[19:])
+
+def test_candle_downloads_only_the_warmup_bars(stub_yf, monkeypatch):
+    plotted = {}
+    def record(data, close, sma, bollinger=None):
+        plotted['data'] = moving_averages(data, close, sma, bollinger)
+        return plotted['data']
+    monkeypatch.setattr(equity_module, 'moving_averages', record)
+
+    equity_module.equity('AAPL').equity_candle(period='6mo', sma=[20, 50], show=False)
+    plt.close('all')
+
+    #the chart's own download plus one warm-up request that ends at the first plotted date
+    assert len(stub_yf.calls) == 2
+    data = plotted['data']
+    _, _, warmup = stub_yf.calls[1]
+    assert warmup['end'] == data.index[0].strftime('%Y-%m-%d')
+    assert pd.Timestamp(warmup['start']) >= data.index[0] - pd.DateOffset(days=120)
+
+    #the SMAs match a rolling mean over the full history
+    full = stub_yf.download('AAPL')['Close'].iloc[:, 0]
+    for window in [20, 50]:
+        assert not data[f'SMA {window}'].isna().any()
+        np.testing.assert_allclose(data[f'SMA {window}'], full.rolling(window).mean().loc[data.index])
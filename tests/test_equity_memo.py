@@ -0,0 +1,68 @@
+import importlib
+import threading
+
+import pandas as pd
+import pytest
+
+from finflux.base_var import Config
+
+equity_module = importlib.import_module('finflux.equity')
+
+MEMOIZED = ['income_stmt', 'quarterly_income_stmt', 'balance_sheet', 'quarterly_balance_sheet', 'cash_flow', 'quarterly_cash_flow']
+
+@pytest.mark.filterwarnings('error::pandas.errors.SettingWithCopyWarning')
+@pytest.mark.parametrize('interval', ['annual', 'quarter'])
+def test_statement_leaves_memoized_frames_unchanged(stub_yf, interval):
+    #the derived line items and unit scaling are applied to copies, so repeated calls see the same yfinance frames
+    firm = equity_module.equity('AAPL', validate='none')
+    first = firm.statement(display='numeric', unit='million', interval=interval)
+    memoized = {key: firm.memo(key).copy() for key in MEMOIZED}
+
+    firm.statement(display='numeric', unit='thousand', interval=interval)
+    second = firm.statement(display='numeric', unit='million', interval=interval)
+
+    pd.testing.assert_frame_equal(first, second)
+    for key, frame in memoized.items():
+        pd.testing.assert_frame_equal(firm.memo(key), frame)
+    assert 'Other Operating Expenses' not in firm.memo('income_stmt').index
+
+def test_memo_fetches_once(stub_yf, monkeypatch):
+    created = []
+    class CountingTicker(stub_yf.Ticker):
+        def __init__(self, ticker):
+            created.append(ticker)
+            super().__init__(ticker)
+    monkeypatch.setattr(equity_module.yf, 'Ticker', CountingTicker)
+
+    firm = equity_module.equity('AAPL', validate='none')
+    firm.statement(display='numeric')
+    firm.statement(display='numeric', statement='income')
+    assert created == ['AAPL']
+
+    firm.invalidate()
+    firm.statement(display='numeric')
+    assert created == ['AAPL', 'AAPL']
+
+def test_memo_survives_concurrent_invalidate(stub_yf, monkeypatch):
+    #a zero ttl makes every memo() call race an expiry against invalidate() from another thread
+    monkeypatch.setattr(Config, 'memo_ttl', 0)
+    firm = equity_module.equity('AAPL', validate='none')
+    errors = []
+
+    def read():
+        for _ in range(200):
+            try:
+                assert firm.memo('metadata')['instrumentType'] == 'EQUITY'
+            except Exception as error:
+                errors.append(error)
+
+    def invalidate():
+        for _ in range(200):
+            firm.invalidate()
+
+    threads = [threading.Thread(target=read) for _ in range(4)] + [threading.Thread(target=invalidate)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
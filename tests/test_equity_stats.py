@@ -0,0 +1,15 @@
+import importlib
+
+import pandas as pd
+import pytest
+
+equity_module = importlib.import_module('finflux.equity')
+
+def test_stats_downloads_prices_once(stub_yf):
+    #every fiscal year end price comes from one as-of join on a single download instead of up to 24 per-date downloads
+    output = equity_module.equity('AAPL', validate='none').stats()
+    assert len(stub_yf.calls) == 1
+
+    prices = stub_yf.download('AAPL')['Close']['AAPL']
+    expected = prices.asof(pd.Timestamp('2022-09-30'))
+    assert output['valuation']['market cap']['FY 2022'] == pytest.approx(expected * stub_yf.Ticker('AAPL').income_stmt.loc['Basic Average Shares'].iloc[3] / 1e6)
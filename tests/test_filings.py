@@ -0,0 +1,51 @@
+import importlib
+
+equity_module = importlib.import_module('finflux.equity')
+
+PAGE_1 = 'https://data.sec.gov/submissions/CIK0000320193-submissions-001.json'
+PAGE_2 = 'https://data.sec.gov/submissions/CIK0000320193-submissions-002.json'
+
+def requested(stub):
+    return [url for url, _, _ in stub.calls]
+
+def test_filings_includes_every_page_by_default(stub_sec):
+    filings = equity_module.equity('AAPL', validate='none').filings()
+    assert len(filings) == 9
+    assert filings['filingDate'].iloc[-1] == '2008-03-01'
+    assert PAGE_1 in requested(stub_sec) and PAGE_2 in requested(stub_sec)
+
+def test_recent_history_reads_one_block(stub_sec):
+    filings = equity_module.equity('AAPL', validate='none').filings(history='recent')
+    assert len(filings) == 4
+    assert PAGE_1 not in requested(stub_sec)
+
+def test_pages_outside_the_date_range_are_skipped(stub_sec):
+    firm = equity_module.equity('AAPL', validate='none')
+
+    #page 2 ends in 2010, before start, and is never requested
+    dates = [filing['filingDate'] for filing in firm.iter_filings(start='2014-01-01')]
+    assert dates == ['2025-08-01', '2025-05-02', '2024-11-01', '2024-02-02', '2015-11-01', '2014-06-01']
+    assert PAGE_1 in requested(stub_sec) and PAGE_2 not in requested(stub_sec)
+
+    #page 1 starts in 2013, after end, and is skipped while page 2 is read
+    stub_sec.calls.clear()
+    dates = [filing['filingDate'] for filing in firm.iter_filings(end='2012-01-01')]
+    assert dates == ['2010-05-01', '2008-03-01']
+    assert PAGE_1 not in requested(stub_sec) and PAGE_2 in requested(stub_sec)
+
+def test_limit_stops_before_older_pages(stub_sec):
+    firm = equity_module.equity('AAPL', validate='none')
+    filings = list(firm.iter_filings(form='10-K', limit=2))
+    assert [filing['filingDate'] for filing in filings] == ['2025-08-01', '2025-05-02']
+    assert PAGE_1 not in requested(stub_sec) and PAGE_2 not in requested(stub_sec)
+
+    filings = list(firm.iter_filings(form='10-Q', limit=1))
+    assert [filing['filingDate'] for filing in filings] == ['2015-11-01']
+    assert PAGE_2 not in requested(stub_sec)
+
+def test_sec_requests_are_throttled(stub_sec):
+    #ticker map, submissions file and two pages, at most 10 per second
+    list(equity_module.equity('AAPL', validate='none').iter_filings())
+    times = [at for _, _, at in stub_sec.calls]
+    assert len(times) == 4
+    assert all(later - earlier >= 0.09 for earlier, later in zip(times, times[1:]))
@@ -0,0 +1,142 @@
+import threading
+import importlib
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from finflux.fundamentals import Panel, InvalidParameterError, ratios, ratio_items, ratio_groups
+
+equity_module = importlib.import_module('finflux.equity')
+
+def frames():
+    #two companies with different fiscal year ends, the second one only has two periods
+    a = pd.DataFrame([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]], index=['Revenue', 'EBIT'], columns=['FY 2025', 'FY 2024', 'FY 2023'])
+    b = pd.DataFrame([[50.0, 60.0], [7.0, 8.0]], index=['EBIT', 'Revenue'], columns=['2025-06', '2024-06'])
+    return {'AAA': a, 'BBB': b}
+
+def test_from_frames_aligns_items_and_pads_periods():
+    panel = Panel.from_frames(frames(), periods=3)
+
+    assert panel.shape == (2, 2, 3) and panel.values.flags['C_CONTIGUOUS']
+    assert panel.items == ['Revenue', 'EBIT'] and panel.periods == [0, 1, 2]
+    #BBB's rows follow AAA's item order and its missing third period is NaN
+    np.testing.assert_array_equal(panel.values[1], [[7.0, 8.0, np.nan], [50.0, 60.0, np.nan]])
+    assert panel.dates.tolist() == [['FY 2025', 'FY 2024', 'FY 2023'], ['2025-06', '2024-06', None]]
+
+    #extra periods are dropped
+    assert Panel.from_frames(frames(), periods=2).shape == (2, 2, 2)
+
+def test_slices_are_views():
+    panel = Panel.from_frames(frames(), periods=3)
+
+    revenue = panel.item('Revenue')
+    latest = panel.period(0)
+    aaa = panel.ticker('AAA')
+    for view in (revenue, latest, aaa, panel.to_frame().to_numpy()):
+        assert np.shares_memory(view, panel.values)
+
+    np.testing.assert_array_equal(revenue, [[1.0, 2.0, 3.0], [7.0, 8.0, np.nan]])
+    np.testing.assert_array_equal(latest, [[1.0, 4.0], [7.0, 50.0]])
+
+def test_table_display_labels():
+    panel = Panel.from_frames(frames(), periods=3)
+
+    revenue = panel.item('Revenue', display='table')
+    assert list(revenue.index) == ['AAA', 'BBB'] and revenue.index.name == 'Ticker' and list(revenue.columns) == [0, 1, 2]
+    assert list(panel.period(1, display='table').columns) == ['Revenue', 'EBIT']
+    #a company's own period labels, positions where it has no period keep the number
+    assert list(panel.ticker('BBB', display='table').columns) == ['2025-06', '2024-06', 2]
+
+    frame = panel.to_frame()
+    assert frame.index.names == ['Ticker', 'Item'] and frame.loc[('BBB', 'EBIT'), 1] == 60.0
+
+@pytest.mark.parametrize('call', [lambda p: p.item('Net Income'), lambda p: p.period(3), lambda p: p.ticker('CCC'),
+                                  lambda p: p.item('Revenue', display='json')])
+def test_invalid_lookups(call):
+    with pytest.raises(InvalidParameterError):
+        call(Panel.from_frames(frames(), periods=3))
+
+def test_statements_fetch_every_company_concurrently(stub_yf, monkeypatch):
+    #every fetch waits at a barrier for the other one, so the call only completes when both run at the same time
+    barrier = threading.Barrier(2, timeout=5)
+    statement = equity_module.equity.statement
+    def fetch(self, *args, **kwargs):
+        barrier.wait()
+        return statement(self, *args, **kwargs)
+    monkeypatch.setattr(equity_module.equity, 'statement', fetch)
+
+    panel = equity_module.equity.statements(['AAPL', 'MSFT', 'AAPL'], unit='million', workers=2)
+    assert panel.tickers == ['AAPL', 'MSFT'] and panel.shape[2] == 4 and panel.unit == 'million'
+
+    monkeypatch.setattr(equity_module.equity, 'statement', statement)
+    for ticker in panel.tickers:
+        expected = equity_module.equity(ticker, validate='none').statement(display='numeric', unit='million')
+        pd.testing.assert_frame_equal(panel.ticker(ticker, display='table'), expected, check_names=False, check_column_type=False)
+
+#------------------------------------------------------------------------------------------
+#every line item ratios() reads, the ones not set by ratio_panel() stay NaN
+RATIO_ITEMS = ['Total Revenue', 'Cost Of Revenue', 'Gross Profit', 'EBITDA', 'EBIT', 'Interest Expense', 'Pretax Income', 'Tax Provision',
+               'Net Income', 'Total Assets', 'Total Current Assets', 'Cash And Cash Equivalents', 'Accounts Receivable', 'Inventory',
+               'Total Liabilities', 'Total Current Liabilities', 'Accounts Payable', 'Total Equity', 'Operating Cash Flow',
+               'Depreciation and Amortization', 'Change In Working Capital', 'Other Operating Cash Flow', 'Capital Expenditure',
+               'Net Issuance/Payments Of Debt', 'Cash Dividends Paid']
+
+def ratio_panel():
+    #one company with two fiscal years, newest first
+    frame = pd.DataFrame(np.nan, index=RATIO_ITEMS, columns=['FY 2025', 'FY 2024'])
+    frame.loc['Total Revenue'] = [200.0, 100.0]
+    frame.loc['Cost Of Revenue'] = [120.0, 60.0]
+    frame.loc['Gross Profit'] = [80.0, 40.0]
+    frame.loc['Net Income'] = [30.0, 10.0]
+    frame.loc['Total Equity'] = [150.0, 0.0]
+    frame.loc['Inventory'] = [40.0, 20.0]
+    frame.loc['Cash Dividends Paid'] = [-6.0, -5.0]
+    return Panel.from_frames({'AAA': frame}, periods=2, unit='million')
+
+def test_ratios_match_manual_computation():
+    out = ratios(ratio_panel(), price=[[10.0, 8.0]], shares=[[2e6, 2e6]], eps=[[1.5, 0.5]])
+    ratio = lambda name: out.item(name)[0]
+
+    assert out.items == ratio_items and out.dates.tolist() == [['FY 2025', 'FY 2024']]
+    np.testing.assert_allclose(ratio('gross margin'), [80 / 200, 40 / 100])
+    np.testing.assert_allclose(ratio('roe')[:1], [30 / 150])
+    #averages and growth need the year before, so the oldest period is NaN
+    np.testing.assert_allclose(ratio('inventory turnover'), [120 / ((40 + 20) / 2), np.nan])
+    np.testing.assert_allclose(ratio('dio'), [365 / (120 / 30), np.nan])
+    np.testing.assert_allclose(ratio('revenue growth rate'), [200 / 100 - 1, np.nan])
+    #market cap in the panel's unit
+    np.testing.assert_allclose(ratio('market cap'), [20.0, 16.0])
+    np.testing.assert_allclose(ratio('pe'), [20 / 30, 16 / 10])
+    np.testing.assert_allclose(ratio('dividend yield'), [6 / 20, 5 / 16])
+    np.testing.assert_allclose(ratio('eps'), [1.5, 0.5])
+
+    #division by zero and missing items give inf or NaN, never an exception
+    assert np.isinf(ratio('roe')[1])
+    assert np.isnan(ratio('current ratio')).all() and np.isnan(ratio('fcff_DA.WC')).all()
+
+def test_ratios_without_prices_leave_valuation_empty():
+    out = ratios(ratio_panel())
+    for name in ['market cap', 'pe', 'ps', 'pb', 'eps', 'dividend yield', 'enterprise value']:
+        assert np.isnan(out.item(name)).all()
+    assert not np.isnan(out.item('gross margin')).any()
+
+#valuation ratios use the fiscal year end close, which the stubbed grouped download scales per symbol
+PRICE_RATIOS = {'market cap', 'pe', 'ps', 'pb', 'dividend yield', 'enterprise value', 'ev/ebitda', 'ev/ebit'}
+
+def test_universe_ratios_match_stats(stub_yf):
+    tickers = ['AAPL', 'MSFT']
+    panel = equity_module.equity.ratios(tickers)
+
+    #one grouped price download for the whole universe
+    assert [call[0] for call in stub_yf.calls] == [tickers]
+    assert panel.shape == (2, len(ratio_items), 4)
+
+    for t, ticker in enumerate(tickers):
+        stats = equity_module.equity(ticker, validate='none').stats()
+        for group, names in ratio_groups.items():
+            for name in names:
+                if t > 0 and name in PRICE_RATIOS:
+                    continue
+                expected = [stats[group][name][date] for date in panel.dates[t]]
+                np.testing.assert_allclose(panel.item(name)[t], np.asarray(expected, dtype='float64'), rtol=1e-9, err_msg=f'{ticker} {name}')
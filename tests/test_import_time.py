@@ -0,0 +1,26 @@
+import os
+import sys
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+#modules a bare 'import finflux' must leave unloaded, they are pulled in by the first call that needs them
+HEAVY = ['pandas', 'matplotlib', 'yfinance', 'scipy']
+
+def test_bare_import_is_light():
+    code = 'import sys, finflux; print(",".join(m for m in %r if m in sys.modules))' % HEAVY
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], capture_output=True, text=True, env=env, cwd=ROOT)
+    assert result.returncode == 0, result.stderr
+
+    loaded = [m for m in result.stdout.strip().split(',') if m]
+    #the importtime report names the import chain that pulled a heavy module in
+    chain = [line for line in result.stderr.splitlines() if any(f'| {m}' in line for m in HEAVY)]
+    assert loaded == [], '\n'.join(chain)
+
+def test_submodule_import_keeps_lazy_classes():
+    code = 'import finflux.aio, finflux.render, finflux; print(type(finflux.equity).__name__, type(finflux.bond).__name__, type(finflux.render).__name__)'
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, env=env, cwd=ROOT)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split() == ['type', 'type', 'function']
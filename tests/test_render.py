@@ -0,0 +1,59 @@
+import time
+import importlib
+
+import numpy as np
+import pytest
+
+from finflux.render import render_job, candlesticks, Render
+
+mfigure = importlib.import_module('matplotlib.figure')
+magg = importlib.import_module('matplotlib.backends.backend_agg')
+
+def axes():
+    fig = mfigure.Figure(figsize=(8, 4), dpi=100)
+    magg.FigureCanvasAgg(fig)
+    return fig, fig.subplots()
+
+def ohlc(bars):
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(rng.normal(0, 1, bars))
+    open = close + rng.normal(0, 0.5, bars)
+    return np.arange(bars), open, np.maximum(open, close) + 0.5, np.minimum(open, close) - 0.5, close
+
+def test_candle_chart_job_renders_headless_png(stub_yf):
+    #render_job is what each worker process runs, here in-process on the offline yfinance stub
+    png = render_job({'class': 'equity', 'args': ['AAPL'], 'method': 'equity_candle', 'kwargs': {'period': '6mo', 'sma': [20]}},
+                     directory=None, dpi=50, settings={})
+    assert png.startswith(b'\x89PNG')
+    assert not Render.active()
+
+def test_job_without_a_chart_is_rejected(stub_yf):
+    with pytest.raises(ValueError):
+        render_job({'class': 'equity', 'args': ['AAPL'], 'method': 'statement', 'kwargs': {'display': 'numeric'}},
+                   directory=None, dpi=50, settings={})
+
+def test_candlesticks_draw_two_artists():
+    fig, ax = axes()
+    candlesticks(ax, *ohlc(500), candle_width=0.6)
+    assert len(ax.collections) == 2 and not ax.lines and not ax.patches
+
+def test_batched_candles_render_faster_than_one_artist_per_candle():
+    x, open, high, low, close = ohlc(1000)
+
+    fig, ax = axes()
+    start = time.perf_counter()
+    candlesticks(ax, x, open, high, low, close, candle_width=0.6)
+    fig.canvas.draw()
+    batched = time.perf_counter() - start
+
+    #the per-candle drawing candlesticks() replaced: one wick line and one body bar per bar
+    fig, ax = axes()
+    start = time.perf_counter()
+    for i in range(len(x)):
+        color = 'green' if close[i] >= open[i] else 'red'
+        ax.plot([x[i], x[i]], [low[i], high[i]], color=color, linewidth=0.25)
+        ax.bar(x[i], abs(close[i] - open[i]), bottom=min(open[i], close[i]), width=0.6, color=color)
+    fig.canvas.draw()
+    per_candle = time.perf_counter() - start
+
+    assert batched * 5 < per_candle
@@ -0,0 +1,50 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from finflux.base_var import Config
+from finflux.clients import SEC
+
+COMPANIES = {
+    '0': {'cik_str': 320193, 'ticker': 'AAPL', 'title': 'Apple Inc.'},
+    '1': {'cik_str': 1067983, 'ticker': 'BRK-B', 'title': 'BERKSHIRE HATHAWAY INC'},
+    '2': {'cik_str': 1067983, 'ticker': 'BRK-A', 'title': 'BERKSHIRE HATHAWAY INC'},
+    #a ticker listed again under another CIK keeps its first listing
+    '3': {'cik_str': 999, 'ticker': 'AAPL', 'title': 'Stale listing'},
+}
+
+@pytest.fixture
+def companies(stub_sec):
+    stub_sec.payloads[f'{Config.sec_baseurl}files/company_tickers.json'] = COMPANIES
+    return stub_sec
+
+def index_requests(stub):
+    return [url for url, *_ in stub.calls if url.endswith('company_tickers.json')]
+
+def test_cik_lookups_share_one_download(companies):
+    assert SEC.cik('AAPL') == '0000320193'
+    assert SEC.cik('BRK-A') == '0001067983'
+    assert SEC.cik('NOPE') is None
+    assert SEC.ciks(['AAPL', 'BRK-B', 'NOPE']) == {'AAPL': '0000320193', 'BRK-B': '0001067983', 'NOPE': None}
+    assert len(index_requests(companies)) == 1
+
+def test_tickers_of_a_cik(companies):
+    assert SEC.tickers(1067983) == ['BRK-B', 'BRK-A']
+    assert SEC.tickers('0000000999') == ['AAPL']
+    assert SEC.tickers('1') == []
+
+    #the returned list is a copy, the index itself is left alone
+    SEC.tickers(1067983).append('X')
+    assert SEC.tickers(1067983) == ['BRK-B', 'BRK-A']
+
+def test_index_is_rebuilt_after_its_ttl(companies, monkeypatch):
+    SEC.cik('AAPL')
+    monkeypatch.setattr(Config, 'response_ttl', dict(Config.response_ttl, sec_tickers=0))
+    SEC.cik('AAPL')
+    assert len(index_requests(companies)) == 2
+
+def test_concurrent_lookups_download_the_index_once(companies):
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        ciks = list(executor.map(SEC.cik, ['AAPL', 'BRK-B'] * 16))
+    assert set(ciks) == {'0000320193', '0001067983'}
+    assert len(index_requests(companies)) == 1
@@ -0,0 +1,66 @@
+import timeit
+import importlib
+
+import numpy as np
+import pandas as pd
+
+from finflux.serialize import records
+
+def frame(rows):
+    index = pd.date_range('2000-01-03', periods=rows, freq='B', name='Date')
+    data = np.random.default_rng(0).normal(100, 5, (rows, 4))
+    data[::7, 1] = np.nan
+    return pd.DataFrame(data, index=index, columns=['Open', 'High', 'Low', 'Close'])
+
+def iterrows_records(data):
+    #the per-row loop records() replaced, kept as the reference output and timing baseline
+    output = []
+    for index, row in data.iterrows():
+        record = {'Date': index.strftime('%Y-%m-%d')}
+        for column in data.columns:
+            record[column] = float(row[column])
+        output.append(record)
+    return output
+
+def test_records_matches_row_loop():
+    data = frame(500)
+    expected = iterrows_records(data)
+    output = records(data)
+
+    assert len(output) == len(expected)
+    for row, expected_row in zip(output, expected):
+        assert row.keys() == expected_row.keys()
+        assert row['Date'] == expected_row['Date']
+        np.testing.assert_equal([row[c] for c in data.columns], [expected_row[c] for c in data.columns])
+        assert all(type(row[c]) is float for c in data.columns)
+
+    streamed = list(records(data, stream=True))
+    assert len(streamed) == len(output) and streamed[1] == output[1]
+    assert records(data['Close'])[0] == {'Date': '2000-01-03', 'Close': output[0]['Close']}
+
+def test_records_is_faster_than_row_loop():
+    data = frame(20000)
+
+    #the best of three runs each keeps a garbage collection pass or a busy machine from skewing the comparison
+    vectorized = min(timeit.repeat(lambda: records(data), number=1, repeat=3))
+    loop = min(timeit.repeat(lambda: iterrows_records(data), number=1, repeat=3))
+
+    #typically 50x or more, a wide margin keeps slow machines from failing
+    assert vectorized * 5 < loop
+
+def test_stream_converts_block_by_block(monkeypatch):
+    serialize = importlib.import_module('finflux.serialize')
+    monkeypatch.setattr(serialize, 'chunk_rows', 100)
+    converted = []
+    column_values = serialize.column_values
+    monkeypatch.setattr(serialize, 'column_values', lambda column: converted.append(len(column)) or column_values(column))
+
+    data = frame(250)
+    stream = records(data, stream=True)
+    first = next(stream)
+    #only the first block's columns have been turned into python values so far
+    assert converted == [100] * 4
+
+    rest = list(stream)
+    assert converted == [100] * 4 + [100] * 4 + [50] * 4
+    assert [first['Date']] + [row['Date'] for row in rest] == [row['Date'] for row in records(data)]
@@ -0,0 +1,146 @@
+import os
+import sys
+import time
+import threading
+import subprocess
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from finflux.base_var import Config, Transport
+from finflux.store import MemoryStore, SQLiteStore, FileStore
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+@pytest.fixture(params=['memory', 'sqlite', 'files'])
+def make_store(request, tmp_path):
+    def make(max_bytes=1000):
+        if request.param == 'memory':
+            return MemoryStore(max_bytes)
+        elif request.param == 'sqlite':
+            return SQLiteStore(str(tmp_path / 'responses.sqlite'), max_bytes)
+        return FileStore(str(tmp_path / 'responses'), max_bytes)
+    return make
+
+def test_round_trip_and_clear(make_store):
+    store = make_store()
+    store.set('a', b'\x00\x01 payload', 60)
+    assert store.get('a') == b'\x00\x01 payload'
+    assert store.get('missing') is None
+
+    store.clear()
+    assert store.get('a') is None
+    assert store.size == 0
+
+def test_expired_entries_are_dropped(make_store):
+    store = make_store()
+    store.set('old', b'x' * 100, -1)
+    store.set('new', b'y' * 100, 60)
+    assert store.get('old') is None
+    assert store.get('new') == b'y' * 100
+
+def test_least_recently_used_entries_are_evicted(make_store):
+    #entries of 100 bytes (plus the files backend's expiry line) under a 1000 byte limit
+    store = make_store(1000)
+    for i in range(8):
+        store.set(f'k{i}', b'x' * 100, 60)
+        time.sleep(0.01) #distinct access times for the sqlite and files backends
+
+    assert store.get('k0') is not None #k0 becomes the most recently used
+    time.sleep(0.01)
+    for i in range(8, 12):
+        store.set(f'k{i}', b'x' * 100, 60)
+        time.sleep(0.01)
+
+    assert store.get('k0') is not None
+    assert store.get('k1') is None and store.get('k2') is None
+    assert store.get('k11') is not None
+    assert store.size <= 1000
+
+def test_replacing_a_key_keeps_one_copy(make_store):
+    store = make_store()
+    store.set('a', b'x' * 300, 60)
+    size = store.size
+    store.set('a', b'y' * 300, 60)
+    #the files backend's expiry line can differ by a character between writes
+    assert abs(store.size - size) <= 2
+    assert store.get('a') == b'y' * 300
+
+def test_byte_total_is_rebuilt_when_reopened(tmp_path):
+    for store_class, path in ((SQLiteStore, tmp_path / 'responses.sqlite'), (FileStore, tmp_path / 'responses')):
+        store = store_class(str(path), 10000)
+        for i in range(5):
+            store.set(f'k{i}', b'x' * 100, 60)
+        assert store_class(str(path), 10000).size == store.size
+
+def test_concurrent_threads(make_store):
+    store = make_store(10 ** 6)
+    errors = []
+
+    def work(worker):
+        try:
+            for i in range(50):
+                store.set(f'{worker}-{i}', f'{worker}-{i}'.encode() * 10, 60)
+                assert store.get(f'{worker}-{i}') == f'{worker}-{i}'.encode() * 10
+                store.get(f'{(worker + 1) % 4}-{i}')
+        except Exception as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=work, args=(worker,)) for worker in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert all(store.get(f'{worker}-{i}') is not None for worker in range(4) for i in range(50))
+
+@pytest.mark.parametrize('backend', ['sqlite', 'files'])
+def test_concurrent_processes(tmp_path, backend):
+    #four processes write into one shared store at the same time, every entry is readable afterwards
+    path = str(tmp_path / ('responses.sqlite' if backend == 'sqlite' else 'responses'))
+    store_class = 'SQLiteStore' if backend == 'sqlite' else 'FileStore'
+    code = ('import sys\n'
+            f'from finflux.store import {store_class}\n'
+            f'store = {store_class}({path!r}, 10 ** 7)\n'
+            'for i in range(50):\n'
+            '    store.set(f"{sys.argv[1]}-{i}", f"{sys.argv[1]}-{i}".encode(), 60)\n')
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    workers = [subprocess.Popen([sys.executable, '-c', code, str(worker)], env=env) for worker in range(4)]
+    assert [worker.wait(timeout=60) for worker in workers] == [0] * 4
+
+    store = SQLiteStore(path, 10 ** 7) if backend == 'sqlite' else FileStore(path, 10 ** 7)
+    assert all(store.get(f'{worker}-{i}') == f'{worker}-{i}'.encode() for worker in range(4) for i in range(50))
+
+def test_freeze_and_thaw_keep_only_data():
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b'{"observations": []}\nsecond line'
+    response.headers = requests.structures.CaseInsensitiveDict({'Content-Type': 'application/json'})
+    response.encoding = 'utf-8'
+
+    value = Transport.freeze(response)
+    thawed = Transport.thaw(value, 'https://api.stlouisfed.org/fred/series/observations')
+    assert (thawed.status_code, thawed.content, thawed.headers['content-type'], thawed.encoding) == (200, response.content, 'application/json', 'utf-8')
+
+    #anything that is not a json header is a miss, never deserialized into objects
+    assert Transport.thaw(b'\x80\x04\x95 pickle bytes', 'url') is None
+
+@pytest.mark.parametrize('backend, requests_made', [(None, 2), ('memory', 1)])
+def test_response_cache_is_opt_in(monkeypatch, backend, requests_made):
+    calls = []
+    def get(url, **kwargs):
+        calls.append(url)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"observations": []}'
+        return response
+
+    assert Config.response_cache is None
+    monkeypatch.setattr(Config, 'response_cache', backend)
+    monkeypatch.setattr(Transport, 'store', None)
+    monkeypatch.setattr(Transport, 'session', SimpleNamespace(get=get))
+
+    for _ in range(2):
+        Transport.get(f'{Config.fred_baseurl}series/observations', params={'series_id': 'FEDFUNDS'})
+    assert len(calls) == requests_made
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from finflux.technical import Indicators, SMA, Bollinger, EMA, RSI, InvalidParameterError, rolling_moments
+
+def closes(bars):
+    index = pd.bdate_range('2024-01-01', periods=bars)
+    return pd.DataFrame({'AAPL Close': 100 + np.sin(np.arange(bars)) + np.linspace(0, 20, bars)}, index=index)
+
+def test_shared_and_alpha_columns():
+    engine = Indicators(SMA(20), Bollinger(20, 2), EMA(alpha=0.1), EMA(12))
+    assert engine.columns == ['SMA 20', 'bollinger_upper 20', 'bollinger_lower 20', 'EMA a0.1', 'EMA 12']
+
+    history = engine.seed(closes(60))
+    assert list(history.columns) == engine.columns
+    assert list(engine.update(131.0)) == engine.columns
+
+def test_seed_and_update_agree():
+    data = closes(80)
+    seeded = Indicators(SMA(20), Bollinger(20, 2), EMA(alpha=0.1)).seed(data)
+
+    engine = Indicators(SMA(20), Bollinger(20, 2), EMA(alpha=0.1))
+    engine.seed(data.iloc[:60])
+    for close in data['AAPL Close'].iloc[60:]:
+        latest = engine.update(close)
+    assert latest == pytest.approx(seeded.iloc[-1].to_dict())
+
+@pytest.mark.parametrize('indicators', [(Bollinger(20, 2), Bollinger(20, 3)), (RSI(14), RSI(14))])
+def test_conflicting_columns_are_rejected(indicators):
+    with pytest.raises(InvalidParameterError):
+        Indicators(*indicators)
+
+@pytest.mark.parametrize('indicator', [SMA, Bollinger, RSI])
+@pytest.mark.parametrize('window', [0, -3, 2.5])
+def test_invalid_windows_are_rejected(indicator, window):
+    with pytest.raises(InvalidParameterError):
+        indicator(window)
+
+def test_one_bar_window():
+    data = closes(30)
+    engine = Indicators(SMA(1), Bollinger(1))
+    history = engine.seed(data)
+    np.testing.assert_allclose(history['SMA 1'], data['AAPL Close'])
+    assert history['bollinger_upper 1'].isna().all()
+
+    latest = engine.update(125.0)
+    assert latest['SMA 1'] == 125.0 and np.isnan(latest['bollinger_upper 1'])
+
+def test_rolling_moments_matches_pandas():
+    values = closes(50)['AAPL Close'].to_numpy()
+    values[20] = np.nan
+    moments = rolling_moments(values, [1, 5])
+    for window in (1, 5):
+        rolling = pd.Series(values).rolling(window)
+        np.testing.assert_allclose(moments[window][0], rolling.mean(), equal_nan=True)
+        np.testing.assert_allclose(moments[window][1], rolling.std(), equal_nan=True)
@@ -0,0 +1,38 @@
+import importlib
+from types import SimpleNamespace
+
+import pytest
+
+equity_module = importlib.import_module('finflux.equity')
+
+@pytest.fixture
+def metadata_requests(monkeypatch):
+    requests = []
+    class Ticker:
+        def __init__(self, ticker):
+            self.ticker = ticker
+
+        def get_history_metadata(self):
+            requests.append(self.ticker)
+            return {'instrumentType': 'ETF' if self.ticker.startswith('ETF') else 'EQUITY'}
+
+    monkeypatch.setattr(equity_module, 'yf', SimpleNamespace(Ticker=Ticker))
+    return requests
+
+@pytest.mark.parametrize('validate', ['lazy', 'none'])
+def test_lazy_and_none_make_no_requests(metadata_requests, validate):
+    equities = equity_module.equity.universe(['AAPL', 'MSFT', 'ETF1'], validate=validate)
+    assert [e.ticker for e in equities] == ['AAPL', 'MSFT', 'ETF1']
+    assert metadata_requests == []
+
+def test_eager_checks_each_symbol_once_and_reports_all(metadata_requests):
+    with pytest.raises(equity_module.InvalidSecurityError) as error:
+        equity_module.equity.universe(['AAPL', 'ETF1', 'MSFT', 'ETF2'], validate='eager', workers=4)
+    assert 'ETF1, ETF2' in error.value.msg
+    assert sorted(metadata_requests) == ['AAPL', 'ETF1', 'ETF2', 'MSFT']
+
+def test_lazy_validates_on_first_use(metadata_requests):
+    firm = equity_module.equity.universe(['ETF1'], validate='lazy')[0]
+    with pytest.raises(equity_module.InvalidSecurityError):
+        firm.validate()
+    assert metadata_requests == ['ETF1']